@@ -5,17 +5,23 @@ and starting/stopping containers. Public/private visibility controls have
 been removed.
 """
 
-import contextlib
+import hashlib
+import logging
 import os
 import shutil
-from datetime import datetime
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import docker
 from docker.errors import APIError, NotFound
 from flask import (
     Blueprint,
+    copy_current_request_context,
     current_app,
     flash,
+    make_response,
     redirect,
     render_template,
     request,
@@ -23,9 +29,10 @@ from flask import (
 )
 from flask.typing import ResponseReturnValue
 from flask_login import login_required
-from werkzeug.utils import secure_filename
+from jinja2 import Environment, Template
 
 from database import (
+    ENV_ADMIN_PASSWORD_OVERRIDE,
     delete_app,
     get_all_apps_with_real_status,
     get_app_by_id,
@@ -37,10 +44,39 @@ from database import (
 )
 from milkcrate_core.extensions import limiter
 from services.audit import log_admin_action
-from services.deploy import allowed_file, extract_zip_safely, update_application
+from services.deploy import (
+    allowed_file,
+    extract_zip_safely,
+    update_application,
+    upload_filename,
+)
 
 admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
+logger = logging.getLogger(__name__)
+
+STATUS_BADGES_TEMPLATE = "admin/status_badges_partial.html"
+
+# Runs slow Docker and filesystem cleanup off the request thread
+_cleanup_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="milkcrate-cleanup"
+)
+
+
+@lru_cache(maxsize=1)
+def get_docker_client() -> docker.DockerClient:
+    """Return a Docker client shared by admin routes.
+
+    The client holds a pooled connection to the daemon, so it is created once
+    and reused instead of calling `docker.from_env()` on every request.
+    """
+    return docker.from_env()
+
+
+def _redirect_to_dashboard() -> ResponseReturnValue:
+    """Redirect back to the admin dashboard, where flashed messages are shown."""
+    return redirect(url_for("admin.dashboard"))
+
 
 @admin_bp.route("")
 @login_required
@@ -48,15 +84,11 @@ def dashboard() -> ResponseReturnValue:
     """Render the admin dashboard with a list of deployed applications."""
     apps = get_all_apps_with_real_status()
     default_route = get_default_home_route()
-    # Detect environment override directly via process environment
-    env_override_active = bool(
-        str(os.environ.get("MILKCRATE_ADMIN_PASSWORD", "")).strip()
-    )
     return render_template(
         "admin_dashboard.html",
         apps=apps,
         default_route=default_route,
-        env_override_active=env_override_active,
+        env_override_active=ENV_ADMIN_PASSWORD_OVERRIDE,
     )
 
 
@@ -65,9 +97,9 @@ def dashboard() -> ResponseReturnValue:
 def delete_app_route(app_id: int) -> ResponseReturnValue:
     """Delete a deployed application and its resources.
 
-    Attempts to stop and remove the associated Docker container, remove the
-    built image, clean up extracted files on disk, and delete the database
-    record.
+    Marks the application as deleting and hands the slow Docker and
+    filesystem cleanup to a background worker, so the request returns
+    immediately. See `_delete_app_background` for the cleanup itself.
 
     Args:
         app_id: Identifier of the deployed application.
@@ -75,88 +107,77 @@ def delete_app_route(app_id: int) -> ResponseReturnValue:
     Returns:
         A redirect response to the admin dashboard.
     """
+    app_record = None
     try:
         app_record = get_app_by_id(app_id)
         if not app_record:
             flash("Application not found")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         # Update status to indicate deletion in progress
         update_app_status(app_id, "deleting")
 
-        client = docker.from_env()
-        container_removed = False
+        client = get_docker_client()
+
+        _cleanup_executor.submit(
+            copy_current_request_context(_delete_app_background),
+            app_id,
+            dict(app_record),
+            client,
+        )
+
+        flash(f"Deleting application {app_record['app_name']}...")
 
+    except Exception as e:
+        # Make sure to clear deleting status on error
         try:
-            # Prefer container ID, but also attempt by expected name as fallback
-            container = client.containers.get(app_record["container_id"])
+            update_app_status(app_id, "error")
+        except Exception:
+            pass
 
-            # Stop container with timeout
-            try:
-                container.stop(timeout=10)
-                flash("Container stopped successfully")
-            except APIError as e:
-                flash(f"Warning: Could not stop container gracefully: {e}")
+        # Log failed deletion
+        app_name = app_record["app_name"] if app_record else str(app_id)
+        log_admin_action(
+            action="delete",
+            resource_type="application",
+            resource_id=app_name,
+            details={"app_id": app_id},
+            success=False,
+            error_message=str(e),
+        )
 
-            # Remove container
-            try:
-                container.remove(force=True)
-                container_removed = True
-                flash("Container removed successfully")
-            except APIError as e:
-                flash(f"Warning: Could not remove container: {e}")
+        flash(f"Error deleting application: {e!s}")
 
-        except NotFound:
-            # Try removing by the conventional name if ID lookup failed
-            try:
-                fallback_name = (
-                    f"app-{(app_record['app_name'] or '').lower().replace('-', '_')}"
-                )
-                named = client.containers.get(fallback_name)
+    return _redirect_to_dashboard()
 
-                try:
-                    named.stop(timeout=10)
-                except APIError as e:
-                    flash(f"Warning: Could not stop container by name: {e}")
 
-                try:
-                    named.remove(force=True)
-                    container_removed = True
-                    flash("Container removed by name successfully")
-                except APIError as e:
-                    flash(f"Warning: Could not remove container by name: {e}")
+def _delete_app_background(
+    app_id: int, app_record: dict, client: docker.DockerClient
+) -> None:
+    """Remove an application's container, image, files, and database record.
 
-            except NotFound:
-                flash("Container not found - may have been already removed")
+    Runs on the cleanup executor with a copy of the originating request
+    context. Extracted files are removed on a separate thread while the
+    container is stopped, so the filesystem work overlaps the stop timeout.
+    Warnings are logged rather than flashed since the response has already
+    been sent; the outcome is recorded in the audit log, and a failed deletion
+    leaves the application in the "error" status.
 
-        # Attempt to remove the image associated with this app as well
-        image_removed = False
-        try:
-            image_tag = app_record["image_tag"]
-            if image_tag:
-                try:
-                    client.images.remove(image=image_tag, force=True, noprune=False)
-                    image_removed = True
-                    flash("Docker image removed successfully")
-                except APIError as e:
-                    flash(f"Warning: Could not remove image: {e}")
-        except KeyError:
-            pass
+    Args:
+        app_id: Identifier of the deployed application.
+        app_record: Snapshot of the application's database row.
+        client: Docker client to use for container and image removal.
+    """
+    try:
+        extracted_folder = current_app.config["EXTRACTED_FOLDER"]
 
-        # Clean up extracted files
-        files_cleaned = False
-        try:
-            extracted_folder = current_app.config["EXTRACTED_FOLDER"]
-
-            for item in os.listdir(extracted_folder):
-                item_path = os.path.join(extracted_folder, item)
-                if os.path.isdir(item_path) and app_record["app_name"] in item:
-                    shutil.rmtree(item_path, ignore_errors=True)
-                    files_cleaned = True
-                    flash("Application files cleaned up successfully")
-                    break
-        except Exception as cleanup_error:
-            flash(f"Warning: Could not clean up extracted files: {cleanup_error}")
+        with ThreadPoolExecutor(max_workers=1) as file_pool:
+            files_future = file_pool.submit(
+                _remove_app_files, extracted_folder, app_record
+            )
+            container_removed = _remove_app_container(client, app_record)
+            image_removed = _remove_app_image(client, app_record)
+            files_cleaned = files_future.result()
 
         # Remove database record
         delete_app(app_id)
@@ -168,9 +189,9 @@ def delete_app_route(app_id: int) -> ResponseReturnValue:
             resource_id=app_record["app_name"],
             details={
                 "app_id": app_id,
-                "container_id": app_record["container_id"] if app_record else None,
-                "image_tag": app_record["image_tag"] if app_record else None,
-                "public_route": app_record["public_route"] if app_record else None,
+                "container_id": app_record["container_id"],
+                "image_tag": app_record["image_tag"],
+                "public_route": app_record["public_route"],
                 "container_removed": container_removed,
                 "image_removed": image_removed,
                 "files_cleaned": files_cleaned,
@@ -178,35 +199,119 @@ def delete_app_route(app_id: int) -> ResponseReturnValue:
             success=True,
         )
 
-        # Summary message
-        if container_removed and image_removed and files_cleaned:
-            flash("Application deleted completely and successfully")
-        elif container_removed:
-            flash("Application deleted successfully (with some cleanup warnings)")
-        else:
-            flash(
-                "Application database record deleted (container may need manual cleanup)"
-            )
-
     except Exception as e:
-        # Make sure to clear deleting status on error
-        with contextlib.suppress(Exception):
+        logger.exception(f"Error deleting application {app_record['app_name']}")
+
+        try:
             update_app_status(app_id, "error")
+        except Exception:
+            pass
 
-        # Log failed deletion
-        app_name = app_record["app_name"] if app_record else str(app_id)
         log_admin_action(
             action="delete",
             resource_type="application",
-            resource_id=app_name,
+            resource_id=app_record["app_name"],
             details={"app_id": app_id},
             success=False,
             error_message=str(e),
         )
 
-        flash(f"Error deleting application: {e!s}")
 
-    return redirect(url_for("admin.dashboard"))
+def _remove_app_container(client: docker.DockerClient, app_record: dict) -> bool:
+    """Stop and remove an application's container.
+
+    Returns:
+        True if a container was removed.
+    """
+    try:
+        # Prefer container ID, but also attempt by expected name as fallback
+        container = client.containers.get(app_record["container_id"])
+
+        # Stop container with timeout
+        try:
+            container.stop(timeout=10)
+        except APIError as e:
+            logger.warning(f"Could not stop container gracefully: {e}")
+
+        # Remove container
+        try:
+            container.remove(force=True)
+            return True
+        except APIError as e:
+            logger.warning(f"Could not remove container: {e}")
+
+    except NotFound:
+        # Try removing by the conventional name if ID lookup failed
+        try:
+            fallback_name = (
+                f"app-{(app_record['app_name'] or '').lower().replace('-', '_')}"
+            )
+            named = client.containers.get(fallback_name)
+
+            try:
+                named.stop(timeout=10)
+            except APIError as e:
+                logger.warning(f"Could not stop container by name: {e}")
+
+            try:
+                named.remove(force=True)
+                return True
+            except APIError as e:
+                logger.warning(f"Could not remove container by name: {e}")
+
+        except NotFound:
+            logger.info("Container not found - may have been already removed")
+
+    return False
+
+
+def _remove_app_image(client: docker.DockerClient, app_record: dict) -> bool:
+    """Remove the Docker image built for an application.
+
+    Returns:
+        True if the image was removed.
+    """
+    image_tag = app_record.get("image_tag")
+    if not image_tag:
+        return False
+
+    try:
+        client.images.remove(image=image_tag, force=True, noprune=False)
+        return True
+    except APIError as e:
+        logger.warning(f"Could not remove image: {e}")
+        return False
+
+
+def _remove_app_files(extracted_folder: str, app_record: dict) -> bool:
+    """Remove an application's extracted files from disk.
+
+    Uses the extract path recorded at deploy time. Rows created before that
+    column existed fall back to scanning the extracted folder by app name.
+
+    Returns:
+        True if a directory was removed.
+    """
+    extract_path = app_record.get("extract_path")
+    if extract_path:
+        if not os.path.isdir(extract_path):
+            return False
+        shutil.rmtree(extract_path, ignore_errors=True)
+        return True
+
+    try:
+        with os.scandir(extracted_folder) as entries:
+            for entry in entries:
+                if (
+                    entry.is_dir(follow_symlinks=False)
+                    and app_record["app_name"] in entry.name
+                ):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                    return True
+    except Exception as cleanup_error:
+        logger.warning(f"Could not clean up extracted files: {cleanup_error}")
+
+    return False
 
 
 ## Public/private visibility controls have been removed.
@@ -230,14 +335,14 @@ def toggle_status_route(app_id: int) -> ResponseReturnValue:
         app_record = get_app_with_real_status(app_id)
         if not app_record:
             flash("Application not found")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
-        client = docker.from_env()
+        client = get_docker_client()
         try:
             container = client.containers.get(app_record["container_id"])
-        except docker.errors.NotFound:  # type: ignore[attr-defined]
+        except NotFound:
             flash("Container not found on host")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         # Use real-time status instead of database status
         current_status = app_record.get("real_status", "").lower()
@@ -323,20 +428,84 @@ def toggle_status_route(app_id: int) -> ResponseReturnValue:
     except Exception as e:
         flash(f"Error toggling application status: {e!s}")
 
-    return redirect(url_for("admin.dashboard"))
+    return _redirect_to_dashboard()
 
 
 @admin_bp.route("/htmx/status-badges", methods=["GET"])
 @login_required
 def get_status_badges_htmx():
-    """HTMX endpoint to get updated status badges for all applications."""
+    """HTMX endpoint to get updated status badges for all applications.
+
+    Responses carry an ETag derived from the displayed app fields. The
+    browser revalidates on each poll and gets a 304 while nothing changed,
+    so the partial is only rendered when a status actually moves.
+    """
     try:
         apps = get_all_apps_with_real_status()
-        return render_template("admin/status_badges_partial.html", apps=apps)
+        etag = _status_badges_etag(apps)
+        if etag in request.if_none_match:
+            response = current_app.response_class(status=304)
+        else:
+            context = {"apps": apps}
+            current_app.update_template_context(context)
+            html = _get_status_badges_template(current_app.jinja_env).render(context)
+            response = make_response(html)
+
+        response.set_etag(etag)
+        # Allow the browser to store the partial, but revalidate on every poll
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
     except Exception as e:
         return f'<div class="alert alert-danger">Error loading status: {e!s}</div>'
 
 
+def _status_badges_etag(apps: list[dict]) -> str:
+    """Return an ETag for the status badges partial.
+
+    Covers every app field the partial displays except the last-checked
+    timestamp. The partial also embeds CSRF tokens, so the tag rolls over at
+    half the CSRF time limit to keep the cached buttons' tokens valid.
+    """
+    fields = [
+        (
+            app["app_id"],
+            app["app_name"],
+            app.get("real_status"),
+            app.get("display_status"),
+            app.get("badge_color"),
+            app["public_route"],
+            app["internal_port"],
+            app["container_id"],
+            app["deployment_date"],
+        )
+        for app in apps
+    ]
+    csrf_time_limit = current_app.config.get("WTF_CSRF_TIME_LIMIT", 3600)
+    csrf_window = (
+        int(time.time()) // max(csrf_time_limit // 2, 1) if csrf_time_limit else 0
+    )
+    digest = hashlib.blake2b(repr((fields, csrf_window)).encode(), digest_size=16)
+    return digest.hexdigest()
+
+
+def _get_status_badges_template(jinja_env: Environment) -> Template:
+    """Return the status badges partial, resolving it once per environment.
+
+    The endpoint is polled every few seconds, so the loader lookup is skipped
+    after the first call. Templates are re-resolved on every call when
+    auto-reload is enabled so edits still show up in development.
+    """
+    if jinja_env.auto_reload:
+        return jinja_env.get_template(STATUS_BADGES_TEMPLATE)
+    return _load_status_badges_template(jinja_env)
+
+
+@lru_cache(maxsize=4)
+def _load_status_badges_template(jinja_env: Environment) -> Template:
+    """Load and cache the status badges partial for a Jinja environment."""
+    return jinja_env.get_template(STATUS_BADGES_TEMPLATE)
+
+
 @admin_bp.route("/settings/default-route", methods=["POST"])
 @login_required
 def update_default_route() -> ResponseReturnValue:
@@ -363,7 +532,7 @@ def update_default_route() -> ResponseReturnValue:
     except Exception as e:
         flash(f"Error updating default route: {e!s}")
 
-    return redirect(url_for("admin.dashboard"))
+    return _redirect_to_dashboard()
 
 
 @admin_bp.route("/settings/password", methods=["POST"])
@@ -382,14 +551,14 @@ def update_admin_password() -> ResponseReturnValue:
 
         if not new_password:
             flash("Password cannot be empty")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         if new_password != confirm_password:
             flash("Passwords do not match")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         set_admin_password(new_password)
-        if str(os.environ.get("MILKCRATE_ADMIN_PASSWORD", "")).strip():
+        if ENV_ADMIN_PASSWORD_OVERRIDE:
             flash(
                 "Password saved, but environment override is active and will be used for login"
             )
@@ -398,7 +567,7 @@ def update_admin_password() -> ResponseReturnValue:
     except Exception as e:
         flash(f"Error updating password: {e!s}")
 
-    return redirect(url_for("admin.dashboard"))
+    return _redirect_to_dashboard()
 
 
 @admin_bp.route("/update/<int:app_id>", methods=["POST"])
@@ -421,45 +590,46 @@ def update_app_route(app_id: int) -> ResponseReturnValue:
         app_record = get_app_by_id(app_id)
         if not app_record:
             flash("Application not found")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         app_name = app_record["app_name"]
 
         # Check if file was uploaded
         if "file" not in request.files:
             flash(f"No file selected for {app_name} update")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         file = request.files["file"]
         if file.filename == "":
             flash(f"No file selected for {app_name} update")
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         fname = file.filename
         if not fname or not allowed_file(fname):
             flash(
                 f"Invalid file type for {app_name} update. Only ZIP files are allowed."
             )
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         try:
-            # Save uploaded file
-            filename = secure_filename(fname)
-            filepath = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-            file.save(filepath)
+            filename = upload_filename(fname)
 
-            # Extract ZIP file
+            # Extract ZIP file straight from the upload stream
             extract_path = os.path.join(
                 current_app.config["EXTRACTED_FOLDER"],
-                f"{app_name}_update_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                f"{app_name}_update_{uuid.uuid4().hex[:12]}",
             )
 
-            if not extract_zip_safely(filepath, extract_path):
+            if not extract_zip_safely(file.stream, extract_path):
                 flash(
                     f"Invalid ZIP file for {app_name} update or missing required files"
                 )
-                os.remove(filepath)
-                return redirect(url_for("admin.dashboard"))
+                return _redirect_to_dashboard()
+
+            # Save uploaded file once it is known to be a valid archive
+            filepath = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
+            file.stream.seek(0)
+            file.save(filepath)
 
             # Perform the update
             success, result_message, _ = update_application(
@@ -467,6 +637,7 @@ def update_app_route(app_id: int) -> ResponseReturnValue:
                 extract_path,
                 filename,
                 current_app.config.get("TRAEFIK_NETWORK"),
+                app_record=app_record,
             )
 
             if success:
@@ -477,21 +648,21 @@ def update_app_route(app_id: int) -> ResponseReturnValue:
             # Clean up files on failure
             shutil.rmtree(extract_path, ignore_errors=True)
             os.remove(filepath)
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
         except Exception as e:
             flash(f"Error during {app_name} update: {e!s}")
             # Clean up files on error
             try:
-                if "filepath" in locals():
-                    os.remove(filepath)
                 if "extract_path" in locals():
                     shutil.rmtree(extract_path, ignore_errors=True)
+                if "filepath" in locals():
+                    os.remove(filepath)
             except Exception:
                 pass
-            return redirect(url_for("admin.dashboard"))
+            return _redirect_to_dashboard()
 
     except Exception as e:
         flash(f"Error updating application: {e!s}")
 
-    return redirect(url_for("admin.dashboard"))
+    return _redirect_to_dashboard()
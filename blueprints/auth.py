@@ -16,7 +16,8 @@ from flask import (
 from flask.typing import ResponseReturnValue
 from flask_login import login_required, login_user, logout_user
 
-from database import verify_admin_password
+from database import ENV_ADMIN_PASSWORD_OVERRIDE, verify_admin_password
+from milkcrate_core.extensions import limiter
 from milkcrate_core.models.user import User
 
 auth_bp = Blueprint("auth", __name__)
@@ -24,14 +25,9 @@ auth_bp = Blueprint("auth", __name__)
 
 
 @auth_bp.route("/login", methods=["GET", "POST"])
+@limiter.limit("10 per minute", methods=["POST"])  # Slow down password guessing
 def login() -> ResponseReturnValue:
     """Render login form and handle credential submission."""
-    # Detect environment override directly via process environment
-    import os as _os
-
-    env_override_active = bool(
-        str(_os.environ.get("MILKCRATE_ADMIN_PASSWORD", "")).strip()
-    )
     if request.method == "POST":
         # Password-only admin login
         submitted_password = request.form.get("password", "")
@@ -42,7 +38,9 @@ def login() -> ResponseReturnValue:
             return redirect(url_for("admin.dashboard"))
         flash("Invalid password")
 
-    return render_template("login.html", env_override_active=env_override_active)
+    return render_template(
+        "login.html", env_override_active=ENV_ADMIN_PASSWORD_OVERRIDE
+    )
 
 
 @auth_bp.route("/logout")
@@ -8,7 +8,7 @@ from flask import Blueprint, current_app, redirect, render_template, url_for
 from flask.typing import ResponseReturnValue
 from flask_login import current_user
 
-from database import get_all_apps, get_default_home_route
+from database import get_app_listing, get_default_home_route
 
 public_bp = Blueprint("public", __name__)
 
@@ -41,7 +41,7 @@ def index() -> ResponseReturnValue:
             return redirect(target)
 
     # Show all installed apps (not just public)
-    apps = get_all_apps()
+    apps = get_app_listing()
     return render_template("index.html", apps=apps)
 
 
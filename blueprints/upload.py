@@ -2,7 +2,7 @@
 
 import os
 import shutil
-from datetime import datetime
+import uuid
 
 from flask import (
     Blueprint,
@@ -15,12 +15,16 @@ from flask import (
 )
 from flask.typing import ResponseReturnValue
 from flask_login import login_required
-from werkzeug.utils import secure_filename
 
 from database import get_all_volumes, get_volume_by_id, route_exists
 from milkcrate_core.extensions import limiter
 from services.audit import log_admin_action
-from services.deploy import allowed_file, deploy_application, extract_zip_safely
+from services.deploy import (
+    allowed_file,
+    deploy_application,
+    extract_zip_safely,
+    upload_filename,
+)
 from services.validation import validate_and_sanitize_app_input
 
 upload_bp = Blueprint("upload", __name__)
@@ -73,22 +77,25 @@ def upload_app() -> ResponseReturnValue:
                     )
                     return redirect(request.url)
 
-                filename = secure_filename(fname)
+                filename = upload_filename(fname)
                 filepath = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-                file.save(filepath)
 
                 extract_path = os.path.join(
                     current_app.config["EXTRACTED_FOLDER"],
-                    f"{app_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    f"{app_name}_{uuid.uuid4().hex[:12]}",
                 )
 
-                if not extract_zip_safely(filepath, extract_path):
+                # Extract straight from the upload stream, then keep a copy of
+                # the archive only once it is known to be valid
+                if not extract_zip_safely(file.stream, extract_path):
                     flash(
                         "Invalid ZIP file. Must contain either a Dockerfile or docker-compose.yml file."
                     )
-                    os.remove(filepath)
                     return redirect(request.url)
 
+                file.stream.seek(0)
+                file.save(filepath)
+
                 # Process volume mounts
                 volume_mounts = {}
                 selected_volumes = request.form.getlist("volumes[]")
@@ -1,10 +1,15 @@
 """Volumes blueprint for managing Docker volumes and file uploads."""
 
 import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+from functools import lru_cache
 
 from flask import (
     Blueprint,
-    current_app,
     flash,
     jsonify,
     redirect,
@@ -22,7 +27,7 @@ from database import (
     get_volume_by_id,
     get_volume_by_name,
     insert_volume,
-    insert_volume_file,
+    record_volume_uploads,
     update_volume_stats,
 )
 from milkcrate_core.extensions import limiter
@@ -31,6 +36,33 @@ from services.volume_manager import get_volume_manager
 
 volumes_bp = Blueprint("volumes", __name__, url_prefix="/admin/volumes")
 
+# Upper bound on volume uploads copied into Docker at the same time
+UPLOAD_CONCURRENCY_LIMIT = int(os.environ.get("UPLOAD_CONCURRENCY_LIMIT", "4"))
+# Seconds an upload waits for a free slot before being turned away
+UPLOAD_CONCURRENCY_TIMEOUT = float(os.environ.get("UPLOAD_CONCURRENCY_TIMEOUT", "30"))
+
+_upload_slots = threading.BoundedSemaphore(UPLOAD_CONCURRENCY_LIMIT)
+
+# Volume columns exposed by the JSON API
+_VOLUME_API_FIELDS = (
+    "volume_id",
+    "volume_name",
+    "docker_volume_name",
+    "description",
+    "file_count",
+    "total_size_bytes",
+    "created_date",
+)
+
+# secure_filename is pure; retried uploads reuse the sanitized name
+_secure_filename = lru_cache(maxsize=1024)(secure_filename)
+
+# Read size for raw request bodies streamed by upload_raw_file
+RAW_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+VOLUME_NAME_MAX_LENGTH = 255
+_VOLUME_NAME_RE = re.compile(rf"[A-Za-z0-9_-]{{1,{VOLUME_NAME_MAX_LENGTH}}}")
+
 
 @volumes_bp.route("")
 @login_required
@@ -54,9 +86,10 @@ def create_volume() -> ResponseReturnValue:
             return redirect(request.url)
 
         # Validate volume name (alphanumeric, hyphens, underscores)
-        if not all(c.isalnum() or c in "-_" for c in volume_name):
+        if not _VOLUME_NAME_RE.fullmatch(volume_name):
             flash(
-                "Volume name can only contain letters, numbers, hyphens, and underscores"
+                "Volume name can only contain letters, numbers, hyphens, and "
+                f"underscores (up to {VOLUME_NAME_MAX_LENGTH} characters)"
             )
             return redirect(request.url)
 
@@ -122,19 +155,32 @@ def view_volume(volume_id: int) -> ResponseReturnValue:
             volume["docker_volume_name"]
         )
 
-        if not success:
+        # Jinja reads sqlite3.Row columns directly; only copy the row when
+        # the displayed stats have to change
+        volume_info: sqlite3.Row | dict = volume
+        if success:
+            # Refresh stored stats from the listing, writing only when they changed
+            file_count = len(files)
+            total_size = sum(entry["size"] for entry in files)
+            if (file_count, total_size) != (
+                volume["file_count"],
+                volume["total_size_bytes"],
+            ):
+                update_volume_stats(volume_id, file_count, total_size)
+                volume_info = {
+                    **dict(volume),
+                    "file_count": file_count,
+                    "total_size_bytes": total_size,
+                }
+        else:
             flash(f"Warning: Could not list files: {message}")
             files = []
 
-        # Update volume stats
-        total_size = sum(f["size"] for f in files)
-        update_volume_stats(volume_id, len(files), total_size)
-
-        return render_template("volumes/view.html", volume=dict(volume), files=files)
+        return render_template("volumes/view.html", volume=volume_info, files=files)
 
     except Exception as e:
         flash(f"Error loading volume: {e!s}")
-        return render_template("volumes/view.html", volume=dict(volume), files=[])
+        return render_template("volumes/view.html", volume=volume, files=[])
 
 
 @volumes_bp.route("/<int:volume_id>/upload", methods=["POST"])
@@ -147,84 +193,141 @@ def upload_file(volume_id: int) -> ResponseReturnValue:
         flash("Volume not found")
         return redirect(url_for("volumes.list_volumes"))
 
+    view_url = url_for("volumes.view_volume", volume_id=volume_id)
+
     if "file" not in request.files:
         flash("No file selected")
-        return redirect(url_for("volumes.view_volume", volume_id=volume_id))
+        return redirect(view_url)
 
     file = request.files["file"]
     if not file.filename:
         flash("No file selected")
-        return redirect(url_for("volumes.view_volume", volume_id=volume_id))
+        return redirect(view_url)
+
+    if not _upload_slots.acquire(timeout=UPLOAD_CONCURRENCY_TIMEOUT):
+        flash("Too many uploads in progress. Please try again shortly.")
+        return redirect(view_url)
 
     try:
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(current_app.config["UPLOAD_FOLDER"], filename)
-        file.save(filepath)
+        filename = _secure_filename(file.filename)
 
-        try:
-            volume_manager = get_volume_manager()
-            docker_volume_name = volume["docker_volume_name"]
+        # Hand Werkzeug's upload stream straight to the volume manager rather
+        # than copying it into the uploads folder first
+        volume_manager = get_volume_manager()
+        docker_volume_name = volume["docker_volume_name"]
 
-            # Check if it's a ZIP file
-            if filename.lower().endswith(".zip"):
-                success, message, file_count = volume_manager.upload_zip_to_volume(
-                    docker_volume_name, filepath
-                )
-            else:
-                success, message = volume_manager.upload_file_to_volume(
-                    docker_volume_name, filepath
-                )
-                file_count = 1 if success else 0
-
-            if success:
-                # Track uploaded file(s) in database
-                if filename.lower().endswith(".zip"):
-                    # Get updated file list
-                    _, _, files = volume_manager.list_volume_files(docker_volume_name)
-                    total_size = sum(f["size"] for f in files)
-                    update_volume_stats(volume_id, len(files), total_size)
-                else:
-                    file_size = os.path.getsize(filepath)
-                    insert_volume_file(volume_id, filename, f"/{filename}", file_size)
-                    # Update stats
-                    _, _, files = volume_manager.list_volume_files(docker_volume_name)
-                    total_size = sum(f["size"] for f in files)
-                    update_volume_stats(volume_id, len(files), total_size)
+        # Check if it's a ZIP file
+        uploaded_files: list[dict] = []
+        if filename.lower().endswith(".zip"):
+            success, message, uploaded_files = volume_manager.upload_zip_to_volume(
+                docker_volume_name, file.stream
+            )
+            file_count = len(uploaded_files)
+        else:
+            success, message = volume_manager.upload_file_to_volume(
+                docker_volume_name, file.stream, file_name=filename
+            )
+            file_count = 1 if success else 0
 
-                log_admin_action(
-                    action="upload",
-                    resource_type="volume_file",
-                    resource_id=f"{volume['volume_name']}/{filename}",
-                    details={
-                        "volume_id": volume_id,
-                        "filename": filename,
-                        "file_count": file_count,
-                    },
-                    success=True,
-                )
+        if success:
+            # Track uploaded file(s) and the new totals in one transaction
+            if not filename.lower().endswith(".zip"):
+                file_size = file.stream.seek(0, os.SEEK_END)
+                uploaded_files = [
+                    {"name": filename, "path": f"/{filename}", "size": file_size}
+                ]
+            record_volume_uploads(volume_id, uploaded_files)
 
-                flash(message)
-            else:
-                flash(f"Upload failed: {message}")
-                log_admin_action(
-                    action="upload",
-                    resource_type="volume_file",
-                    resource_id=f"{volume['volume_name']}/{filename}",
-                    details={"volume_id": volume_id, "filename": filename},
-                    success=False,
-                    error_message=message,
-                )
+            log_admin_action(
+                action="upload",
+                resource_type="volume_file",
+                resource_id=f"{volume['volume_name']}/{filename}",
+                details={
+                    "volume_id": volume_id,
+                    "filename": filename,
+                    "file_count": file_count,
+                },
+                success=True,
+            )
 
-        finally:
-            # Clean up uploaded file
-            if os.path.exists(filepath):
-                os.remove(filepath)
+            flash(message)
+        else:
+            flash(f"Upload failed: {message}")
+            log_admin_action(
+                action="upload",
+                resource_type="volume_file",
+                resource_id=f"{volume['volume_name']}/{filename}",
+                details={"volume_id": volume_id, "filename": filename},
+                success=False,
+                error_message=message,
+            )
 
-        return redirect(url_for("volumes.view_volume", volume_id=volume_id))
+        return redirect(view_url)
 
     except Exception as e:
         flash(f"Error uploading file: {e!s}")
-        return redirect(url_for("volumes.view_volume", volume_id=volume_id))
+        return redirect(view_url)
+    finally:
+        _upload_slots.release()
+
+
+@volumes_bp.route("/<int:volume_id>/raw", methods=["PUT"])
+@limiter.limit("30 per hour")
+@login_required
+def upload_raw_file(volume_id: int) -> ResponseReturnValue:
+    """Upload a single file sent as the raw request body.
+
+    Intended for scripted clients, e.g.
+    ``curl -T file.bin ".../admin/volumes/<id>/raw?filename=file.bin"``. The
+    body bypasses multipart parsing and is read from the request stream in
+    chunks, with the usual session cookie and ``X-CSRFToken`` header.
+    """
+    volume = get_volume_by_id(volume_id)
+    if not volume:
+        return jsonify({"error": "Volume not found"}), 404
+
+    filename = _secure_filename(request.args.get("filename", ""))
+    if not filename:
+        return jsonify({"error": "A filename query parameter is required"}), 400
+
+    with tempfile.TemporaryFile() as spool:
+        # Spool the body before taking an upload slot so slow clients
+        # trickling their request bodies cannot hold every slot
+        shutil.copyfileobj(request.stream, spool, RAW_UPLOAD_CHUNK_SIZE)
+        file_size = spool.tell()
+
+        if not _upload_slots.acquire(timeout=UPLOAD_CONCURRENCY_TIMEOUT):
+            return jsonify({"error": "Too many uploads in progress"}), 503
+        try:
+            success, message = get_volume_manager().upload_file_to_volume(
+                volume["docker_volume_name"], spool, file_name=filename
+            )
+        finally:
+            _upload_slots.release()
+
+    resource_id = f"{volume['volume_name']}/{filename}"
+    if not success:
+        log_admin_action(
+            action="upload",
+            resource_type="volume_file",
+            resource_id=resource_id,
+            details={"volume_id": volume_id, "filename": filename},
+            success=False,
+            error_message=message,
+        )
+        return jsonify({"error": message}), 500
+
+    record_volume_uploads(
+        volume_id, [{"name": filename, "path": f"/{filename}", "size": file_size}]
+    )
+    log_admin_action(
+        action="upload",
+        resource_type="volume_file",
+        resource_id=resource_id,
+        details={"volume_id": volume_id, "filename": filename, "file_count": 1},
+        success=True,
+    )
+    return jsonify({"message": message, "filename": filename, "size": file_size}), 201
 
 
 @volumes_bp.route("/<int:volume_id>/delete", methods=["POST"])
@@ -280,16 +383,8 @@ def api_list_volumes() -> ResponseReturnValue:
     return jsonify(
         {
             "volumes": [
-                {
-                    "volume_id": v["volume_id"],
-                    "volume_name": v["volume_name"],
-                    "docker_volume_name": v["docker_volume_name"],
-                    "description": v["description"],
-                    "file_count": v["file_count"],
-                    "total_size_bytes": v["total_size_bytes"],
-                    "created_date": v["created_date"],
-                }
-                for v in volumes
+                {field: volume[field] for field in _VOLUME_API_FIELDS}
+                for volume in volumes
             ]
         }
     )
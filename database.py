@@ -5,10 +5,17 @@ Follows the recommended Flask pattern for SQLite connections using the
 application context global `g` and teardown callbacks.
 """
 
+import hashlib
 import hmac
 import logging
 import os
+import queue
 import sqlite3
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 
 import click
 from flask import Flask, current_app, g
@@ -17,25 +24,167 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 logger = logging.getLogger(__name__)
 
+# Seconds a cached settings row stays valid; update_setting invalidates it
+SETTINGS_CACHE_TTL = 5.0
+
+# Cached setting values: {(database, key): (value, expires_at)}
+_settings_cache: dict[tuple[str, str], tuple[str | None, float]] = {}
+
+# Seconds the cached volume list stays valid; volume writers invalidate it
+VOLUMES_CACHE_TTL = 30.0
+
+# Cached volume rows per database path: {database: (rows, expires_at)}
+_volumes_cache: dict[str, tuple[list[sqlite3.Row], float]] = {}
+
+# Upper bound on per-app health checks run at once for status listings
+STATUS_PROBE_WORKERS = 16
+
+# Compiled statements kept per connection; sqlite3 keys them by SQL text, so
+# every helper's constant query is parsed once per request at most
+SQLITE_STATEMENT_CACHE_SIZE = 256
+
+# Per-connection settings: NORMAL sync is durable under WAL and halves fsyncs
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=30000",
+)
+
+# Idle connections kept per database path. LIFO hands out the most recently
+# used connection, whose page cache is warmest.
+SQLITE_POOL_SIZE = 8
+_connection_pools: dict[str, queue.LifoQueue[sqlite3.Connection]] = {}
+
+# Database paths whose schema has been checked by this process
+_migrated_databases: set[str] = set()
+
+# Recent password check results, so repeated attempts skip the slow hash check.
+# Entries are keyed by the stored hash and a keyed digest of the attempt (never
+# the plaintext), so changing the password invalidates them.
+FAILED_PASSWORD_TTL = 60.0
+VERIFIED_PASSWORD_TTL = 300.0
+PASSWORD_CHECK_CACHE_SIZE = 512
+_PASSWORD_CACHE_KEY = os.urandom(16)
+_password_check_cache: dict[tuple[str, bytes], tuple[bool, float]] = {}
+
 
 def get_db() -> sqlite3.Connection:
-    """Get database connection, creating it if it doesn't exist."""
+    """Get database connection, creating it if it doesn't exist.
+
+    Connections are borrowed from a per-database pool and handed back by
+    `close_db`, so the connect, PRAGMA and migration work runs once per
+    pooled connection instead of once per request.
+    """
     if "db" not in g:
-        g.db = sqlite3.connect(
-            current_app.config["DATABASE"], detect_types=sqlite3.PARSE_DECLTYPES
-        )
-        g.db.row_factory = sqlite3.Row
-        _migrate_schema_if_needed(g.db)
+        database = current_app.config["DATABASE"]
+        try:
+            g.db = _connection_pools[database].get_nowait()
+        except (KeyError, queue.Empty):
+            g.db = _connect(database)
 
     return g.db
 
 
+def _connect(database: str) -> sqlite3.Connection:
+    """Open and configure a new connection to `database`."""
+    # Pooled connections move between request threads; each is only ever
+    # used by one request at a time
+    db = sqlite3.connect(
+        database,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+    )
+    db.row_factory = sqlite3.Row
+    _configure_connection(db, database)
+    _migrate_schema_if_needed(db, database)
+    return db
+
+
+def _configure_connection(db: sqlite3.Connection, database: str) -> None:
+    """Apply journal and performance PRAGMAs to a new connection.
+
+    WAL lets readers proceed while a write is in progress. It is skipped for
+    in-memory databases, which cannot use it.
+
+    Args:
+        db: The freshly opened connection
+        database: The path the connection was opened with
+    """
+    if database != ":memory:":
+        db.execute("PRAGMA journal_mode=WAL")
+    for pragma in _CONNECTION_PRAGMAS:
+        db.execute(pragma)
+
+
 def close_db(_e: BaseException | None = None) -> None:
-    """Close database connection if it exists."""
+    """Return the request's database connection to the pool, if it has one."""
     db = g.pop("db", None)
 
     if db is not None:
+        _release_connection(db, current_app.config["DATABASE"])
+
+
+def _release_connection(db: sqlite3.Connection, database: str) -> None:
+    """Reset a connection and put it back in the pool, or close it.
+
+    Uncommitted work is rolled back. In-memory databases are never pooled,
+    and connections beyond `SQLITE_POOL_SIZE` are closed.
+    """
+    # Lets SQLite refresh query planner statistics when they are stale;
+    # usually a no-op
+    try:
+        db.execute("PRAGMA optimize")
+        if db.in_transaction:
+            db.rollback()
+    except sqlite3.Error:
+        logger.debug("Resetting database connection failed", exc_info=True)
         db.close()
+        return
+
+    if database != ":memory:":
+        pool = _connection_pools.setdefault(
+            database, queue.LifoQueue(maxsize=SQLITE_POOL_SIZE)
+        )
+        try:
+            pool.put_nowait(db)
+            return
+        except queue.Full:
+            pass
+    db.close()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Group several write helpers into a single transaction.
+
+    Helpers called inside the block skip their own commit; the outermost
+    block commits once on success and rolls back if it raises.
+
+    Yields:
+        The request's database connection
+    """
+    db = get_db()
+    depth = g.get("db_transaction_depth", 0)
+    g.db_transaction_depth = depth + 1
+    try:
+        yield db
+        if depth == 0:
+            db.commit()
+    except BaseException:
+        if depth == 0:
+            db.rollback()
+        raise
+    finally:
+        g.db_transaction_depth = depth
+
+
+def _commit(db: sqlite3.Connection) -> None:
+    """Commit, unless an enclosing `transaction()` block will commit later."""
+    if not g.get("db_transaction_depth"):
+        db.commit()
 
 
 def init_db() -> None:
@@ -47,8 +196,24 @@ def init_db() -> None:
     package_dir = os.path.dirname(current_app.root_path)
     schema_path = os.path.join(package_dir, "schema.sql")
 
+    db.executescript(_load_schema(schema_path))
+
+    invalidate_settings_cache()
+    invalidate_volumes_cache()
+
+
+@lru_cache(maxsize=4)
+def _load_schema(schema_path: str) -> str:
+    """Read and cache the contents of schema.sql.
+
+    Args:
+        schema_path: Absolute path to the schema file
+
+    Returns:
+        The SQL script
+    """
     with open(schema_path, encoding="utf8") as f:
-        db.executescript(f.read())
+        return f.read()
 
 
 @click.command("init-db")
@@ -89,6 +254,19 @@ def get_all_apps() -> list[sqlite3.Row]:
     ).fetchall()
 
 
+def get_app_listing() -> list[sqlite3.Row]:
+    """Get the fields shown on the public app listing, newest first.
+
+    Only the name, route and deployment date are selected, so the wider
+    container and compose columns are never read for the home page.
+    """
+    db = get_db()
+    return db.execute(
+        """SELECT app_name, public_route, deployment_date FROM deployed_apps
+           ORDER BY deployment_date DESC"""
+    ).fetchall()
+
+
 def get_public_apps() -> list[sqlite3.Row]:
     """Get all public deployed applications."""
     db = get_db()
@@ -108,13 +286,14 @@ def insert_app(
     compose_file: str | None = None,
     main_service: str | None = None,
     volume_mounts: str | None = None,
+    extract_path: str | None = None,
 ) -> None:
     """Insert a new deployed application."""
     db = get_db()
     db.execute(
         """INSERT INTO deployed_apps
-           (app_name, container_id, image_tag, public_route, internal_port, is_public, status, deployment_date, deployment_type, compose_file, main_service, volume_mounts)
-           VALUES (?, ?, ?, ?, ?, ?, 'running', datetime('now'), ?, ?, ?, ?)""",
+           (app_name, container_id, image_tag, public_route, internal_port, is_public, status, deployment_date, deployment_type, compose_file, main_service, volume_mounts, extract_path)
+           VALUES (?, ?, ?, ?, ?, ?, 'running', datetime('now'), ?, ?, ?, ?, ?)""",
         (
             app_name,
             container_id,
@@ -126,53 +305,48 @@ def insert_app(
             compose_file,
             main_service,
             volume_mounts,
+            extract_path,
         ),
     )
-    db.commit()
+    _commit(db)
 
 
 def delete_app(app_id: int) -> None:
     """Delete a deployed application by ID."""
     db = get_db()
     db.execute("DELETE FROM deployed_apps WHERE app_id = ?", (app_id,))
-    db.commit()
+    _commit(db)
 
 
 def update_app_status(app_id: int, status: str) -> None:
     """Update the status of a deployed application."""
     db = get_db()
     db.execute("UPDATE deployed_apps SET status = ? WHERE app_id = ?", (status, app_id))
-    db.commit()
+    _commit(db)
 
 
 def _apply_fallback_status(app_dict: dict) -> None:
     """Apply basic fallback status fields when enhanced status is unavailable."""
     status = app_dict.get("status", "")
-    app_dict.update(
-        {
-            "real_status": status,
-            "display_status": status.title() if status else "Unknown",
-            "badge_color": "success" if status == "running" else "secondary",
-            "status_details": {},
-            "last_status_check": "Status checking unavailable",
-        }
-    )
+    app_dict["real_status"] = status
+    app_dict["display_status"] = status.title() if status else "Unknown"
+    app_dict["badge_color"] = "success" if status == "running" else "secondary"
+    app_dict["status_details"] = {}
+    app_dict["last_status_check"] = "Status checking unavailable"
 
 
 def _apply_enhanced_status(app_dict: dict, status_info: dict) -> None:
     """Apply enhanced status fields from the status manager."""
-    app_dict.update(
-        {
-            "real_status": status_info["status"],
-            "display_status": status_info["display_status"],
-            "badge_color": status_info["badge_color"],
-            "status_details": status_info,
-            "last_status_check": status_info["last_checked"],
-        }
-    )
+    app_dict["real_status"] = status_info["status"]
+    app_dict["display_status"] = status_info["display_status"]
+    app_dict["badge_color"] = status_info["badge_color"]
+    app_dict["status_details"] = status_info
+    app_dict["last_status_check"] = status_info["last_checked"]
 
 
-def _enhance_app_status(app_dict: dict) -> None:
+def _enhance_app_status(
+    app_dict: dict, container_statuses: dict[str, tuple[str, dict]] | None = None
+) -> None:
     """Try to enhance an app dict with real-time Docker status, falling back to basic."""
     try:
         from services.status_manager import get_status_manager  # noqa: PLC0415
@@ -183,6 +357,7 @@ def _enhance_app_status(app_dict: dict) -> None:
             app_name=app_dict["app_name"],
             public_route=app_dict["public_route"],
             internal_port=app_dict["internal_port"],
+            container_statuses=container_statuses,
         )
         _apply_enhanced_status(app_dict, status_info)
     except Exception:
@@ -201,14 +376,36 @@ def get_app_with_real_status(app_id: int) -> dict | None:
 
 
 def get_all_apps_with_real_status() -> list[dict]:
-    """Get all applications with real-time Docker status checks."""
+    """Get all applications with real-time Docker status checks.
+
+    Container states for all apps are fetched with a single Docker list call
+    and joined against the database rows, instead of one lookup per app.
+    Per-app health checks run in parallel. Apps in the "deleting" status are
+    omitted.
+    """
     apps = get_all_apps()
-    enhanced_apps = []
+    if not apps:
+        return []
+
+    try:
+        from services.status_manager import get_status_manager  # noqa: PLC0415
+
+        container_statuses = get_status_manager().get_container_statuses()
+    except Exception:
+        container_statuses = None
+
+    # Apps being deleted in the background are hidden from listings
+    enhanced_apps = [dict(app) for app in apps if app["status"] != "deleting"]
+    if not enhanced_apps:
+        return []
 
-    for app in apps:
-        app_dict = dict(app)
-        _enhance_app_status(app_dict)
-        enhanced_apps.append(app_dict)
+    # Health checks are HTTP round trips per running app; run them concurrently
+    with ThreadPoolExecutor(
+        max_workers=min(STATUS_PROBE_WORKERS, len(enhanced_apps)),
+        thread_name_prefix="milkcrate-status",
+    ) as executor:
+        for app_dict in enhanced_apps:
+            executor.submit(_enhance_app_status, app_dict, container_statuses)
 
     return enhanced_apps
 
@@ -220,15 +417,24 @@ def set_app_public(app_id: int, is_public: bool) -> None:
         "UPDATE deployed_apps SET is_public = ? WHERE app_id = ?",
         (1 if is_public else 0, app_id),
     )
-    db.commit()
+    _commit(db)
 
 
-def _migrate_schema_if_needed(db: sqlite3.Connection) -> None:
+def _migrate_schema_if_needed(db: sqlite3.Connection, database: str) -> None:
     """Ensure the database schema has required columns, performing lightweight migrations.
 
     This function is idempotent and safe to run on each connection creation.
     If the database is empty, it will initialize it with the full schema.
+    Incremental migrations run in one transaction, and a database that has
+    been checked is skipped for the rest of the process.
+
+    Args:
+        db: The freshly opened connection
+        database: The path the connection was opened with
     """
+    if database in _migrated_databases:
+        return
+
     try:
         # Check if deployed_apps table exists
         cursor = db.execute(
@@ -243,112 +449,152 @@ def _migrate_schema_if_needed(db: sqlite3.Connection) -> None:
             schema_path = os.path.join(package_dir, "schema.sql")
 
             if os.path.exists(schema_path):
-                with open(schema_path, encoding="utf8") as f:
-                    db.executescript(f.read())
+                db.executescript(_load_schema(schema_path))
                 db.commit()
+                _mark_migrated(database)
                 return
 
-        # Table exists, perform incremental migrations
-        cursor = db.execute("PRAGMA table_info(deployed_apps)")
-        columns = [row[1] for row in cursor.fetchall()]
+        # Table exists, perform incremental migrations. DDL does not open an
+        # implicit transaction, so take the write lock explicitly and commit once.
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            _apply_incremental_migrations(db)
+        except sqlite3.Error:
+            db.rollback()
+            raise
+        db.commit()
+        _mark_migrated(database)
+    except sqlite3.Error:
+        # If migration fails, we don't want to crash app startup; leave as-is
+        logger.warning("Database schema migration failed", exc_info=True)
 
-        if "is_public" not in columns:
-            db.execute(
-                "ALTER TABLE deployed_apps ADD COLUMN is_public INTEGER NOT NULL DEFAULT 0"
-            )
-            db.commit()
 
-        # Add new docker-compose support columns
-        if "deployment_type" not in columns:
-            db.execute(
-                "ALTER TABLE deployed_apps ADD COLUMN deployment_type TEXT NOT NULL DEFAULT 'dockerfile'"
-            )
-            db.commit()
+def _mark_migrated(database: str) -> None:
+    """Remember that `database` is up to date; in-memory databases never are."""
+    if database != ":memory:":
+        _migrated_databases.add(database)
 
-        if "compose_file" not in columns:
-            db.execute("ALTER TABLE deployed_apps ADD COLUMN compose_file TEXT")
-            db.commit()
 
-        if "main_service" not in columns:
-            db.execute("ALTER TABLE deployed_apps ADD COLUMN main_service TEXT")
-            db.commit()
+def _apply_incremental_migrations(db: sqlite3.Connection) -> None:
+    """Add columns, indexes and tables missing from older databases.
 
-        if "volume_mounts" not in columns:
-            db.execute("ALTER TABLE deployed_apps ADD COLUMN volume_mounts TEXT")
-            db.commit()
+    Runs inside the caller's transaction and must not commit.
+    """
+    cursor = db.execute("PRAGMA table_info(deployed_apps)")
+    columns = [row[1] for row in cursor.fetchall()]
 
-        # Ensure public_route index exists (may be missing on older databases)
+    if "is_public" not in columns:
         db.execute(
-            "CREATE INDEX IF NOT EXISTS idx_public_route ON deployed_apps(public_route)"
+            "ALTER TABLE deployed_apps ADD COLUMN is_public INTEGER NOT NULL DEFAULT 0"
         )
-        db.commit()
 
-        # Check if settings table exists, create if not
-        cursor = db.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='settings'"
+    # Add new docker-compose support columns
+    if "deployment_type" not in columns:
+        db.execute(
+            "ALTER TABLE deployed_apps ADD COLUMN deployment_type TEXT NOT NULL DEFAULT 'dockerfile'"
         )
-        if not cursor.fetchone():
-            db.execute("""
-                CREATE TABLE settings (
-                    setting_key TEXT PRIMARY KEY,
-                    setting_value TEXT,
-                    updated_date TEXT NOT NULL DEFAULT (datetime('now'))
-                )
-            """)
-            db.execute(
-                "INSERT OR IGNORE INTO settings (setting_key, setting_value) VALUES ('default_home_route', '')"
+
+    if "compose_file" not in columns:
+        db.execute("ALTER TABLE deployed_apps ADD COLUMN compose_file TEXT")
+
+    if "main_service" not in columns:
+        db.execute("ALTER TABLE deployed_apps ADD COLUMN main_service TEXT")
+
+    if "volume_mounts" not in columns:
+        db.execute("ALTER TABLE deployed_apps ADD COLUMN volume_mounts TEXT")
+
+    if "extract_path" not in columns:
+        db.execute("ALTER TABLE deployed_apps ADD COLUMN extract_path TEXT")
+
+    # Ensure public_route index exists (may be missing on older databases)
+    db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_public_route ON deployed_apps(public_route)"
+    )
+
+    # Indexes backing the newest-first app listings
+    db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_deploy_date ON deployed_apps(deployment_date DESC)"
+    )
+    # The public listing only reads public rows; a partial index skips the rest
+    db.execute(
+        "CREATE INDEX IF NOT EXISTS idx_public_only ON deployed_apps(deployment_date DESC) WHERE is_public = 1"
+    )
+
+    # Check if settings table exists, create if not
+    cursor = db.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='settings'"
+    )
+    if not cursor.fetchone():
+        db.execute("""
+            CREATE TABLE settings (
+                setting_key TEXT PRIMARY KEY,
+                setting_value TEXT,
+                updated_date TEXT NOT NULL DEFAULT (datetime('now'))
             )
-            db.commit()
+        """)
+        db.execute(
+            "INSERT OR IGNORE INTO settings (setting_key, setting_value) VALUES ('default_home_route', '')"
+        )
 
-        # Check if volumes table exists, create if not
-        cursor = db.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='volumes'"
+    # Check if volumes table exists, create if not. executescript() would
+    # commit early, so each statement runs separately.
+    cursor = db.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name='volumes'"
+    )
+    if not cursor.fetchone():
+        db.execute("""
+            CREATE TABLE volumes (
+                volume_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                volume_name TEXT NOT NULL UNIQUE,
+                docker_volume_name TEXT NOT NULL UNIQUE,
+                description TEXT,
+                created_date TEXT NOT NULL DEFAULT (datetime('now')),
+                file_count INTEGER NOT NULL DEFAULT 0,
+                total_size_bytes INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        db.execute("CREATE INDEX IF NOT EXISTS idx_volume_name ON volumes(volume_name)")
+        db.execute("""
+            CREATE TABLE volume_files (
+                file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                volume_id INTEGER NOT NULL,
+                file_name TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                file_size_bytes INTEGER NOT NULL,
+                uploaded_date TEXT NOT NULL DEFAULT (datetime('now')),
+                FOREIGN KEY (volume_id) REFERENCES volumes(volume_id) ON DELETE CASCADE
+            )
+        """)
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_volume_files_volume_id ON volume_files(volume_id)"
         )
-        if not cursor.fetchone():
-            db.executescript("""
-                CREATE TABLE volumes (
-                    volume_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    volume_name TEXT NOT NULL UNIQUE,
-                    docker_volume_name TEXT NOT NULL UNIQUE,
-                    description TEXT,
-                    created_date TEXT NOT NULL DEFAULT (datetime('now')),
-                    file_count INTEGER NOT NULL DEFAULT 0,
-                    total_size_bytes INTEGER NOT NULL DEFAULT 0
-                );
-                CREATE INDEX IF NOT EXISTS idx_volume_name ON volumes(volume_name);
-
-                CREATE TABLE volume_files (
-                    file_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    volume_id INTEGER NOT NULL,
-                    file_name TEXT NOT NULL,
-                    file_path TEXT NOT NULL,
-                    file_size_bytes INTEGER NOT NULL,
-                    uploaded_date TEXT NOT NULL DEFAULT (datetime('now')),
-                    FOREIGN KEY (volume_id) REFERENCES volumes(volume_id) ON DELETE CASCADE
-                );
-                CREATE INDEX IF NOT EXISTS idx_volume_files_volume_id ON volume_files(volume_id);
-            """)
-            db.commit()
-    except sqlite3.Error:
-        # If migration fails, we don't want to crash app startup; leave as-is
-        logger.warning("Database schema migration failed", exc_info=True)
 
 
 def get_setting(key: str) -> str | None:
     """Get a setting value from the database.
 
+    Values are cached in-process for `SETTINGS_CACHE_TTL` seconds.
+
     Args:
         key: The setting key to retrieve.
 
     Returns:
         The setting value if found, None otherwise.
     """
+    cache_key = (current_app.config["DATABASE"], key)
+    cached = _settings_cache.get(cache_key)
+    now = time.monotonic()
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
     db = get_db()
     cursor = db.execute(
         "SELECT setting_value FROM settings WHERE setting_key = ?", (key,)
     )
     row = cursor.fetchone()
-    return row[0] if row else None
+    value = row[0] if row else None
+    _settings_cache[cache_key] = (value, now + SETTINGS_CACHE_TTL)
+    return value
 
 
 def update_setting(key: str, value: str) -> None:
@@ -360,15 +606,30 @@ def update_setting(key: str, value: str) -> None:
     """
     db = get_db()
     db.execute(
-        "INSERT OR REPLACE INTO settings (setting_key, setting_value, updated_date) VALUES (?, ?, datetime('now'))",
+        """INSERT INTO settings (setting_key, setting_value, updated_date)
+           VALUES (?, ?, datetime('now'))
+           ON CONFLICT(setting_key) DO UPDATE SET
+               setting_value = excluded.setting_value,
+               updated_date = excluded.updated_date""",
         (key, value),
     )
-    db.commit()
+    _commit(db)
+    _settings_cache.pop((current_app.config["DATABASE"], key), None)
+
+
+def invalidate_settings_cache() -> None:
+    """Drop all cached settings for the current database."""
+    database = current_app.config["DATABASE"]
+    for cache_key in [k for k in _settings_cache if k[0] == database]:
+        del _settings_cache[cache_key]
 
 
 def get_default_home_route() -> str:
     """Get the configured default home route.
 
+    The value is read on every unauthenticated hit to '/'; `get_setting`
+    caches it in-process for `SETTINGS_CACHE_TTL` seconds.
+
     Returns:
         The default home route path, or empty string if not configured.
     """
@@ -384,6 +645,16 @@ def set_default_home_route(route: str) -> None:
     update_setting("default_home_route", route)
 
 
+# MILKCRATE_ADMIN_PASSWORD and whether it overrides the stored password. The
+# process environment does not change at runtime, so both are read at import.
+_ENV_ADMIN_PASSWORD = os.environ.get("MILKCRATE_ADMIN_PASSWORD", "")
+ENV_ADMIN_PASSWORD_OVERRIDE = bool(_ENV_ADMIN_PASSWORD.strip())
+
+# Werkzeug hash method for passwords set from the UI, e.g. "pbkdf2:sha256:120000"
+# to trade KDF strength for a faster settings save on small hosts
+PASSWORD_HASH_METHOD = os.environ.get("MILKCRATE_PASSWORD_HASH_METHOD", "scrypt")
+
+
 def get_admin_password() -> str:
     """Return the effective admin password.
 
@@ -393,9 +664,8 @@ def get_admin_password() -> str:
     3. Default fallback "admin"
     """
     # Highest priority: environment override
-    env_override = os.environ.get("MILKCRATE_ADMIN_PASSWORD", "")
-    if str(env_override).strip():
-        return str(env_override)
+    if ENV_ADMIN_PASSWORD_OVERRIDE:
+        return _ENV_ADMIN_PASSWORD
 
     # UI-configured password stored in DB
     db_value = get_setting("admin_password")
@@ -412,7 +682,7 @@ def set_admin_password(new_password: str) -> None:
     Note: If MILKCRATE_ADMIN_PASSWORD is set, that will still override the
     stored value during authentication.
     """
-    hashed_password = generate_password_hash(new_password)
+    hashed_password = generate_password_hash(new_password, method=PASSWORD_HASH_METHOD)
     update_setting("admin_password", hashed_password)
 
 
@@ -423,9 +693,8 @@ def verify_admin_password(provided_password: str) -> bool:
     Environment overrides are always treated as plain text.
     """
     # Highest priority: environment override (always plain text)
-    env_override = os.environ.get("MILKCRATE_ADMIN_PASSWORD", "")
-    if str(env_override).strip():
-        return hmac.compare_digest(provided_password, str(env_override))
+    if ENV_ADMIN_PASSWORD_OVERRIDE:
+        return hmac.compare_digest(provided_password, _ENV_ADMIN_PASSWORD)
 
     # Check database stored password (may be hashed or plain text)
     db_value = get_setting("admin_password")
@@ -433,7 +702,7 @@ def verify_admin_password(provided_password: str) -> bool:
         stored_password = str(db_value)
         # Check if it's a hashed password (Werkzeug hashes start with method)
         if stored_password.startswith(("pbkdf2:", "scrypt:", "argon2:")):
-            return check_password_hash(stored_password, provided_password)
+            return _check_hashed_password(stored_password, provided_password)
         # Plain text password
         return hmac.compare_digest(provided_password, stored_password)
 
@@ -441,6 +710,31 @@ def verify_admin_password(provided_password: str) -> bool:
     return hmac.compare_digest(provided_password, "admin")
 
 
+def _check_hashed_password(stored_password: str, provided_password: str) -> bool:
+    """Check a password against a Werkzeug hash, remembering recent results.
+
+    A guess that failed within the last `FAILED_PASSWORD_TTL` seconds, or the
+    correct password within the last `VERIFIED_PASSWORD_TTL` seconds, is
+    answered without running the deliberately slow hash again.
+    """
+    digest = hashlib.blake2b(
+        provided_password.encode(), digest_size=16, key=_PASSWORD_CACHE_KEY
+    ).digest()
+    cache_key = (stored_password, digest)
+    now = time.monotonic()
+    cached = _password_check_cache.get(cache_key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    is_valid = check_password_hash(stored_password, provided_password)
+    ttl = VERIFIED_PASSWORD_TTL if is_valid else FAILED_PASSWORD_TTL
+
+    if len(_password_check_cache) >= PASSWORD_CHECK_CACHE_SIZE:
+        _password_check_cache.clear()
+    _password_check_cache[cache_key] = (is_valid, now + ttl)
+    return is_valid
+
+
 def get_app_by_route(public_route: str) -> sqlite3.Row | None:
     """Get application details by public route.
 
@@ -465,7 +759,11 @@ def route_exists(public_route: str) -> bool:
     Returns:
         True if the route exists, False otherwise.
     """
-    return get_app_by_route(public_route) is not None
+    db = get_db()
+    row = db.execute(
+        "SELECT 1 FROM deployed_apps WHERE public_route = ? LIMIT 1", (public_route,)
+    ).fetchone()
+    return row is not None
 
 
 def update_app_container_info(
@@ -475,6 +773,7 @@ def update_app_container_info(
     deployment_type: str | None = None,
     compose_file: str | None = None,
     main_service: str | None = None,
+    extract_path: str | None = None,
 ) -> None:
     """Update application container information after an update.
 
@@ -485,6 +784,8 @@ def update_app_container_info(
         deployment_type: Deployment type (optional).
         compose_file: Path to compose file (optional).
         main_service: Main service name (optional).
+        extract_path: Directory the new version was extracted to (optional;
+            the stored path is kept when omitted).
     """
     db = get_db()
 
@@ -492,7 +793,8 @@ def update_app_container_info(
         db.execute(
             """UPDATE deployed_apps
                SET container_id = ?, image_tag = ?, deployment_date = datetime('now'), status = 'running',
-                   deployment_type = ?, compose_file = ?, main_service = ?
+                   deployment_type = ?, compose_file = ?, main_service = ?,
+                   extract_path = COALESCE(?, extract_path)
                WHERE app_id = ?""",
             (
                 container_id,
@@ -500,17 +802,19 @@ def update_app_container_info(
                 deployment_type,
                 compose_file,
                 main_service,
+                extract_path,
                 app_id,
             ),
         )
     else:
         db.execute(
             """UPDATE deployed_apps
-               SET container_id = ?, image_tag = ?, deployment_date = datetime('now'), status = 'running'
+               SET container_id = ?, image_tag = ?, deployment_date = datetime('now'), status = 'running',
+                   extract_path = COALESCE(?, extract_path)
                WHERE app_id = ?""",
-            (container_id, image_tag, app_id),
+            (container_id, image_tag, extract_path, app_id),
         )
-    db.commit()
+    _commit(db)
 
 
 # Volume management functions
@@ -537,7 +841,8 @@ def insert_volume(
            VALUES (?, ?, ?)""",
         (volume_name, docker_volume_name, description),
     )
-    db.commit()
+    _commit(db)
+    invalidate_volumes_cache()
     rowid = cursor.lastrowid
     assert rowid is not None, "INSERT must return rowid"
     return rowid
@@ -546,11 +851,28 @@ def insert_volume(
 def get_all_volumes() -> list[sqlite3.Row]:
     """Get all volumes.
 
+    The list is cached in-process for `VOLUMES_CACHE_TTL` seconds; functions
+    that write to the volumes table invalidate it.
+
     Returns:
         List of all volume records
     """
+    cache_key = current_app.config["DATABASE"]
+    cached = _volumes_cache.get(cache_key)
+    now = time.monotonic()
+    if cached is not None and cached[1] > now:
+        return list(cached[0])
+
     db = get_db()
-    return db.execute("SELECT * FROM volumes ORDER BY created_date DESC").fetchall()
+    volumes = db.execute("SELECT * FROM volumes ORDER BY created_date DESC").fetchall()
+    _volumes_cache[cache_key] = (volumes, now + VOLUMES_CACHE_TTL)
+    return list(volumes)
+
+
+def invalidate_volumes_cache() -> None:
+    """Drop cached volume rows: the shared list and this context's lookups."""
+    _volumes_cache.pop(current_app.config["DATABASE"], None)
+    g.pop("volumes_by_id", None)
 
 
 def get_volume_by_id(volume_id: int) -> sqlite3.Row | None:
@@ -559,13 +881,19 @@ def get_volume_by_id(volume_id: int) -> sqlite3.Row | None:
     Args:
         volume_id: The volume ID
 
+    Lookups are memoized on `g` for the rest of the app context; the volume
+    write helpers clear the memo.
+
     Returns:
         Volume record or None if not found
     """
-    db = get_db()
-    return db.execute(
-        "SELECT * FROM volumes WHERE volume_id = ?", (volume_id,)
-    ).fetchone()
+    volumes_by_id = g.setdefault("volumes_by_id", {})
+    if volume_id not in volumes_by_id:
+        db = get_db()
+        volumes_by_id[volume_id] = db.execute(
+            "SELECT * FROM volumes WHERE volume_id = ?", (volume_id,)
+        ).fetchone()
+    return volumes_by_id[volume_id]
 
 
 def get_volume_by_name(volume_name: str) -> sqlite3.Row | None:
@@ -606,7 +934,8 @@ def delete_volume(volume_id: int) -> None:
     """
     db = get_db()
     db.execute("DELETE FROM volumes WHERE volume_id = ?", (volume_id,))
-    db.commit()
+    _commit(db)
+    invalidate_volumes_cache()
 
 
 def update_volume_stats(volume_id: int, file_count: int, total_size_bytes: int) -> None:
@@ -623,7 +952,32 @@ def update_volume_stats(volume_id: int, file_count: int, total_size_bytes: int)
            WHERE volume_id = ?""",
         (file_count, total_size_bytes, volume_id),
     )
-    db.commit()
+    _commit(db)
+    invalidate_volumes_cache()
+
+
+def update_volume_stats_delta(
+    volume_id: int, file_count_delta: int, size_delta: int
+) -> None:
+    """Adjust volume statistics by the given amounts.
+
+    Viewing a volume recomputes exact statistics from its contents, which
+    corrects any drift.
+
+    Args:
+        volume_id: The volume ID
+        file_count_delta: Change in the number of files
+        size_delta: Change in total size in bytes
+    """
+    db = get_db()
+    db.execute(
+        """UPDATE volumes SET file_count = file_count + ?,
+           total_size_bytes = total_size_bytes + ?
+           WHERE volume_id = ?""",
+        (file_count_delta, size_delta, volume_id),
+    )
+    _commit(db)
+    invalidate_volumes_cache()
 
 
 def insert_volume_file(
@@ -643,7 +997,59 @@ def insert_volume_file(
            VALUES (?, ?, ?, ?)""",
         (volume_id, file_name, file_path, file_size_bytes),
     )
-    db.commit()
+    _commit(db)
+
+
+def insert_volume_files_bulk(volume_id: int, files: list[dict]) -> None:
+    """Insert volume file records for many files in one transaction.
+
+    Args:
+        volume_id: The volume ID
+        files: File entries with "name", "path" and "size" keys, as returned
+            by the volume manager
+    """
+    with transaction() as db:
+        db.executemany(
+            """INSERT INTO volume_files (volume_id, file_name, file_path, file_size_bytes)
+               VALUES (?, ?, ?, ?)""",
+            ((volume_id, f["name"], f["path"], f["size"]) for f in files),
+        )
+
+
+def record_volume_uploads(volume_id: int, files: list[dict]) -> None:
+    """Record uploaded files and adjust the volume statistics to match.
+
+    A file uploaded over an existing path replaces that path's record: the
+    file count is unchanged and the total size moves by the difference, so
+    the statistics do not drift between recomputations.
+
+    Args:
+        volume_id: The volume ID
+        files: File entries with "name", "path" and "size" keys, as returned
+            by the volume manager
+    """
+    # Later entries for the same path win, as they do on disk
+    uploaded = {f["path"]: f for f in files}
+    with transaction() as db:
+        existing = {
+            row["file_path"]: row["file_size_bytes"]
+            for row in db.execute(
+                "SELECT file_path, file_size_bytes FROM volume_files WHERE volume_id = ?",
+                (volume_id,),
+            )
+        }
+        replaced = [path for path in uploaded if path in existing]
+        db.executemany(
+            "DELETE FROM volume_files WHERE volume_id = ? AND file_path = ?",
+            ((volume_id, path) for path in replaced),
+        )
+        insert_volume_files_bulk(volume_id, list(uploaded.values()))
+        update_volume_stats_delta(
+            volume_id,
+            len(uploaded) - len(replaced),
+            sum(f["size"] for f in uploaded.values())
+            - sum(existing[path] for path in replaced),
+        )
 
 
 def get_volume_files(volume_id: int) -> list[sqlite3.Row]:
@@ -6,6 +6,7 @@ Exposes the `create_app` factory used by both the CLI entrypoint and tests.
 import os
 
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 from blueprints import admin_bp, auth_bp, public_bp, upload_bp
@@ -54,6 +55,8 @@ def create_app(test_config: dict | None = None) -> Flask:
     # Ensure instance folder exists
     os.makedirs(app.instance_path, exist_ok=True)
 
+    _configure_template_cache(app)
+
     # Extensions
     init_db(app)
     login_manager.init_app(app)
@@ -81,3 +84,21 @@ def create_app(test_config: dict | None = None) -> Flask:
     register_error_handlers(app)
 
     return app
+
+
+def _configure_template_cache(app: Flask) -> None:
+    """Persist compiled Jinja bytecode when `TEMPLATE_BYTECODE_CACHE` is set.
+
+    The cache lives in `jinja_cache` next to the SQLite database, i.e. in the
+    instance folder.
+
+    Args:
+        app: The application being configured.
+    """
+    if not app.config.get("TEMPLATE_BYTECODE_CACHE"):
+        return
+    cache_dir = os.path.join(
+        os.path.dirname(os.path.abspath(app.config["DATABASE"])), "jinja_cache"
+    )
+    os.makedirs(cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
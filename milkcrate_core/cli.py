@@ -15,20 +15,56 @@ Key features:
 Supports both Dockerfile and docker-compose.yml based applications.
 """
 
+import fnmatch
 import os
+import re
 import shutil
+import socket
 import subprocess
 import sys
-import zipfile
+from collections import deque
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-import docker
+
+from services.cleanup import remove_paths
+
+if TYPE_CHECKING:
+    import zipfile
 
 
 def find_project_root() -> Path:
-    """Find the milkcrate project root directory."""
-    current = Path.cwd()
+    """Find the milkcrate project root directory.
+
+    The result is cached per working directory, so commands that chain other
+    commands (e.g. setup) only search once.
+    """
+    return _find_project_root_from(Path.cwd())
+
+
+def get_project_root() -> Path:
+    """Return the project root for the running CLI invocation.
+
+    The root is resolved once and kept on the root click context, which
+    commands invoked via `ctx.invoke` (e.g. from setup) share, so it holds
+    even after a command changes directory. Outside a click context this
+    falls back to `find_project_root`.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return find_project_root()
+    obj = ctx.find_root().ensure_object(dict)
+    if "project_root" not in obj:
+        obj["project_root"] = find_project_root()
+    return obj["project_root"]
+
+
+@lru_cache(maxsize=8)
+def _find_project_root_from(current: Path) -> Path:
+    """Search `current` and its parents for the milkcrate root."""
 
     # Look for key files that indicate we're in the milkcrate root
     # We need at least app.py and pyproject.toml to confirm it's the right directory
@@ -56,11 +92,19 @@ def find_project_root() -> Path:
     return current
 
 
+def _decode_output(data: bytes) -> str:
+    """Decode captured command output as UTF-8, trimming surrounding whitespace."""
+    return data.strip().decode("utf-8", errors="replace")
+
+
 def run_command(
     cmd: str | list[str], cwd: Path | None = None, check: bool = True
-) -> subprocess.CompletedProcess:
+) -> subprocess.CompletedProcess[bytes]:
     """Run a command with proper error handling.
 
+    Output is captured as bytes and only decoded (as UTF-8, independent of
+    the locale) when it is echoed.
+
     Args:
         cmd: Command as a string (will be split via shlex) or list of arguments.
         cwd: Working directory for the command.
@@ -71,70 +115,84 @@ def run_command(
     cmd_list = shlex.split(cmd) if isinstance(cmd, str) else cmd
     cmd_display = cmd if isinstance(cmd, str) else " ".join(cmd)
     try:
-        result = subprocess.run(
-            cmd_list, cwd=cwd, capture_output=True, text=True, check=check
-        )
+        result = subprocess.run(cmd_list, cwd=cwd, capture_output=True, check=check)
         if result.stdout:
-            click.echo(result.stdout.strip())
+            click.echo(_decode_output(result.stdout))
         return result
     except subprocess.CalledProcessError as e:
         click.echo(f"Command failed: {cmd_display}", err=True)
         if e.stderr:
-            click.echo(f"Error: {e.stderr.strip()}", err=True)
+            click.echo(f"Error: {_decode_output(e.stderr)}", err=True)
         if e.stdout:
-            click.echo(f"Output: {e.stdout.strip()}", err=True)
+            click.echo(f"Output: {_decode_output(e.stdout)}", err=True)
         sys.exit(1)
 
 
-def clean_directory(directory: Path, directory_name: str) -> None:
-    """Clean a directory by removing all contents except .gitkeep."""
-    click.echo(f"🧹 Cleaning {directory_name} directory...")
-    directory.mkdir(exist_ok=True)
+def run_streaming(argv: list[str], cwd: Path | None = None) -> None:
+    """Run a command with its output passed straight through to the terminal.
 
-    # Remove all contents except .gitkeep
-    for item in directory.iterdir():
-        if item.name != ".gitkeep":
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                item.unlink()
-            click.echo(f"🗑️  Removed: {item.name}")
+    Used for long-running or chatty commands (dev server, compose builds) whose
+    output should appear as it is produced rather than after they exit.
 
-    click.echo(f"✅ {directory_name} directory cleaned!")
+    Args:
+        argv: Command and arguments.
+        cwd: Working directory for the command.
+    """
+    try:
+        subprocess.run(argv, cwd=cwd, check=True)
+    except subprocess.CalledProcessError as e:
+        click.echo(f"Command failed: {' '.join(argv)}", err=True)
+        sys.exit(e.returncode or 1)
 
 
-def clean_python_cache(root: Path) -> None:
-    """Remove Python bytecode and cache files."""
-    click.echo("🧹 Cleaning Python cache files...")
-    removed_count = 0
-
-    # Remove __pycache__ directories
-    for cache_dir in root.rglob("__pycache__"):
-        if cache_dir.is_dir():
-            shutil.rmtree(cache_dir)
-            click.echo(f"🗑️  Removed: {cache_dir.relative_to(root)}")
-            removed_count += 1
-
-    # Remove .pyc, .pyo, .pyd files
-    for pattern in ["*.pyc", "*.pyo", "*.pyd"]:
-        for cache_file in root.rglob(pattern):
-            if cache_file.is_file():
-                cache_file.unlink()
-                removed_count += 1
-
-    if removed_count > 0:
-        click.echo(f"✅ Removed {removed_count} Python cache file(s)")
-    else:
-        click.echo("✅ No Python cache files found")
+def _echo_removed(names: list[str]) -> None:
+    """List removed entries with a single write."""
+    if names:
+        click.echo("\n".join(f"🗑️  Removed: {name}" for name in names))
 
 
-def clean_build_cache(root: Path) -> None:
-    """Remove build and test cache directories."""
-    click.echo("🧹 Cleaning build and test cache...")
-    removed_count = 0
+def _has_removable_entries(directory: Path) -> bool:
+    """Return True if `directory` holds anything besides .gitkeep.
+
+    Stops at the first such entry; a missing directory counts as empty.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return any(entry.name != ".gitkeep" for entry in it)
+    except FileNotFoundError:
+        return False
+
+
+def clean_directory(
+    directory: Path, directory_name: str, *, verbose: bool = False
+) -> None:
+    """Clean a directory by removing all contents except .gitkeep.
+
+    Args:
+        directory: Directory to empty
+        directory_name: Name shown in progress messages
+        verbose: List every removed entry instead of only the count
+    """
+    directory.mkdir(exist_ok=True)
+    if not _has_removable_entries(directory):
+        click.echo(f"✅ {directory_name} directory already clean")
+        return
+
+    click.echo(f"🧹 Cleaning {directory_name} directory...")
+
+    # Remove all contents except .gitkeep
+    with os.scandir(directory) as it:
+        items = [Path(entry.path) for entry in it if entry.name != ".gitkeep"]
+    remove_paths(items)
+    if verbose:
+        _echo_removed([item.name for item in items])
+
+    click.echo(f"✅ {directory_name} directory cleaned ({len(items)} item(s) removed)")
+
 
-    # Cache directories to remove
-    cache_dirs = [
+# Cache directories and files removed from the project root only
+ROOT_CACHE_NAMES = frozenset(
+    {
         ".pytest_cache",
         ".mypy_cache",
         "htmlcov",
@@ -145,76 +203,201 @@ def clean_build_cache(root: Path) -> None:
         ".rumdl_cache",
         "dist",
         "build",
-        "*.egg-info",
-    ]
+    }
+)
 
-    for pattern in cache_dirs:
-        if "*" in pattern:
-            # Handle glob patterns like *.egg-info
-            for item in root.rglob(pattern):
-                if item.is_dir() or item.is_file():
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-                    click.echo(f"🗑️  Removed: {item.relative_to(root)}")
-                    removed_count += 1
-        else:
-            # Handle exact directory names
-            cache_path = root / pattern
-            if cache_path.exists():
-                if cache_path.is_dir():
-                    shutil.rmtree(cache_path)
-                else:
-                    cache_path.unlink()
-                click.echo(f"🗑️  Removed: {pattern}")
-                removed_count += 1
-
-    # Also clean .coverage.* files
-    for coverage_file in root.rglob(".coverage.*"):
-        if coverage_file.is_file():
-            coverage_file.unlink()
-            click.echo(f"🗑️  Removed: {coverage_file.relative_to(root)}")
-            removed_count += 1
-
-    if removed_count > 0:
-        click.echo(f"✅ Removed {removed_count} cache item(s)")
+PYTHON_CACHE_SUFFIXES = (".pyc", ".pyo", ".pyd")
+
+# (path, is_dir) pairs found by _find_cache_entries
+CacheEntries = list[tuple[Path, bool]]
+
+
+def _find_cache_entries(root: Path) -> tuple[CacheEntries, CacheEntries]:
+    """Walk the project tree once and collect removable cache entries.
+
+    Matching directories are not descended into, and symlinks are never
+    followed.
+
+    Returns:
+        Tuple of (python_cache, build_cache) entries
+    """
+    python_cache: CacheEntries = []
+    build_cache: CacheEntries = []
+    pending = deque([str(root)])
+
+    while pending:
+        directory = pending.pop()
+        at_root = directory == str(root)
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if name == "__pycache__" and is_dir:
+                        python_cache.append((Path(entry.path), True))
+                    elif name.endswith(PYTHON_CACHE_SUFFIXES) and not is_dir:
+                        if entry.is_file(follow_symlinks=False):
+                            python_cache.append((Path(entry.path), False))
+                    elif (
+                        (at_root and name in ROOT_CACHE_NAMES)
+                        or name.endswith(".egg-info")
+                        or (name.startswith(".coverage.") and not is_dir)
+                    ):
+                        build_cache.append((Path(entry.path), is_dir))
+                    elif is_dir:
+                        pending.append(entry.path)
+        except OSError:
+            continue
+
+    return python_cache, build_cache
+
+
+def clean_python_cache(
+    root: Path, entries: CacheEntries | None = None, *, verbose: bool = False
+) -> None:
+    """Remove Python bytecode and cache files.
+
+    Args:
+        root: Project root directory
+        entries: Python cache entries from `_find_cache_entries`; the tree is
+            walked when omitted
+        verbose: List removed cache directories instead of only the count
+    """
+    click.echo("🧹 Cleaning Python cache files...")
+    if entries is None:
+        entries = _find_cache_entries(root)[0]
+
+    remove_paths([path for path, _ in entries])
+    if verbose:
+        # Individual .pyc files are counted but not listed
+        _echo_removed(
+            [str(path.relative_to(root)) for path, is_dir in entries if is_dir]
+        )
+
+    if entries:
+        click.echo(f"✅ Removed {len(entries)} Python cache file(s)")
+    else:
+        click.echo("✅ No Python cache files found")
+
+
+def clean_build_cache(
+    root: Path, entries: CacheEntries | None = None, *, verbose: bool = False
+) -> None:
+    """Remove build and test cache directories.
+
+    Args:
+        root: Project root directory
+        entries: Build cache entries from `_find_cache_entries`; the tree is
+            walked when omitted
+        verbose: List removed entries instead of only the count
+    """
+    click.echo("🧹 Cleaning build and test cache...")
+    if entries is None:
+        entries = _find_cache_entries(root)[1]
+
+    remove_paths([path for path, _ in entries])
+    if verbose:
+        _echo_removed([str(path.relative_to(root)) for path, _ in entries])
+
+    if entries:
+        click.echo(f"✅ Removed {len(entries)} cache item(s)")
     else:
         click.echo("✅ No build cache files found")
 
 
-def check_prerequisites() -> bool:
-    """Check if all prerequisites are installed."""
-    issues = []
+# Upper bound in seconds on each prerequisite probe
+PREREQUISITE_TIMEOUT = 5
 
-    # Check uv
+
+def _check_uv() -> tuple[bool, str]:
+    """Check that the uv package manager is installed."""
     try:
-        subprocess.run(["uv", "--version"], capture_output=True, check=True)
-        click.echo("✅ uv package manager found")
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        issues.append(
-            "❌ uv is not installed. Install from: https://docs.astral.sh/uv/getting-started/installation/"
+        subprocess.run(
+            ["uv", "--version"],
+            capture_output=True,
+            check=True,
+            timeout=PREREQUISITE_TIMEOUT,
         )
+        return True, "✅ uv package manager found"
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return (
+            False,
+            "❌ uv is not installed. Install from: https://docs.astral.sh/uv/getting-started/installation/",
+        )
+
 
-    # Check Python via uv
+def _check_python() -> tuple[bool, str]:
+    """Check that Python 3 can be run through uv."""
     try:
         result = subprocess.run(
             ["uv", "run", "python3", "--version"],
             capture_output=True,
             check=True,
             text=True,
+            timeout=PREREQUISITE_TIMEOUT,
         )
-        click.echo(f"✅ Python found: {result.stdout.strip()}")
-    except subprocess.CalledProcessError:
-        issues.append("❌ Python 3 is not accessible through uv")
+        return True, f"✅ Python found: {result.stdout.strip()}"
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return False, "❌ Python 3 is not accessible through uv"
+
+
+DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+
+def _ping_docker_socket(socket_path: str) -> bool:
+    """Send `GET /_ping` over a Docker unix socket and report success."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(PREREQUISITE_TIMEOUT)
+        sock.connect(socket_path)
+        sock.sendall(b"GET /_ping HTTP/1.0\r\nHost: docker\r\n\r\n")
+        status_line = sock.recv(256).split(b"\r\n", 1)[0]
+    return b" 200 " in status_line
 
-    # Check Docker
+
+def _check_docker() -> tuple[bool, str]:
+    """Check that the Docker daemon is reachable.
+
+    Local daemons are pinged directly over the unix socket; docker-py (slow
+    to import and to build a client) is only used for remote DOCKER_HOST
+    values or platforms without unix sockets.
+    """
+    docker_host = os.environ.get("DOCKER_HOST", "")
     try:
-        client = docker.from_env()
-        client.ping()
-        click.echo("✅ Docker is running")
+        if hasattr(socket, "AF_UNIX") and (
+            not docker_host or docker_host.startswith("unix://")
+        ):
+            socket_path = docker_host.removeprefix("unix://") or DEFAULT_DOCKER_SOCKET
+            ok = _ping_docker_socket(socket_path)
+        else:
+            import docker
+
+            ok = bool(docker.from_env(timeout=PREREQUISITE_TIMEOUT).ping())
     except Exception:
-        issues.append("❌ Docker is not running or not accessible")
+        ok = False
+
+    if ok:
+        return True, "✅ Docker is running"
+    return False, "❌ Docker is not running or not accessible"
+
+
+def check_prerequisites() -> bool:
+    """Check if all prerequisites are installed.
+
+    The checks are independent, so they run concurrently; results are
+    reported in a fixed order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    checks = (_check_uv, _check_python, _check_docker)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        results = list(executor.map(lambda check: check(), checks))
+
+    issues = []
+    for ok, message in results:
+        if ok:
+            click.echo(message)
+        else:
+            issues.append(message)
 
     if issues:
         click.echo("\nPrerequisite issues found:")
@@ -237,11 +420,31 @@ def cli():
 def install():
     """Install Python dependencies via uv."""
     click.echo("📦 Installing dependencies...")
-    project_root = find_project_root()
-    run_command("uv sync", cwd=project_root)
+    project_root = get_project_root()
+    run_streaming(["uv", "sync"], cwd=project_root)
     click.echo("✅ Dependencies installed successfully!")
 
 
+def _initialize_database() -> None:
+    """Build the Flask app and (re)create the database schema.
+
+    `create_app` comes from the package rather than `app.py`, whose
+    module-level `app = create_app()` would build a second app on import.
+    Exits the CLI on failure.
+    """
+    try:
+        from database import init_db as db_init
+        from milkcrate_core import create_app
+
+        app = create_app()
+        with app.app_context():
+            db_init()
+        click.echo("✅ Database initialized successfully!")
+    except Exception as e:
+        click.echo(f"❌ Database initialization failed: {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command("init-db")
 @click.option(
     "--yes",
@@ -254,7 +457,7 @@ def init_db(yes: bool):
 
     WARNING: This drops and recreates all tables, destroying existing data.
     """
-    project_root = find_project_root()
+    project_root = get_project_root()
     db_path = project_root / "instance" / "milkcrate.sqlite"
 
     if db_path.exists() and not yes:
@@ -269,18 +472,7 @@ def init_db(yes: bool):
     # Change to project root and run the initialization
     os.chdir(project_root)
 
-    # Import and initialize the database
-    try:
-        from app import create_app
-        from database import init_db as db_init
-
-        app = create_app()
-        with app.app_context():
-            db_init()
-        click.echo("✅ Database initialized successfully!")
-    except Exception as e:
-        click.echo(f"❌ Database initialization failed: {e}", err=True)
-        sys.exit(1)
+    _initialize_database()
 
 
 @cli.command()
@@ -302,7 +494,7 @@ def setup(ctx: click.Context):
 def check():
     """Check system prerequisites and project status."""
     click.echo("🔍 Checking milkcrate prerequisites...")
-    project_root = find_project_root()
+    project_root = get_project_root()
     click.echo(f"📁 Project root: {project_root}")
 
     if not check_prerequisites():
@@ -329,8 +521,8 @@ def check():
 def run():
     """Start the development server locally (port 5001)."""
     click.echo("🚀 Starting milkcrate development server...")
-    project_root = find_project_root()
-    run_command("uv run python3 app.py", cwd=project_root)
+    project_root = get_project_root()
+    run_streaming(["uv", "run", "python3", "app.py"], cwd=project_root)
 
 
 # === Docker & Deployment ===
@@ -338,44 +530,66 @@ def run():
 def up():
     """Start docker compose stack."""
     click.echo("🐳 Starting docker compose stack...")
-    project_root = find_project_root()
-    run_command("docker compose up -d", cwd=project_root)
+    project_root = get_project_root()
+    run_streaming(["docker", "compose", "up", "-d"], cwd=project_root)
 
 
 @cli.command()
 def down():
     """Stop docker compose stack."""
     click.echo("🛑 Stopping docker compose stack...")
-    project_root = find_project_root()
-    run_command("docker compose down --remove-orphans", cwd=project_root)
+    project_root = get_project_root()
+    run_streaming(["docker", "compose", "down", "--remove-orphans"], cwd=project_root)
 
 
 @cli.command()
 def rebuild():
     """Rebuild milkcrate image."""
     click.echo("🔨 Rebuilding milkcrate image...")
-    project_root = find_project_root()
-    run_command("docker compose build --no-cache milkcrate", cwd=project_root)
+    project_root = get_project_root()
+    run_streaming(
+        ["docker", "compose", "build", "--no-cache", "milkcrate"], cwd=project_root
+    )
 
 
 @cli.command("rebuild-all")
 def rebuild_all():
     """Rebuild all compose services."""
     click.echo("🔨 Rebuilding all compose services...")
-    project_root = find_project_root()
-    run_command("docker compose build --no-cache", cwd=project_root)
+    project_root = get_project_root()
+    run_streaming(["docker", "compose", "build", "--no-cache"], cwd=project_root)
+
+
+DEV_SERVER_ADDRESS = ("127.0.0.1", 5001)
+
+
+def _probe_dev_server(timeout: float = 2.0) -> int | None:
+    """Return the HTTP status of `GET /` on the dev server, or None if down.
+
+    Speaks just enough HTTP/1.0 over a plain socket to read the status line,
+    avoiding the import cost of an HTTP client library.
+    """
+    try:
+        with socket.create_connection(DEV_SERVER_ADDRESS, timeout=timeout) as sock:
+            sock.sendall(b"GET / HTTP/1.0\r\nHost: localhost\r\n\r\n")
+            status_line = sock.recv(256).split(b"\r\n", 1)[0]
+        return int(status_line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
 
 
 @cli.command()
 def status():
     """Show system status."""
     click.echo("📊 milkcrate system status:")
-    project_root = find_project_root()
+    project_root = get_project_root()
 
     # Check if compose services are running
     try:
         result = run_command(
-            "docker compose ps --format json", cwd=project_root, check=False
+            ["docker", "compose", "ps", "--format", "json"],
+            cwd=project_root,
+            check=False,
         )
         if result.returncode == 0:
             click.echo("✅ Docker compose stack accessible")
@@ -385,20 +599,126 @@ def status():
         click.echo("❌ Could not check docker compose status")
 
     # Check if development server might be running
-    try:
-        import requests
-
-        response = requests.get("http://localhost:5001", timeout=2)
-        if response.status_code == 200:
-            click.echo("✅ Development server running on port 5001")
-        else:
-            click.echo(
-                f"⚠️  Development server responded with status {response.status_code}"
-            )
-    except ImportError:
-        click.echo("ℹ️  requests module not available - cannot check development server")  # noqa: RUF001
-    except Exception:
+    status_code = _probe_dev_server()
+    if status_code is None:
         click.echo("ℹ️  Development server not running on port 5001")  # noqa: RUF001
+    elif status_code == 200:
+        click.echo("✅ Development server running on port 5001")
+    else:
+        click.echo(f"⚠️  Development server responded with status {status_code}")
+
+
+# Already-compressed formats are stored as-is when packaging; deflating them
+# again costs CPU time and saves next to nothing
+PRECOMPRESSED_SUFFIXES = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".avif",
+    ".ico",
+    ".woff",
+    ".woff2",
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".7z",
+    ".whl",
+    ".jar",
+    ".mp3",
+    ".mp4",
+    ".webm",
+    ".pdf",
+)
+
+
+def _iter_package_files(
+    root: Path, excludes: set[str], skip_name: str
+) -> Iterator[tuple[str, str]]:
+    """Yield (path, arcname) for every file to include in a package ZIP.
+
+    Patterns without a slash are matched (exactly or as globs) against each
+    directory and file name, and excluded directories are pruned so their
+    contents are never visited. Patterns containing a slash are matched
+    against the path relative to `root`.
+
+    Args:
+        root: Directory being packaged
+        excludes: Exclusion patterns
+        skip_name: File name to leave out (the output archive itself)
+    """
+    names = frozenset(p for p in excludes if "/" not in p and not _has_glob(p))
+    path_patterns = [p.strip("/") for p in excludes if "/" in p]
+    # One compiled alternation per kind instead of an fnmatch call per pattern
+    name_re = _compile_patterns(
+        [fnmatch.translate(p) for p in excludes if "/" not in p and _has_glob(p)]
+    )
+    # Path patterns match the path itself or anything beneath it
+    path_re = _compile_patterns(
+        [fnmatch.translate(p) for p in path_patterns]
+        + [re.escape(f"{p}/") for p in path_patterns]
+    )
+
+    def excluded(name: str, rel_path: str) -> bool:
+        if name in names or (name_re is not None and name_re.match(name)):
+            return True
+        return path_re is not None and path_re.match(rel_path) is not None
+
+    # os.walk yields dirpaths beginning with `root`, so relative paths are
+    # plain slices rather than os.path.relpath calls
+    root_str = os.fspath(root)
+    base_len = len(os.path.join(root_str, ""))
+    for dirpath, dirnames, filenames in os.walk(root_str):
+        rel_dir = dirpath[base_len:]
+        if os.sep != "/":
+            rel_dir = rel_dir.replace(os.sep, "/")
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        dirnames[:] = [d for d in dirnames if not excluded(d, prefix + d)]
+        for name in filenames:
+            arcname = prefix + name
+            if name == skip_name or excluded(name, arcname):
+                continue
+            file_path = os.path.join(dirpath, name)
+            if os.path.isfile(file_path):
+                yield file_path, arcname
+
+
+# Read size when copying stored entries into a package ZIP
+PACKAGE_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _write_stored(zipf: "zipfile.ZipFile", file_path: str, arcname: str) -> None:
+    """Copy a file into `zipf` uncompressed using large reads.
+
+    `ZipFile.write` copies in 8 KiB chunks; stored entries have no compressor
+    to feed, so fewer, larger reads keep the copy bound by disk throughput.
+
+    Args:
+        zipf: Archive open for writing
+        file_path: Source file on disk
+        arcname: Name of the entry inside the archive
+    """
+    import zipfile
+
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dst:
+        shutil.copyfileobj(src, dst, PACKAGE_COPY_CHUNK_SIZE)
+
+
+def _compile_patterns(regexes: list[str]) -> re.Pattern[str] | None:
+    """Join regexes into a single compiled alternation, or None if empty."""
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{r})" for r in regexes))
+
+
+def _has_glob(pattern: str) -> bool:
+    """Return True if `pattern` contains fnmatch wildcards."""
+    return any(ch in pattern for ch in "*?[")
 
 
 # === Utilities ===
@@ -413,10 +733,36 @@ def status():
 @click.option(
     "--include-git", is_flag=True, help="Include .git directory (normally excluded)"
 )
-def package(output: str | None, exclude: tuple, include_git: bool):
+@click.option(
+    "--compression",
+    "-c",
+    type=click.Choice(["deflate", "stored", "zstd"]),
+    default="deflate",
+    show_default=True,
+    help="ZIP compression: stored skips compression (fastest, largest); "
+    "zstd needs Python 3.14+ on both this machine and the server",
+)
+def package(output: str | None, exclude: tuple, include_git: bool, compression: str):
     """Package the current directory as a milkcrate-deployable ZIP file."""
+    import zipfile
+
     current_dir = Path.cwd()
 
+    compress_type = zipfile.ZIP_DEFLATED
+    compresslevel = None
+    if compression == "stored":
+        compress_type = zipfile.ZIP_STORED
+    elif compression == "zstd":
+        zstd = getattr(zipfile, "ZIP_ZSTANDARD", None)
+        if zstd is None:
+            click.echo(
+                "⚠️  zstd compression needs Python 3.14+; using deflate instead",
+                err=True,
+            )
+        else:
+            compress_type = zstd
+            compresslevel = 3
+
     # Determine output filename
     if not output:
         output = "app.zip"
@@ -495,34 +841,20 @@ def package(output: str | None, exclude: tuple, include_git: bool):
     click.echo("📦 Creating ZIP archive...")
     files_added = 0
 
-    def should_exclude(file_path: Path) -> bool:
-        """Check if a file should be excluded based on patterns."""
-        path_str = str(file_path.relative_to(current_dir))
-
-        for pattern in all_excludes:
-            # Handle glob patterns
-            if "*" in pattern:
-                if file_path.match(pattern) or any(
-                    parent.match(pattern) for parent in file_path.parents
-                ):
-                    return True
-            # Handle exact matches and directory names
-            elif pattern in path_str or file_path.name == pattern:
-                return True
-
-        return False
-
     try:
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file_path in current_dir.rglob("*"):
-                if file_path.is_file() and not should_exclude(file_path):
-                    # Don't include the output zip file itself
-                    if file_path.name == output:
-                        continue
-
-                    arcname = file_path.relative_to(current_dir)
+        with zipfile.ZipFile(
+            zip_path, "w", compress_type, compresslevel=compresslevel
+        ) as zipf:
+            for file_path, arcname in _iter_package_files(
+                current_dir, all_excludes, skip_name=output
+            ):
+                if compress_type == zipfile.ZIP_STORED or arcname.lower().endswith(
+                    PRECOMPRESSED_SUFFIXES
+                ):
+                    _write_stored(zipf, file_path, arcname)
+                else:
                     zipf.write(file_path, arcname)
-                    files_added += 1
+                files_added += 1
 
         if zip_path.exists() and files_added > 0:
             size = zip_path.stat().st_size
@@ -578,17 +910,7 @@ def reset_database(project_root: Path) -> None:
     click.echo("🗄️  Initializing database...")
     os.chdir(project_root)
 
-    try:
-        from app import create_app
-        from database import init_db as db_init
-
-        app = create_app()
-        with app.app_context():
-            db_init()
-        click.echo("✅ Database initialized successfully!")
-    except Exception as e:
-        click.echo(f"❌ Database initialization failed: {e}", err=True)
-        sys.exit(1)
+    _initialize_database()
 
     click.echo("✅ Database reset complete!")
 
@@ -627,6 +949,12 @@ def reset_database(project_root: Path) -> None:
     is_flag=True,
     help="Skip confirmation prompts (use with caution).",
 )
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="List every removed item instead of only the totals.",
+)
 def clean(
     cache: bool,
     uploads: bool,
@@ -634,6 +962,7 @@ def clean(
     reset_db_flag: bool,
     clean_all_flag: bool,
     yes: bool,
+    verbose: bool,
 ) -> None:
     """Clean cache files, uploads, extracted apps, and/or reset database.
 
@@ -645,7 +974,7 @@ def clean(
         milkcrate clean --uploads --extracted
         milkcrate clean --all
     """
-    project_root = find_project_root()
+    project_root = get_project_root()
 
     # If --all is specified, set all flags
     if clean_all_flag:
@@ -661,31 +990,37 @@ def clean(
 
     # Clean cache (no confirmation needed)
     if cache:
-        clean_python_cache(project_root)
-        clean_build_cache(project_root)
+        # One walk of the tree serves both cleanups
+        python_cache, build_cache = _find_cache_entries(project_root)
+        clean_python_cache(project_root, python_cache, verbose=verbose)
+        clean_build_cache(project_root, build_cache, verbose=verbose)
         click.echo("✅ Cache cleanup complete!")
 
     # Clean uploads (requires confirmation)
-    if uploads:
+    uploads_dir = project_root / "uploads"
+    if uploads and not _has_removable_entries(uploads_dir):
+        click.echo("✅ uploads directory already clean")
+    elif uploads:
         if not yes:
             if not click.confirm(
                 "⚠️  This will delete all files in the uploads/ directory. Continue?"
             ):
                 click.echo("Cancelled.")
                 return
-        uploads_dir = project_root / "uploads"
-        clean_directory(uploads_dir, "uploads")
+        clean_directory(uploads_dir, "uploads", verbose=verbose)
 
     # Clean extracted apps (requires confirmation)
-    if extracted:
+    extracted_dir = project_root / "extracted_apps"
+    if extracted and not _has_removable_entries(extracted_dir):
+        click.echo("✅ extracted_apps directory already clean")
+    elif extracted:
         if not yes:
             if not click.confirm(
                 "⚠️  This will delete all files in the extracted_apps/ directory. Continue?"
             ):
                 click.echo("Cancelled.")
                 return
-        extracted_dir = project_root / "extracted_apps"
-        clean_directory(extracted_dir, "extracted_apps")
+        clean_directory(extracted_dir, "extracted_apps", verbose=verbose)
 
     # Reset database (requires confirmation)
     if reset_db_flag:
@@ -732,7 +1067,7 @@ def backup(output: Path | None, no_uploads: bool, no_extracted: bool) -> None:
         milkcrate backup --output /path/to/backups
         milkcrate backup --no-uploads --no-extracted  # Database only
     """
-    project_root = find_project_root()
+    project_root = get_project_root()
 
     try:
         from services.backup import create_backup
@@ -806,7 +1141,7 @@ def restore(
         milkcrate restore --backup-dir /path/to/backups
         milkcrate restore backup_file.tar.gz --no-uploads  # Database only
     """
-    project_root = find_project_root()
+    project_root = get_project_root()
 
     try:
         from services.backup import list_backups, restore_backup
@@ -21,6 +21,9 @@ class BaseConfig:
     # Optional: set a custom default route for '/'. Example: '/my-app'.
     # If empty, the home page lists all installed apps, or shows instructions when none are installed.
     DEFAULT_HOME_ROUTE = os.environ.get("DEFAULT_HOME_ROUTE", "")
+    # When the audit queue is full, block the request until there is room
+    # (default) or drop the record and log a single warning
+    AUDIT_BLOCK_WHEN_FULL = _parse_bool(os.environ.get("AUDIT_BLOCK_WHEN_FULL", "true"))
     # SSL/HTTPS (security.py also reads these from env if not on config)
     SSL_CERT_FILE = os.environ.get("SSL_CERT_FILE") or None
     SSL_KEY_FILE = os.environ.get("SSL_KEY_FILE") or None
@@ -36,6 +39,10 @@ class DevelopmentConfig(BaseConfig):
 
 class ProductionConfig(BaseConfig):
     DEBUG = False
+    # Templates only change on deploy: skip per-render mtime checks and keep
+    # compiled bytecode in the instance folder across restarts and workers
+    TEMPLATES_AUTO_RELOAD = False
+    TEMPLATE_BYTECODE_CACHE = True
 
     def __init_subclass__(cls, **kwargs: object) -> None:
         super().__init_subclass__(**kwargs)
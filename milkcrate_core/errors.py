@@ -1,10 +1,12 @@
 """Error handlers registration."""
 
-from flask import Flask, jsonify, render_template, request
+from urllib.parse import urlsplit
+
+from flask import Flask, flash, jsonify, redirect, render_template, request, url_for
 
 
 def register_error_handlers(app: Flask) -> None:
-    """Register common error handlers for 404 and 500 responses."""
+    """Register common error handlers for 404, 413 and 500 responses."""
 
     @app.errorhandler(404)
     def not_found(error):
@@ -15,6 +17,27 @@ def register_error_handlers(app: Flask) -> None:
             return jsonify({"error": "Not Found"}), 404
         return render_template("404.html"), 404
 
+    @app.errorhandler(413)
+    def request_too_large(error):
+        # Werkzeug rejects bodies over MAX_CONTENT_LENGTH while parsing the form,
+        # before anything is written to disk; send the user back to the form
+        limit = app.config.get("MAX_CONTENT_LENGTH")
+        message = "Upload too large"
+        if limit:
+            message += f" (limit is {limit // (1024 * 1024)} MB)"
+        # The raw volume upload is a JSON API used by scripted clients, which
+        # typically send `Accept: */*`
+        if request.endpoint == "volumes.upload_raw_file" or (
+            request.accept_mimetypes.accept_json
+            and not request.accept_mimetypes.accept_html
+        ):
+            return jsonify({"error": message}), 413
+        flash(message)
+        referrer = request.referrer
+        if referrer and urlsplit(referrer).netloc == request.host:
+            return redirect(referrer)
+        return redirect(url_for("public.index"))
+
     @app.errorhandler(500)
     def internal_error(error):
         if (
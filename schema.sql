@@ -15,7 +15,8 @@ CREATE TABLE deployed_apps (
     deployment_type TEXT NOT NULL DEFAULT 'dockerfile',
     compose_file TEXT,
     main_service TEXT,
-    volume_mounts TEXT
+    volume_mounts TEXT,
+    extract_path TEXT
 );
 
 -- Create an index on container_id for faster lookups
@@ -30,6 +31,12 @@ CREATE INDEX IF NOT EXISTS idx_deployment_type ON deployed_apps(deployment_type)
 -- Create an index on public_route for faster lookups
 CREATE INDEX IF NOT EXISTS idx_public_route ON deployed_apps(public_route);
 
+-- Create an index on deployment_date for newest-first listings
+CREATE INDEX IF NOT EXISTS idx_deploy_date ON deployed_apps(deployment_date DESC);
+
+-- Create a partial index covering only public apps for the public listing
+CREATE INDEX IF NOT EXISTS idx_public_only ON deployed_apps(deployment_date DESC) WHERE is_public = 1;
+
 -- Settings table for storing configuration options
 DROP TABLE IF EXISTS settings;
 CREATE TABLE settings (
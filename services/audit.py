@@ -4,21 +4,130 @@ Provides comprehensive logging of all administrative actions including
 deployments, deletions, start/stop operations, and configuration changes.
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
+from collections import deque
 from datetime import UTC, datetime
 from typing import Any
 
-from flask import current_app, request
+import orjson
+from flask import current_app, g, has_request_context, request
 from flask_login import current_user
 
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(entry: dict[str, Any]) -> str:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(entry: dict[str, Any]) -> str:
+    """Encode an audit entry with orjson, which is several times faster."""
+    try:
+        return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits, which json accepts
+        return _json_dumps(entry)
+
+
+# Upper bound on audit records waiting to be written by the background listener
+AUDIT_QUEUE_MAXSIZE = 10000
+# Formatted audit output buffered before it is written out in one call
+AUDIT_BUFFER_BYTES = 64 * 1024
+# Block size used when reading the audit log backwards from its end
+AUDIT_TAIL_CHUNK_SIZE = 16 * 1024
+
+
+class BatchingFileHandler(logging.FileHandler):
+    """File handler that buffers formatted records and writes them in batches.
+
+    Records are written once `AUDIT_BUFFER_BYTES` accumulate or when `flush`
+    is called, instead of with a write and flush per record.
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(filename, encoding="utf-8")
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending.append(message)
+        self._pending_bytes += len(message)
+        if self._pending_bytes >= AUDIT_BUFFER_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._pending:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write("".join(self._pending))
+                self._pending.clear()
+                self._pending_bytes = 0
+            super().flush()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+class AuditQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that blocks or drops records when the queue is full.
+
+    Dropped records are counted in `dropped`, and a single warning is logged
+    the first time the queue overflows instead of a traceback per record.
+    """
+
+    def __init__(self, records: queue.Queue, block: bool = True):
+        super().__init__(records)
+        self.block = block
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Handler.handle holds self.lock here, so the count is not racy
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning(
+                    "Audit log queue is full (%d records); dropping audit records",
+                    AUDIT_QUEUE_MAXSIZE,
+                )
+
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """Queue listener that flushes its handlers whenever the queue drains.
+
+    A burst of audit records is therefore coalesced into a single write,
+    while a lone record is still written as soon as the listener goes idle.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
 
 class AuditLogger:
     """Centralized audit logging for administrative actions."""
 
     def __init__(self, app=None):
         self.app = app
+        self.listener: logging.handlers.QueueListener | None = None
         if app is not None:
             self.init_app(app)
 
@@ -31,22 +140,45 @@ class AuditLogger:
         audit_logger = logging.getLogger("milkcrate.audit")
         audit_logger.setLevel(logging.INFO)
 
-        # Create file handler
-        handler = logging.FileHandler(audit_log_path)
-        handler.setLevel(logging.INFO)
-
-        # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        handler.setFormatter(formatter)
-
-        # Add handler to logger
         if not audit_logger.handlers:
-            audit_logger.addHandler(handler)
+            # Create file handler
+            handler = BatchingFileHandler(audit_log_path)
+            handler.setLevel(logging.INFO)
+
+            # Create formatter
+            formatter = logging.Formatter(
+                "%(asctime)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+            handler.setFormatter(formatter)
+
+            # Requests only enqueue records; a background listener thread
+            # performs the file writes so audit I/O stays off the request path
+            records: queue.Queue = queue.Queue(maxsize=AUDIT_QUEUE_MAXSIZE)
+            audit_logger.addHandler(
+                AuditQueueHandler(
+                    records, block=app.config.get("AUDIT_BLOCK_WHEN_FULL", True)
+                )
+            )
+            self.listener = BatchingQueueListener(records, handler)
+            self.listener.start()
+            atexit.register(self.listener.stop)
 
         app.audit_logger = audit_logger
 
+    def flush(self):
+        """Block until every queued audit record has been written to disk.
+
+        Safe to call from concurrent request threads: the listener marks each
+        record done once handled, so this waits on the queue and then flushes
+        the handler buffers without restarting the listener thread.
+        """
+        if self.listener is None:
+            return
+        self.listener.queue.join()
+        for handler in self.listener.handlers:
+            handler.flush()
+
     def log_action(
         self,
         action: str,
@@ -73,10 +205,7 @@ class AuditLogger:
                 user_id = current_user.id
 
             # Get request info
-            ip_address = request.remote_addr if request else "unknown"
-            user_agent = (
-                request.headers.get("User-Agent", "unknown") if request else "unknown"
-            )
+            ip_address, user_agent = _request_client()
 
             # Build audit entry
             audit_entry = {
@@ -97,7 +226,7 @@ class AuditLogger:
             # Log the entry
             logger = getattr(current_app, "audit_logger", None) if current_app else None
             if isinstance(logger, logging.Logger):
-                log_message = json.dumps(audit_entry, separators=(",", ":"))
+                log_message = _dumps(audit_entry)
                 if success:
                     logger.info(log_message)
                 else:
@@ -109,6 +238,23 @@ class AuditLogger:
                 current_app.logger.warning(f"Audit logging failed: {e}")
 
 
+def _request_client() -> tuple[str | None, str]:
+    """Return the (ip_address, user_agent) of the current request.
+
+    Memoized on `g`, so several audit entries written during one request
+    read the headers only once.
+    """
+    if not has_request_context():
+        return "unknown", "unknown"
+    client = g.get("audit_client")
+    if client is None:
+        client = g.audit_client = (
+            request.remote_addr,
+            request.headers.get("User-Agent", "unknown"),
+        )
+    return client
+
+
 # Global audit logger instance
 audit_logger = AuditLogger()
 
@@ -132,6 +278,40 @@ def log_admin_action(
     )
 
 
+def _tail_lines(path: str, limit: int) -> list[str]:
+    """Return the last `limit` lines of a text file.
+
+    Reads backwards from the end in `AUDIT_TAIL_CHUNK_SIZE` blocks until
+    enough lines are found, so the cost depends on `limit` rather than on the
+    size of the file.
+
+    Args:
+        path: File to read
+        limit: Maximum number of lines to return
+
+    Returns:
+        Up to `limit` lines in file order, without line terminators
+    """
+    if limit <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        chunks: deque[bytes] = deque()
+        newlines = 0
+        # One extra newline marks the start of the oldest wanted line
+        while position > 0 and newlines <= limit:
+            read_size = min(AUDIT_TAIL_CHUNK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size)
+            chunks.appendleft(chunk)
+            newlines += chunk.count(b"\n")
+
+    lines = b"".join(chunks).decode("utf-8", errors="replace").splitlines()
+    return lines[-limit:]
+
+
 def get_audit_logs(limit: int = 100) -> list[dict]:
     """Retrieve recent audit logs for display in admin interface.
 
@@ -145,6 +325,9 @@ def get_audit_logs(limit: int = 100) -> list[dict]:
         if not current_app or not hasattr(current_app, "audit_logger"):
             return []
 
+        # Make sure records still in the queue are on disk before reading
+        audit_logger.flush()
+
         # Get the audit log file path
         audit_log_path = os.path.join(current_app.instance_path, "audit.log")
 
@@ -152,20 +335,17 @@ def get_audit_logs(limit: int = 100) -> list[dict]:
             return []
 
         logs = []
-        with open(audit_log_path) as f:
-            lines = f.readlines()
-
-        # Get the last 'limit' lines and parse them
-        for line in lines[-limit:]:
+        # Only the last 'limit' lines are read and parsed
+        for line in _tail_lines(audit_log_path, limit):
+            # Parse the log line to extract JSON
+            # Format: "timestamp - level - json_data"
+            _, _, rest = line.strip().partition(" - ")
+            _, sep, json_data = rest.partition(" - ")
+            if not sep:
+                continue
             try:
-                # Parse the log line to extract JSON
-                # Format: "timestamp - level - json_data"
-                parts = line.strip().split(" - ", 2)
-                if len(parts) >= 3:
-                    json_data = parts[2]
-                    log_entry = json.loads(json_data)
-                    logs.append(log_entry)
-            except (json.JSONDecodeError, IndexError):
+                logs.append(json.loads(json_data))
+            except json.JSONDecodeError:
                 continue
 
         # Return in reverse chronological order (newest first)
@@ -4,12 +4,26 @@ This module provides functions to create and restore backups of milkcrate's
 critical data including the database, uploads, and extracted applications.
 """
 
+import os
 import shutil
 import sqlite3
+import subprocess
 import tarfile
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 
+from services.cleanup import remove_paths
+
+# Restored files up to this size are written by worker threads
+RESTORE_WRITE_MAX_BYTES = 1024 * 1024
+# Upper bound on file data read from the archive but not yet written
+RESTORE_INFLIGHT_BYTES = 64 * 1024 * 1024
+RESTORE_WRITE_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
 
 def create_backup(
     project_root: Path,
@@ -52,7 +66,7 @@ def create_backup(
         raise FileNotFoundError(f"Database not found at {db_path}")
 
     # Create backup archive
-    with tarfile.open(backup_path, "w:gz") as tar:
+    with _open_backup_archive(backup_path) as tar:
         # Add database file
         tar.add(db_path, arcname="instance/milkcrate.sqlite")
 
@@ -80,6 +94,42 @@ def create_backup(
     return backup_path
 
 
+@contextmanager
+def _open_backup_archive(backup_path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a gzip-compressed tar archive for writing.
+
+    When `pigz` is on the PATH, an uncompressed tar stream is piped through
+    it so compression uses every core; otherwise tarfile's single-threaded
+    gzip is used. Both produce a standard .tar.gz.
+
+    Args:
+        backup_path: Archive file to create.
+
+    Raises:
+        OSError: If pigz exits with an error.
+    """
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(backup_path, "w:gz") as tar:
+            yield tar
+        return
+
+    with open(backup_path, "wb") as out:
+        proc = subprocess.Popen(
+            [pigz, "-p", str(os.cpu_count() or 1), "-c"],
+            stdin=subprocess.PIPE,
+            stdout=out,
+        )
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                yield tar
+        finally:
+            proc.stdin.close()
+            returncode = proc.wait()
+    if returncode != 0:
+        raise OSError(f"pigz failed with exit status {returncode}")
+
+
 def _exclude_gitkeep(tarinfo: tarfile.TarInfo) -> tarfile.TarInfo | None:
     """Filter function to exclude .gitkeep files from backups."""
     if tarinfo.name.endswith(".gitkeep"):
@@ -140,82 +190,134 @@ def restore_backup(
     if not backup_path.exists():
         raise FileNotFoundError(f"Backup file not found: {backup_path}")
 
-    # Verify backup is a valid tar.gz file
     try:
         with tarfile.open(backup_path, "r:gz") as tar:
-            tar.getnames()  # Verify archive is readable
+            # Reading every header up front verifies the archive is readable
+            # before anything on disk is replaced
+            members = tar.getmembers()
+            _restore_members(
+                tar, members, project_root, restore_uploads, restore_extracted
+            )
     except tarfile.TarError as e:
         raise tarfile.TarError(f"Invalid backup archive: {e}") from e
 
-    # Extract backup
-    with tarfile.open(backup_path, "r:gz") as tar:
-        # Restore database
-        db_member = None
-        for member in tar.getmembers():
-            if member.name == "instance/milkcrate.sqlite":
-                db_member = member
-                break
-
-        if db_member:
-            # Ensure instance directory exists
-            instance_dir = project_root / "instance"
-            instance_dir.mkdir(parents=True, exist_ok=True)
-
-            # Extract database
-            tar.extract(db_member, project_root)
-
-            # Verify database integrity
-            db_path = project_root / "instance" / "milkcrate.sqlite"
-            try:
-                conn = sqlite3.connect(db_path)
-                conn.execute("SELECT 1")
-                conn.close()
-            except sqlite3.Error as e:
-                raise OSError(f"Database integrity check failed: {e}") from e
-
-        # Restore other instance files (audit logs, etc.)
-        for member in tar.getmembers():
-            if (
-                member.name.startswith("instance/")
-                and member.name != "instance/milkcrate.sqlite"
-            ):
-                tar.extract(member, project_root)
-
-        # Restore uploads if requested
-        if restore_uploads:
-            uploads_dir = project_root / "uploads"
-            uploads_dir.mkdir(parents=True, exist_ok=True)
-
-            # Remove existing uploads (except .gitkeep)
-            for item in uploads_dir.iterdir():
-                if item.name != ".gitkeep":
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-
-            # Extract uploads
-            for member in tar.getmembers():
-                if member.name.startswith("uploads/"):
-                    tar.extract(member, project_root)
-
-        # Restore extracted apps if requested
-        if restore_extracted:
-            extracted_dir = project_root / "extracted_apps"
-            extracted_dir.mkdir(parents=True, exist_ok=True)
-
-            # Remove existing extracted apps (except .gitkeep)
-            for item in extracted_dir.iterdir():
-                if item.name != ".gitkeep":
-                    if item.is_dir():
-                        shutil.rmtree(item)
-                    else:
-                        item.unlink()
-
-            # Extract extracted apps
-            for member in tar.getmembers():
-                if member.name.startswith("extracted_apps/"):
-                    tar.extract(member, project_root)
+
+def _restore_members(
+    tar: tarfile.TarFile,
+    members: list[tarfile.TarInfo],
+    project_root: Path,
+    restore_uploads: bool,
+    restore_extracted: bool,
+) -> None:
+    """Extract the selected parts of an opened backup archive."""
+    # Sort members into the database and everything else in one pass
+    prefixes = ["instance/"]
+    if restore_uploads:
+        prefixes.append("uploads/")
+    if restore_extracted:
+        prefixes.append("extracted_apps/")
+    prefix_tuple = tuple(prefixes)
+
+    db_member = None
+    to_extract = []
+    for member in members:
+        if member.name == "instance/milkcrate.sqlite":
+            db_member = member
+        elif member.name.startswith(prefix_tuple):
+            to_extract.append(member)
+
+    # Apply tarfile's "data" filter to every member up front, so an unsafe
+    # member is rejected before anything on disk is replaced
+    dest = str(project_root)
+    to_extract = [tarfile.data_filter(member, dest) for member in to_extract]
+
+    if db_member:
+        # Ensure instance directory exists
+        instance_dir = project_root / "instance"
+        instance_dir.mkdir(parents=True, exist_ok=True)
+
+        # Extract database
+        tar.extract(db_member, project_root, filter="data")
+
+        # Verify database integrity
+        db_path = project_root / "instance" / "milkcrate.sqlite"
+        try:
+            conn = sqlite3.connect(db_path)
+            conn.execute("SELECT 1")
+            conn.close()
+        except sqlite3.Error as e:
+            raise OSError(f"Database integrity check failed: {e}") from e
+
+    # Remove existing uploads / extracted apps (except .gitkeep)
+    if restore_uploads:
+        _clear_directory(project_root / "uploads")
+    if restore_extracted:
+        _clear_directory(project_root / "extracted_apps")
+
+    # getmembers() already decompressed the whole stream to read the headers,
+    # so extraction is a second pass. Extracting in archive order keeps that
+    # to one more forward read instead of a rewind per directory
+    _extract_members(tar, to_extract, project_root)
+
+
+def _extract_members(
+    tar: tarfile.TarFile, members: list[tarfile.TarInfo], destination: Path
+) -> None:
+    """Extract members, writing small regular files on worker threads.
+
+    Decompression has to stay sequential, but writing many small files is
+    dominated by per-file open/write/close calls. Small files are read into
+    memory and handed to `RESTORE_WRITE_WORKERS` threads so those calls
+    overlap with decompressing the next members; at most
+    `RESTORE_INFLIGHT_BYTES` of file data is held at once. Everything else
+    goes through `tar.extract`. Members must already have passed tarfile's
+    "data" filter.
+    """
+    dest = str(destination)
+    pending: deque[tuple[Future, int]] = deque()
+    inflight = 0
+    with ThreadPoolExecutor(max_workers=RESTORE_WRITE_WORKERS) as pool:
+        for member in members:
+            if not member.isreg() or member.size > RESTORE_WRITE_MAX_BYTES:
+                tar.extract(member, dest, filter="fully_trusted")
+                continue
+
+            fileobj = tar.extractfile(member)
+            data = fileobj.read() if fileobj else b""
+            target = os.path.join(dest, member.name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            pending.append(
+                (
+                    pool.submit(_write_file, target, data, member.mode, member.mtime),
+                    len(data),
+                )
+            )
+            inflight += len(data)
+            while inflight > RESTORE_INFLIGHT_BYTES:
+                future, size = pending.popleft()
+                future.result()
+                inflight -= size
+
+        # Surface the first write error, if any
+        for future, _ in pending:
+            future.result()
+
+
+def _write_file(path: str, data: bytes, mode: int | None, mtime: float) -> None:
+    """Write a restored file and apply its archived mode and mtime."""
+    with open(path, "wb") as f:
+        f.write(data)
+    if mode is not None:
+        os.chmod(path, mode)
+    os.utime(path, (mtime, mtime))
+
+
+def _clear_directory(directory: Path) -> None:
+    """Create `directory` if needed and remove everything but .gitkeep."""
+    directory.mkdir(parents=True, exist_ok=True)
+    with os.scandir(directory) as it:
+        entries = [Path(entry.path) for entry in it if entry.name != ".gitkeep"]
+    remove_paths(entries)
 
 
 def get_backup_info(backup_path: Path) -> dict[str, str | int]:
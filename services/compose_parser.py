@@ -1,29 +1,67 @@
 """Docker Compose file parsing and validation utilities."""
 
+import copy
+import os
+from functools import lru_cache
 from typing import Any
 
 import yaml
 
+# libyaml's C implementations when PyYAML was built with them; they accept
+# the same documents and are several times faster than the pure-Python ones
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+# Parsed compose files kept in memory, keyed by path, mtime and size
+COMPOSE_CACHE_SIZE = 64
+
 
 def parse_docker_compose(
     compose_path: str,
 ) -> tuple[bool, str, dict[str, Any] | None]:
     """Parse and validate a docker-compose.yml file.
 
+    Results are cached per (path, mtime, size), so an unchanged file is only
+    read and parsed once; callers get their own copy of the data.
+
     Args:
         compose_path: Path to the docker-compose.yml file
 
     Returns:
         Tuple of (is_valid, error_message, parsed_data)
     """
+    # I/O errors are raised out of the cached helper rather than cached, so a
+    # file that becomes readable again is picked up
+    try:
+        st = os.stat(compose_path)
+        is_valid, error_message, compose_data = _parse_docker_compose_cached(
+            compose_path, st.st_mtime_ns, st.st_size
+        )
+    except FileNotFoundError:
+        return False, "docker-compose.yml file not found", None
+    except OSError as e:
+        return False, f"Error reading docker-compose.yml: {e!s}", None
+
+    # Deployments modify the parsed data, so never hand out the cached dict
+    return is_valid, error_message, copy.deepcopy(compose_data)
+
+
+@lru_cache(maxsize=COMPOSE_CACHE_SIZE)
+def _parse_docker_compose_cached(
+    compose_path: str, mtime_ns: int, size: int
+) -> tuple[bool, str, dict[str, Any] | None]:
+    """Read and validate a compose file; mtime_ns and size key the cache.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
     try:
         with open(compose_path, encoding="utf-8") as f:
-            compose_data = yaml.safe_load(f)
+            compose_data = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         return False, f"Invalid YAML format: {e!s}", None
-    except FileNotFoundError:
-        return False, "docker-compose.yml file not found", None
-    except Exception as e:
+    except ValueError as e:
+        # Covers UnicodeDecodeError; OSError propagates and is not cached
         return False, f"Error reading docker-compose.yml: {e!s}", None
 
     # Validate basic structure
@@ -62,14 +100,13 @@ def get_main_service(compose_data: dict[str, Any]) -> tuple[str, dict[str, Any]]
 
     # First, look for service with milkcrate.main_service label
     for service_name, service_config in services.items():
-        labels = service_config.get("labels", {})
-        if isinstance(labels, dict) and labels.get("milkcrate.main_service") == "true":
+        labels = service_config.get("labels")
+        if isinstance(labels, dict):
+            if labels.get("milkcrate.main_service") == "true":
+                return service_name, service_config
+        elif isinstance(labels, list) and "milkcrate.main_service=true" in labels:
+            # List format labels
             return service_name, service_config
-        if isinstance(labels, list):
-            # Handle list format labels
-            for label in labels:
-                if label == "milkcrate.main_service=true":
-                    return service_name, service_config
 
     # Fallback to first service
     first_service_name = next(iter(services.keys()))
@@ -180,3 +217,14 @@ def get_compose_services_info(compose_data: dict[str, Any]) -> dict[str, Any]:
         "total_services": len(compose_data["services"]),
         "service_names": list(compose_data["services"].keys()),
     }
+
+
+def write_docker_compose(compose_data: dict[str, Any], compose_path: str) -> None:
+    """Write compose data to a YAML file.
+
+    Args:
+        compose_data: Parsed (and possibly modified) compose data
+        compose_path: Destination file path
+    """
+    with open(compose_path, "w", encoding="utf-8") as f:
+        yaml.dump(compose_data, f, Dumper=_YAML_DUMPER, default_flow_style=False)
@@ -6,17 +6,28 @@ building/running Docker containers for applications.
 
 import contextlib
 import os
+import re
 import zipfile
+from collections.abc import Mapping
 from datetime import datetime
+from typing import IO
 
 import docker
+from werkzeug.utils import secure_filename
 
 from services.compose_parser import (
     get_compose_services_info,
     parse_docker_compose,
     validate_compose_for_milkcrate,
+    write_docker_compose,
 )
 
+# Archive extensions accepted for uploads
+_ALLOWED_EXTENSIONS = frozenset({"zip"})
+
+# Upload names that `secure_filename` would return unchanged
+_SAFE_UPLOAD_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,127}\.zip$")
+
 
 def _default_security_policies() -> dict:
     """Return the default security and resource policies for deployed containers."""
@@ -102,14 +113,25 @@ def _generate_traefik_labels(
 
 
 def allowed_file(filename: str | None) -> bool:
-    """Return True if the filename looks like a ZIP archive."""
+    """Return True if the filename has an allowed archive extension."""
     return (
         filename is not None
         and "." in filename
-        and filename.rsplit(".", 1)[1].lower() == "zip"
+        and filename.rsplit(".", 1)[1].lower() in _ALLOWED_EXTENSIONS
     )
 
 
+def upload_filename(filename: str) -> str:
+    """Return a safe on-disk name for an uploaded archive.
+
+    Plain ASCII ZIP names are already what `secure_filename` would return, so
+    they are used as-is; anything else goes through `secure_filename`.
+    """
+    if _SAFE_UPLOAD_NAME_RE.match(filename):
+        return filename
+    return secure_filename(filename)
+
+
 def detect_deployment_type(app_path: str) -> str:
     """Detect whether the application uses Dockerfile or docker-compose.yml.
 
@@ -127,14 +149,17 @@ def detect_deployment_type(app_path: str) -> str:
     return "dockerfile"
 
 
-def extract_zip_safely(zip_path: str, extract_path: str) -> bool:
+def extract_zip_safely(zip_file: str | IO[bytes], extract_path: str) -> bool:
     """Safely extract a zip archive and verify required files exist.
 
     Prevents path traversal and ensures either a `Dockerfile` or `docker-compose.yml`
     is present after extraction. Supports any containerized application type.
+
+    `zip_file` may be a path or a seekable binary file object, such as an
+    upload's stream, so archives can be extracted without saving them first.
     """
     try:
-        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
             file_list = zip_ref.namelist()
             for filename in file_list:
                 if ".." in filename or filename.startswith("/"):
@@ -303,6 +328,7 @@ def deploy_application(
             is_public=is_public,
             deployment_type="dockerfile",
             volume_mounts=volume_mounts_json,
+            extract_path=app_path,
         )
 
         # Try to enhance with status checking, but don't fail deployment if it doesn't work
@@ -347,6 +373,7 @@ def update_docker_compose_application(
     app_path: str,
     new_zip_filename: str,
     traefik_network: str | None = None,
+    app_record: Mapping | None = None,
 ) -> tuple[bool, str, str | None]:
     """Update an existing docker-compose application with new code.
 
@@ -355,6 +382,7 @@ def update_docker_compose_application(
         app_path: Path to extracted application files
         new_zip_filename: Original filename of the uploaded ZIP
         traefik_network: Traefik network name (optional)
+        app_record: Already-fetched database row for the app (optional)
 
     Returns:
         A tuple: (success flag, container id or error message, image tag when available)
@@ -363,7 +391,8 @@ def update_docker_compose_application(
         # Get existing app info
         from database import get_app_by_id, update_app_container_info, update_app_status
 
-        app_record = get_app_by_id(app_id)
+        if app_record is None:
+            app_record = get_app_by_id(app_id)
         if not app_record:
             return False, "Application not found", None
 
@@ -497,11 +526,8 @@ def update_docker_compose_application(
         modified_compose_data["networks"][network_name] = {"external": True}
 
         # Write modified compose file
-        import yaml
-
         modified_compose_path = os.path.join(app_path, "docker-compose-modified.yml")
-        with open(modified_compose_path, "w") as f:
-            yaml.dump(modified_compose_data, f, default_flow_style=False)
+        write_docker_compose(modified_compose_data, modified_compose_path)
 
         # Deploy using docker-compose
         try:
@@ -572,6 +598,7 @@ def update_docker_compose_application(
                 deployment_type="docker-compose",
                 compose_file="docker-compose.yml",
                 main_service=main_service,
+                extract_path=app_path,
             )
 
             # Try to enhance with status checking
@@ -742,11 +769,8 @@ def deploy_docker_compose(
         modified_compose_data["networks"][network_name] = {"external": True}
 
         # Write modified compose file
-        import yaml
-
         modified_compose_path = os.path.join(app_path, "docker-compose-modified.yml")
-        with open(modified_compose_path, "w") as f:
-            yaml.dump(modified_compose_data, f, default_flow_style=False)
+        write_docker_compose(modified_compose_data, modified_compose_path)
 
         # Deploy using docker-compose
         try:
@@ -827,6 +851,7 @@ def deploy_docker_compose(
                 compose_file="docker-compose.yml",
                 main_service=main_service,
                 volume_mounts=volume_mounts_json,
+                extract_path=app_path,
             )
 
             # Try to enhance with status checking
@@ -872,6 +897,7 @@ def update_application(
     app_path: str,
     new_zip_filename: str,
     traefik_network: str | None = None,
+    app_record: Mapping | None = None,
 ) -> tuple[bool, str, str | None]:
     """Update an existing application with new code from a ZIP file.
 
@@ -882,6 +908,8 @@ def update_application(
         app_path: Path to extracted application files
         new_zip_filename: Original filename of the uploaded ZIP
         traefik_network: Traefik network name (optional)
+        app_record: Already-fetched database row for the app; looked up by
+            `app_id` when omitted
 
     Returns:
         A tuple: (success flag, container id or error message, image tag when available)
@@ -889,7 +917,8 @@ def update_application(
     # Get existing app info to determine deployment type
     from database import get_app_by_id
 
-    app_record = get_app_by_id(app_id)
+    if app_record is None:
+        app_record = get_app_by_id(app_id)
     if not app_record:
         return False, "Application not found", None
 
@@ -897,20 +926,11 @@ def update_application(
 
     if deployment_type == "docker-compose":
         return update_docker_compose_application(
-            app_id, app_path, new_zip_filename, traefik_network
+            app_id, app_path, new_zip_filename, traefik_network, app_record
         )
     # Original Dockerfile update logic
     try:
-        # Get existing app info
-        from database import (
-            get_app_by_id,
-            update_app_container_info,
-            update_app_status,
-        )
-
-        app_record = get_app_by_id(app_id)
-        if not app_record:
-            return False, "Application not found", None
+        from database import update_app_container_info, update_app_status
 
         app_name = app_record["app_name"]
         public_route = app_record["public_route"]
@@ -1031,7 +1051,9 @@ def update_application(
         )
 
         # Update database record with new container and image info
-        update_app_container_info(app_id, new_container.id, new_image_tag)
+        update_app_container_info(
+            app_id, new_container.id, new_image_tag, extract_path=app_path
+        )
 
         # Try to enhance with status checking, but don't fail update if it doesn't work
         try:
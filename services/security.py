@@ -65,11 +65,13 @@ class SecurityHeaders:
                 "max-age=31536000; includeSubDomains; preload"
             )
 
-        # Prevent caching of sensitive pages
+        # Prevent caching of sensitive pages (views may set their own policy)
         if request.endpoint and "admin" in request.endpoint:
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            response.headers.setdefault(
+                "Cache-Control", "no-cache, no-store, must-revalidate"
+            )
+            response.headers.setdefault("Pragma", "no-cache")
+            response.headers.setdefault("Expires", "0")
 
         return response
 
@@ -5,6 +5,7 @@ to provide real-time container state information and optional health checks.
 """
 
 import logging
+import re
 import time
 from datetime import datetime, timedelta
 from typing import Any, ClassVar
@@ -15,6 +16,13 @@ from docker.errors import NotFound
 
 logger = logging.getLogger(__name__)
 
+# Docker's humanized uptime for containers up less than a minute, as it appears
+# in the container list "Status" field (e.g. "Up 12 seconds (healthy)")
+_UPTIME_SECONDS_RE = re.compile(r"^Up (?:Less than a second|(\d+) seconds?)\b")
+
+# Health suffix in the container list "Status" field
+_HEALTH_RE = re.compile(r"\((healthy|unhealthy|health: starting)\)")
+
 
 class ContainerStatus:
     """Container status constants with human-readable descriptions."""
@@ -139,6 +147,60 @@ class StatusManager:
             logger.error(f"Error getting container status for {container_id}: {e}")
             return ContainerStatus.ERROR, {"error": str(e)}
 
+    def get_container_statuses(self) -> dict[str, tuple[str, dict[str, Any]]] | None:
+        """Get the status of every container on the host with one Docker API call.
+
+        Uses the container list endpoint instead of inspecting each container,
+        so callers that need the status of many apps avoid one round-trip per app.
+
+        Returns:
+            Dict mapping container ID and container name to (status, details),
+            or None if the Docker client is unavailable or the call fails.
+        """
+        if not self.docker_client:
+            return None
+
+        try:
+            containers = self.docker_client.containers.list(all=True, sparse=True)
+        except Exception as e:
+            logger.error(f"Error listing containers: {e}")
+            return None
+
+        statuses: dict[str, tuple[str, dict[str, Any]]] = {}
+        for container in containers:
+            summary = container.attrs
+            state = str(summary.get("State", "")).lower()
+            status_text = summary.get("Status", "") or ""
+
+            health = None
+            health_match = _HEALTH_RE.search(status_text)
+            if health_match:
+                health_status = health_match.group(1).replace("health: ", "")
+                health = {"status": health_status, "failing_streak": 0, "log": []}
+
+            details = {
+                "docker_status": state,
+                "started_at": None,
+                "finished_at": None,
+                "exit_code": None,
+                "error": None,
+                "health": health,
+                "restart_count": 0,
+            }
+
+            enhanced_status = self._determine_enhanced_status(state, details)
+            if enhanced_status == ContainerStatus.RUNNING:
+                uptime_match = _UPTIME_SECONDS_RE.match(status_text)
+                if uptime_match and int(uptime_match.group(1) or 0) < 30:
+                    enhanced_status = ContainerStatus.STARTING
+
+            entry = (enhanced_status, details)
+            statuses[summary.get("Id", container.id)] = entry
+            for name in summary.get("Names") or []:
+                statuses[name.lstrip("/")] = entry
+
+        return statuses
+
     def _get_health_status(
         self, container_attrs: dict[str, Any]
     ) -> dict[str, Any] | None:
@@ -295,6 +357,7 @@ class StatusManager:
         app_name: str = "",
         public_route: str = "",
         internal_port: int = 8000,
+        container_statuses: dict[str, tuple[str, dict[str, Any]]] | None = None,
     ) -> dict[str, Any]:
         """Get comprehensive status including Docker state and application health.
 
@@ -303,12 +366,21 @@ class StatusManager:
             app_name: Application name
             public_route: Public route for health checks
             internal_port: Internal port
+            container_statuses: Optional result of `get_container_statuses()`;
+                when given, the container state is read from it instead of
+                querying Docker for this container
 
         Returns:
             Dictionary with comprehensive status information
         """
         # Get Docker container status
-        docker_status, docker_details = self.get_container_status(container_id)
+        if container_statuses is not None:
+            docker_status, docker_details = container_statuses.get(
+                container_id,
+                (ContainerStatus.EXITED, {"error": "Container not found"}),
+            )
+        else:
+            docker_status, docker_details = self.get_container_status(container_id)
 
         result = {
             "status": docker_status,
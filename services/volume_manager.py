@@ -4,21 +4,33 @@ Provides functionality to create, manage, and upload files to Docker volumes.
 """
 
 import os
+import shutil
+import stat
+import tarfile
 import tempfile
+import time
 import zipfile
+from collections.abc import Iterator
 from functools import lru_cache
-from pathlib import Path
+from typing import IO
 
 import docker
 from docker.errors import APIError, NotFound
+from docker.models.volumes import Volume
+
+# Chunk size used when copying file and ZIP member data into tar archives
+TAR_COPY_BUFSIZE = 1024 * 1024
+# Connections kept open to the Docker daemon by the shared client; sized above
+# the upload concurrency limit so parallel uploads do not wait on the pool
+DOCKER_MAX_POOL_SIZE = int(os.environ.get("DOCKER_MAX_POOL_SIZE", "32"))
 
 
 class VolumeManager:
     """Manager for Docker volumes and file operations."""
 
     def __init__(self) -> None:
-        """Initialize the volume manager with Docker client."""
-        self.client = docker.from_env()
+        """Initialize the volume manager with a pooled Docker client."""
+        self.client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
 
     def create_volume(
         self, volume_name: str, description: str | None = None
@@ -87,21 +99,41 @@ class VolumeManager:
             return False, f"Error deleting volume: {e!s}"
 
     def upload_file_to_volume(
-        self, docker_volume_name: str, file_path: str, destination_path: str = "/"
+        self,
+        docker_volume_name: str,
+        file_path: str | IO[bytes],
+        destination_path: str = "/",
+        *,
+        file_name: str | None = None,
     ) -> tuple[bool, str]:
         """Upload a file to a Docker volume.
 
         Args:
             docker_volume_name: Docker volume name
-            file_path: Path to the file to upload
+            file_path: Path to the file to upload, or a seekable binary file
+                object such as an upload's stream
             destination_path: Destination path within the volume
+            file_name: Name to store the file under; required when `file_path`
+                is a file object
 
         Returns:
             Tuple of (success, message)
         """
         try:
             # Verify volume exists
-            self.client.volumes.get(docker_volume_name)
+            volume = self.client.volumes.get(docker_volume_name)
+
+            if isinstance(file_path, str):
+                file_name = os.path.basename(file_path)
+            elif not file_name:
+                return False, "A file name is required for uploaded streams"
+
+            # Write straight into the volume's data directory when this host can
+            # reach it, skipping the helper container and tar round-trip
+            if self._copy_to_local_mountpoint(
+                volume, file_path, file_name, destination_path
+            ):
+                return True, f"File {file_name} uploaded successfully"
 
             # Create a temporary container to mount the volume and copy files
             container_name = f"milkcrate-vol-upload-{os.urandom(4).hex()}"
@@ -119,8 +151,12 @@ class VolumeManager:
                 container.start()
 
                 # Prepare the file for copying
-                file_name = os.path.basename(file_path)
-                tar_path = self._create_tar_archive(file_path)
+                if isinstance(file_path, str):
+                    tar_path = self._create_tar_archive(file_path)
+                else:
+                    tar_path = self._create_tar_archive_from_stream(
+                        file_path, file_name
+                    )
 
                 try:
                     # Copy file to container
@@ -132,8 +168,10 @@ class VolumeManager:
                     return True, f"File {file_name} uploaded successfully"
                 finally:
                     # Clean up tar file
-                    if os.path.exists(tar_path):
-                        os.remove(tar_path)
+                    try:
+                        os.unlink(tar_path)
+                    except FileNotFoundError:
+                        pass
 
             finally:
                 # Clean up container
@@ -153,42 +191,115 @@ class VolumeManager:
         except Exception as e:
             return False, f"Error uploading file: {e!s}"
 
+    def _copy_to_local_mountpoint(
+        self,
+        volume: Volume,
+        source: str | IO[bytes],
+        file_name: str,
+        destination_path: str,
+    ) -> bool:
+        """Copy a file directly into a volume's mountpoint if it is local.
+
+        The destination is opened relative to the resolved directory with
+        `O_NOFOLLOW`, so a symlink, FIFO or hard link planted under `file_name`
+        by a container is never written through. The copy runs in the kernel
+        via `os.sendfile` for sources backed by a file descriptor.
+
+        Args:
+            volume: Docker volume to copy into
+            source: Path or seekable binary file object to copy
+            file_name: Name to store the file under
+            destination_path: Destination path within the volume
+
+        Returns:
+            True if the file was written, False if the mountpoint is not
+            writable from this process or the destination is not a plain file,
+            and the caller should fall back
+        """
+        mountpoint = volume.attrs.get("Mountpoint")
+        if not isinstance(mountpoint, str) or not os.access(mountpoint, os.W_OK):
+            return False
+        if os.open not in os.supports_dir_fd or file_name in ("", ".", ".."):
+            return False
+        if os.path.basename(file_name) != file_name:
+            return False
+
+        root = os.path.realpath(mountpoint)
+        dest_dir = os.path.realpath(os.path.join(root, destination_path.lstrip("/")))
+        if os.path.commonpath([root, dest_dir]) != root or not os.path.isdir(dest_dir):
+            return False
+
+        try:
+            dir_fd = os.open(dest_dir, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+        except OSError:
+            return False
+        try:
+            # No O_TRUNC: the file is only truncated once it is known to be a
+            # regular file with a single link. O_NONBLOCK keeps a FIFO from
+            # blocking the open (it fails with ENXIO instead)
+            dest_fd = os.open(
+                file_name,
+                os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW | os.O_NONBLOCK,
+                0o666,
+                dir_fd=dir_fd,
+            )
+        except OSError:
+            # ELOOP for a symlink, ENXIO for a FIFO, EISDIR for a directory
+            return False
+        finally:
+            os.close(dir_fd)
+
+        with os.fdopen(dest_fd, "wb") as dest_file:
+            dest_stat = os.fstat(dest_fd)
+            if not stat.S_ISREG(dest_stat.st_mode) or dest_stat.st_nlink != 1:
+                return False
+            os.ftruncate(dest_fd, 0)
+            if isinstance(source, str):
+                with open(source, "rb") as source_file:
+                    _copy_file_object(source_file, dest_file)
+            else:
+                _copy_file_object(source, dest_file)
+        return True
+
     def upload_zip_to_volume(
-        self, docker_volume_name: str, zip_path: str, destination_path: str = "/"
-    ) -> tuple[bool, str, int]:
+        self,
+        docker_volume_name: str,
+        zip_path: str | IO[bytes],
+        destination_path: str = "/",
+    ) -> tuple[bool, str, list[dict]]:
         """Extract and upload a ZIP file to a Docker volume.
 
         Args:
             docker_volume_name: Docker volume name
-            zip_path: Path to the ZIP file
+            zip_path: Path to the ZIP file, or a seekable binary file object
             destination_path: Destination path within the volume
 
         Returns:
-            Tuple of (success, message, file_count)
+            Tuple of (success, message, files_list), where each file entry has
+            the same shape as those returned by `list_volume_files`; the list
+            is empty on failure
         """
         try:
             # Verify volume exists
             self.client.volumes.get(docker_volume_name)
 
-            # Extract ZIP to temporary directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                try:
-                    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                        # Security check: prevent path traversal
-                        for member in zip_ref.namelist():
-                            if ".." in member or member.startswith("/"):
-                                return (
-                                    False,
-                                    f"Invalid ZIP file: path traversal detected in {member}",
-                                    0,
-                                )
-                        zip_ref.extractall(temp_dir)
-                except zipfile.BadZipFile:
-                    return False, "Invalid ZIP file", 0
-
-                # Count files
-                file_count = sum(1 for _ in Path(temp_dir).rglob("*") if _.is_file())
+            # Repack the ZIP as a tar in a single pass instead of extracting
+            # it to disk and then archiving the extracted tree again
+            try:
+                with zipfile.ZipFile(zip_path, "r") as zip_ref:
+                    # Security check: prevent path traversal
+                    for member in zip_ref.namelist():
+                        if ".." in member or member.startswith("/"):
+                            return (
+                                False,
+                                f"Invalid ZIP file: path traversal detected in {member}",
+                                [],
+                            )
+                    tar_path, file_members = self._create_tar_archive_from_zip(zip_ref)
+            except zipfile.BadZipFile:
+                return False, "Invalid ZIP file", []
 
+            try:
                 # Create a temporary container to mount the volume and copy files
                 container_name = f"milkcrate-vol-upload-{os.urandom(4).hex()}"
 
@@ -203,25 +314,26 @@ class VolumeManager:
                     # Start the container
                     container.start()
 
-                    # Create tar archive of extracted files
-                    tar_path = self._create_tar_archive(temp_dir)
-
-                    try:
-                        # Copy files to container
-                        with open(tar_path, "rb") as tar_file:
-                            container.put_archive(
-                                path=f"/volume{destination_path}", data=tar_file
-                            )
-
-                        return (
-                            True,
-                            f"ZIP extracted successfully ({file_count} files)",
-                            file_count,
+                    # Copy files to container
+                    with open(tar_path, "rb") as tar_file:
+                        container.put_archive(
+                            path=f"/volume{destination_path}", data=tar_file
                         )
-                    finally:
-                        # Clean up tar file
-                        if os.path.exists(tar_path):
-                            os.remove(tar_path)
+
+                    base_path = destination_path.rstrip("/")
+                    files = [
+                        {
+                            "path": f"{base_path}/{member.filename}",
+                            "name": os.path.basename(member.filename),
+                            "size": member.file_size,
+                        }
+                        for member in file_members
+                    ]
+                    return (
+                        True,
+                        f"ZIP extracted successfully ({len(files)} files)",
+                        files,
+                    )
 
                 finally:
                     # Clean up container
@@ -234,12 +346,19 @@ class VolumeManager:
                     except Exception:
                         pass
 
+            finally:
+                # Clean up tar file
+                try:
+                    os.unlink(tar_path)
+                except FileNotFoundError:
+                    pass
+
         except NotFound:
-            return False, f"Volume {docker_volume_name} not found", 0
+            return False, f"Volume {docker_volume_name} not found", []
         except APIError as e:
-            return False, f"Docker API error: {e!s}", 0
+            return False, f"Docker API error: {e!s}", []
         except Exception as e:
-            return False, f"Error uploading ZIP: {e!s}", 0
+            return False, f"Error uploading ZIP: {e!s}", []
 
     def list_volume_files(
         self, docker_volume_name: str, path: str = "/"
@@ -265,7 +384,8 @@ class VolumeManager:
                 image="alpine:latest",
                 name=container_name,
                 volumes={docker_volume_name: {"bind": "/volume", "mode": "ro"}},
-                command=f"find /volume{path} -type f -exec stat -c '%n|%s' {{}} \\;",
+                # "{} +" batches paths into few stat calls instead of one per file
+                command=f"find /volume{path} -type f -exec stat -c '%n|%s' {{}} +",
             )
 
             try:
@@ -281,21 +401,7 @@ class VolumeManager:
                 # Get output before removing container
                 logs = container.logs(stdout=True, stderr=False).decode("utf-8")
 
-                files = []
-                for line in logs.strip().split("\n"):
-                    if line:
-                        parts = line.split("|")
-                        if len(parts) == 2:
-                            file_path, file_size = parts
-                            # Remove /volume prefix
-                            file_path = file_path.replace("/volume", "", 1)
-                            files.append(
-                                {
-                                    "path": file_path,
-                                    "name": os.path.basename(file_path),
-                                    "size": int(file_size),
-                                }
-                            )
+                files = list(_parse_file_listing(logs))
 
                 return True, f"Found {len(files)} files", files
 
@@ -341,11 +447,9 @@ class VolumeManager:
         Returns:
             Path to created tar archive
         """
-        import tarfile
-
         fd, tar_path = tempfile.mkstemp(suffix=".tar")
         os.close(fd)
-        with tarfile.open(tar_path, "w") as tar:
+        with tarfile.open(tar_path, "w", copybufsize=TAR_COPY_BUFSIZE) as tar:
             if os.path.isfile(path):
                 tar.add(path, arcname=os.path.basename(path))
             else:
@@ -356,6 +460,111 @@ class VolumeManager:
 
         return tar_path
 
+    def _create_tar_archive_from_zip(
+        self, zip_ref: zipfile.ZipFile
+    ) -> tuple[str, list[zipfile.ZipInfo]]:
+        """Repack the members of an open ZIP archive into a tar archive.
+
+        Args:
+            zip_ref: Open ZIP archive whose member names have been validated
+
+        Returns:
+            Tuple of (path to created tar archive, ZIP entries for regular files)
+        """
+        file_members = []
+        fd, tar_path = tempfile.mkstemp(suffix=".tar")
+        os.close(fd)
+        try:
+            with tarfile.open(tar_path, "w", copybufsize=TAR_COPY_BUFSIZE) as tar:
+                for member in zip_ref.infolist():
+                    info = tarfile.TarInfo(name=member.filename.rstrip("/"))
+                    info.mtime = int(time.mktime((*member.date_time, 0, 0, -1)))
+                    if member.is_dir():
+                        info.type = tarfile.DIRTYPE
+                        info.mode = 0o755
+                        tar.addfile(info)
+                        continue
+                    info.size = member.file_size
+                    with zip_ref.open(member) as source:
+                        tar.addfile(info, source)
+                    file_members.append(member)
+        except Exception:
+            os.remove(tar_path)
+            raise
+
+        return tar_path, file_members
+
+    def _create_tar_archive_from_stream(self, stream: IO[bytes], arcname: str) -> str:
+        """Create a tar archive holding the contents of a binary stream.
+
+        Args:
+            stream: Seekable binary file object to archive
+            arcname: Name of the file inside the archive
+
+        Returns:
+            Path to created tar archive
+        """
+        stream.seek(0, os.SEEK_END)
+        info = tarfile.TarInfo(name=arcname)
+        info.size = stream.tell()
+        info.mtime = int(time.time())
+        stream.seek(0)
+
+        fd, tar_path = tempfile.mkstemp(suffix=".tar")
+        os.close(fd)
+        with tarfile.open(tar_path, "w", copybufsize=TAR_COPY_BUFSIZE) as tar:
+            tar.addfile(info, stream)
+
+        return tar_path
+
+
+def _copy_file_object(source: IO[bytes], dest_file: IO[bytes]) -> None:
+    """Copy a seekable binary file object into an open destination file.
+
+    Uses `os.sendfile` when the source has a file descriptor and falls back to
+    a buffered copy for in-memory streams.
+    """
+    try:
+        source_fd = source.fileno()
+    except OSError:
+        # In-memory streams (io.UnsupportedOperation) have no descriptor
+        source_fd = None
+
+    source.seek(0)
+    if source_fd is None:
+        shutil.copyfileobj(source, dest_file, TAR_COPY_BUFSIZE)
+        return
+
+    size = os.fstat(source_fd).st_size
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dest_file.fileno(), source_fd, offset, size - offset)
+        if not sent:
+            break
+        offset += sent
+
+
+def _parse_file_listing(logs: str) -> Iterator[dict]:
+    """Yield file entries from `stat -c '%n|%s'` output, one line at a time.
+
+    Args:
+        logs: Output of the listing container
+
+    Yields:
+        Dicts with the file's path inside the volume, base name and size
+    """
+    for line in logs.splitlines():
+        file_path, sep, file_size = line.rpartition("|")
+        if not sep or not file_size.isdigit():
+            continue
+        # Remove /volume prefix
+        file_path = file_path.removeprefix("/volume")
+        yield {
+            "path": file_path,
+            "name": os.path.basename(file_path),
+            "size": int(file_size),
+        }
+
 
 @lru_cache(maxsize=1)
 def get_volume_manager() -> VolumeManager:
@@ -1,8 +1,27 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from blueprints.admin import get_docker_client
 from database import insert_app
 
 
+@pytest.fixture(autouse=True)
+def _reset_docker_client():
+    get_docker_client.cache_clear()
+    yield
+    get_docker_client.cache_clear()
+
+
+@pytest.fixture
+def inline_cleanup():
+    """Run background cleanup tasks synchronously within the request."""
+    executor = MagicMock()
+    executor.submit.side_effect = lambda fn, *args, **kwargs: fn(*args, **kwargs)
+    with patch("blueprints.admin._cleanup_executor", executor):
+        yield executor
+
+
 def test_dashboard_requires_login(client):
     res = client.get("/admin", follow_redirects=False)
     assert res.status_code in (302, 303)
@@ -15,7 +34,9 @@ def test_dashboard_renders_when_logged_in(logged_in_client):
 
 
 @patch("docker.from_env")
-def test_delete_app_happy_path(mock_from_env, flask_app, logged_in_client):
+def test_delete_app_happy_path(
+    mock_from_env, flask_app, logged_in_client, inline_cleanup
+):
     # Prepare a fake deployed app
     with flask_app.app_context():
         insert_app("demo", "cid123", "image:tag", "/demo", 8000, is_public=False)
@@ -37,6 +58,24 @@ def test_delete_app_happy_path(mock_from_env, flask_app, logged_in_client):
     # Redirect back to dashboard
     assert res.status_code in (302, 303)
 
+    inline_cleanup.submit.assert_called_once()
+    mock_container.stop.assert_called_once()
+    mock_container.remove.assert_called_once_with(force=True)
+    with flask_app.app_context():
+        assert get_all_apps() == []
+
+
+def test_dashboard_hides_apps_being_deleted(flask_app, logged_in_client):
+    from database import get_all_apps, update_app_status
+
+    with flask_app.app_context():
+        insert_app("vanishing", "cid999", "image:tag", "/vanishing", 8000)
+        update_app_status(get_all_apps()[0]["app_id"], "deleting")
+
+    res = logged_in_client.get("/admin")
+    assert res.status_code == 200
+    assert b"vanishing" not in res.data
+
 
 @patch("docker.from_env")
 def test_toggle_status_start_and_stop(mock_from_env, flask_app, logged_in_client):
@@ -68,3 +107,53 @@ def test_toggle_status_start_and_stop(mock_from_env, flask_app, logged_in_client
         f"/admin/toggle_status/{app_id}", follow_redirects=False
     )
     assert res2.status_code in (302, 303)
+
+
+@patch("docker.from_env")
+def test_delete_app_removes_recorded_extract_path(
+    mock_from_env, flask_app, logged_in_client, inline_cleanup, tmp_path
+):
+    extract_path = tmp_path / "extracted_apps" / "demo_20250101_000000"
+    extract_path.mkdir(parents=True)
+    (extract_path / "Dockerfile").write_text("FROM python:3.12-slim\n")
+
+    with flask_app.app_context():
+        insert_app(
+            "demo", "cid123", "image:tag", "/demo", 8000, extract_path=str(extract_path)
+        )
+
+    mock_from_env.return_value = MagicMock()
+
+    from database import get_all_apps
+
+    with flask_app.app_context():
+        app_id = get_all_apps()[0]["app_id"]
+
+    res = logged_in_client.post(f"/admin/delete/{app_id}", follow_redirects=False)
+    assert res.status_code in (302, 303)
+    assert not extract_path.exists()
+
+
+def test_status_badges_htmx_renders_apps(flask_app, logged_in_client):
+    with flask_app.app_context():
+        insert_app("badged", "cid321", "image:tag", "/badged", 8000)
+
+    res = logged_in_client.get("/admin/htmx/status-badges")
+    assert res.status_code == 200
+    assert b"badged" in res.data
+    assert b"alert-danger" not in res.data
+
+
+def test_status_badges_htmx_not_modified(flask_app, logged_in_client):
+    with flask_app.app_context():
+        insert_app("badged", "cid321", "image:tag", "/badged", 8000)
+
+    first = logged_in_client.get("/admin/htmx/status-badges")
+    etag = first.headers["ETag"]
+    assert "no-store" not in first.headers["Cache-Control"]
+
+    second = logged_in_client.get(
+        "/admin/htmx/status-badges", headers={"If-None-Match": etag}
+    )
+    assert second.status_code == 304
+    assert second.data == b""
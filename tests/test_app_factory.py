@@ -1,4 +1,7 @@
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+
+from milkcrate_core import create_app
 
 # create_app is exercised via the flask_app fixture in conftest
 
@@ -20,3 +23,21 @@ def test_error_handlers_registered(client):
     res = client.get("/does-not-exist", headers={"Accept": "text/html"})
     assert res.status_code == 404
     assert b"<!DOCTYPE" in res.data or b"Not Found" in res.data
+
+
+def test_template_bytecode_cache_enabled_by_config(tmp_path):
+    app = create_app(
+        {
+            "TESTING": True,
+            "SECRET_KEY": "test-secret",
+            "DATABASE": str(tmp_path / "test.sqlite"),
+            "TEMPLATE_BYTECODE_CACHE": True,
+        }
+    )
+
+    assert isinstance(app.jinja_env.bytecode_cache, FileSystemBytecodeCache)
+    assert (tmp_path / "jinja_cache").is_dir()
+
+
+def test_template_bytecode_cache_off_by_default(flask_app: Flask):
+    assert flask_app.jinja_env.bytecode_cache is None
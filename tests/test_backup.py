@@ -0,0 +1,172 @@
+import os
+import tarfile
+
+import pytest
+
+from services.backup import create_backup
+
+
+def _make_project(root):
+    (root / "instance").mkdir()
+    (root / "instance" / "milkcrate.sqlite").write_bytes(b"SQLite format 3\x00")
+    (root / "uploads").mkdir()
+    (root / "uploads" / ".gitkeep").write_text("")
+    (root / "uploads" / "app.zip").write_bytes(b"PK")
+
+
+def _archive_names(path):
+    with tarfile.open(path, "r:gz") as tar:
+        return sorted(tar.getnames())
+
+
+def test_create_backup_without_pigz(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    monkeypatch.setenv("PATH", "")
+
+    backup = create_backup(tmp_path, include_extracted=False)
+
+    assert _archive_names(backup) == [
+        "instance/milkcrate.sqlite",
+        "uploads",
+        "uploads/app.zip",
+    ]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="uses a shell script stand-in")
+def test_create_backup_pipes_through_pigz(tmp_path, monkeypatch):
+    _make_project(tmp_path)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "pigz-calls"
+    # Stand-in for pigz: record the call and compress stdin with gzip
+    pigz = bin_dir / "pigz"
+    pigz.write_text(f'#!/bin/sh\necho "$@" >> {calls}\nexec gzip -c\n')
+    pigz.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    backup = create_backup(tmp_path, include_extracted=False)
+
+    assert calls.read_text().startswith("-p ")
+    assert _archive_names(backup) == [
+        "instance/milkcrate.sqlite",
+        "uploads",
+        "uploads/app.zip",
+    ]
+
+
+def test_restore_backup_round_trip(tmp_path):
+    from services.backup import restore_backup
+
+    source = tmp_path / "source"
+    source.mkdir()
+    _make_project(source)
+    (source / "instance" / "audit.log").write_text("entry\n")
+    (source / "extracted_apps").mkdir()
+    (source / "extracted_apps" / "app_1").mkdir()
+    (source / "extracted_apps" / "app_1" / "app.py").write_text("print()")
+    backup = create_backup(source)
+
+    target = tmp_path / "target"
+    (target / "uploads").mkdir(parents=True)
+    (target / "uploads" / ".gitkeep").write_text("")
+    (target / "uploads" / "stale.zip").write_bytes(b"PK")
+
+    restore_backup(backup, target, restore_extracted=False)
+
+    assert (target / "instance" / "milkcrate.sqlite").exists()
+    assert (target / "instance" / "audit.log").read_text() == "entry\n"
+    assert sorted(p.name for p in (target / "uploads").iterdir()) == [
+        ".gitkeep",
+        "app.zip",
+    ]
+    assert not (target / "extracted_apps").exists()
+
+
+def test_restore_backup_rejects_corrupt_archive(tmp_path):
+    from services.backup import restore_backup
+
+    bad = tmp_path / "milkcrate_backup_20250101_000000.tar.gz"
+    bad.write_bytes(b"not a tarball")
+
+    with pytest.raises(tarfile.TarError, match="Invalid backup archive"):
+        restore_backup(bad, tmp_path)
+
+
+def test_clear_directory_keeps_gitkeep_and_symlink_targets(tmp_path):
+    from services.backup import _clear_directory
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("x")
+    uploads = tmp_path / "uploads"
+    (uploads / "app_1" / "nested").mkdir(parents=True)
+    (uploads / "app_1" / "nested" / "f.txt").write_text("x")
+    (uploads / "app.zip").write_bytes(b"PK")
+    (uploads / ".gitkeep").write_text("")
+    (uploads / "link").symlink_to(outside, target_is_directory=True)
+
+    _clear_directory(uploads)
+
+    assert [p.name for p in uploads.iterdir()] == [".gitkeep"]
+    assert (outside / "keep.txt").exists()
+
+
+def test_restore_backup_rejects_paths_outside_project(tmp_path):
+    import io
+
+    from services.backup import restore_backup
+
+    backup = tmp_path / "milkcrate_backup_20250101_000000.tar.gz"
+    with tarfile.open(backup, "w:gz") as tar:
+        info = tarfile.TarInfo("uploads/../../escaped.txt")
+        info.size = 1
+        tar.addfile(info, io.BytesIO(b"x"))
+
+    project = tmp_path / "project"
+    project.mkdir()
+    with pytest.raises(tarfile.TarError, match="Invalid backup archive"):
+        restore_backup(backup, project)
+
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_restore_backup_preserves_file_mode(tmp_path):
+    from services.backup import restore_backup
+
+    source = tmp_path / "source"
+    source.mkdir()
+    _make_project(source)
+    script = source / "uploads" / "run.sh"
+    script.write_text("#!/bin/sh\n")
+    script.chmod(0o755)
+    backup = create_backup(source)
+
+    target = tmp_path / "target"
+    target.mkdir()
+    restore_backup(backup, target)
+
+    restored = target / "uploads" / "run.sh"
+    assert restored.read_text() == "#!/bin/sh\n"
+    assert restored.stat().st_mode & 0o777 == 0o755
+    assert int(restored.stat().st_mtime) == int(script.stat().st_mtime)
+
+
+def test_restore_backup_rejects_unsafe_member_before_clearing(tmp_path):
+    import io
+
+    from services.backup import restore_backup
+
+    backup = tmp_path / "milkcrate_backup_20250101_000000.tar.gz"
+    with tarfile.open(backup, "w:gz") as tar:
+        for name in ("uploads/app.zip", "uploads/../../escaped.txt"):
+            info = tarfile.TarInfo(name)
+            info.size = 1
+            tar.addfile(info, io.BytesIO(b"x"))
+
+    project = tmp_path / "project"
+    (project / "uploads").mkdir(parents=True)
+    (project / "uploads" / "existing.zip").write_bytes(b"PK")
+    with pytest.raises(tarfile.TarError, match="Invalid backup archive"):
+        restore_backup(backup, project)
+
+    assert [p.name for p in (project / "uploads").iterdir()] == ["existing.zip"]
@@ -0,0 +1,53 @@
+import shutil
+from unittest.mock import patch
+
+from services.cleanup import _sweep_paths, remove_paths
+
+
+def test_sweep_paths_does_not_follow_symlinks(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("x")
+    target = tmp_path / "target"
+    (target / "tree" / "deep").mkdir(parents=True)
+    (target / "tree" / "deep" / "f.txt").write_text("x")
+    (target / "file.txt").write_text("x")
+    (target / "link").symlink_to(outside, target_is_directory=True)
+
+    _sweep_paths([target / "tree", target / "file.txt", target / "link"])
+
+    assert list(target.iterdir()) == []
+    assert (outside / "keep.txt").exists()
+
+
+def test_remove_paths_splits_paths_across_rm_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr("services.cleanup.RM_PARALLELISM", 3)
+    paths = []
+    for i in range(7):
+        path = tmp_path / f"app_{i}"
+        (path / "src").mkdir(parents=True)
+        (path / "src" / "main.py").write_text("x")
+        paths.append(path)
+
+    with patch("services.cleanup._sweep_paths") as sweep:
+        remove_paths(paths)
+
+    assert list(tmp_path.iterdir()) == []
+    if shutil.which("rm"):
+        sweep.assert_not_called()
+
+
+def test_sweep_paths_in_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr("services.cleanup.REMOVE_WORKERS", 4)
+    targets = []
+    for i in range(10):
+        cache = tmp_path / f"pkg{i}" / "__pycache__"
+        cache.mkdir(parents=True)
+        (cache / "mod.cpython-312.pyc").write_bytes(b"")
+        (tmp_path / f"pkg{i}" / "stray.pyc").write_bytes(b"")
+        targets += [cache, tmp_path / f"pkg{i}" / "stray.pyc"]
+
+    _sweep_paths(targets)
+
+    assert all(not path.exists() for path in targets)
+    assert len(list(tmp_path.iterdir())) == 10
@@ -0,0 +1,356 @@
+from milkcrate_core.cli import (
+    _find_cache_entries,
+    _iter_package_files,
+    clean_build_cache,
+    clean_directory,
+    clean_python_cache,
+)
+
+
+def test_cache_cleanup_walks_tree_once(tmp_path):
+    (tmp_path / "pkg" / "__pycache__").mkdir(parents=True)
+    (tmp_path / "pkg" / "__pycache__" / "mod.cpython-312.pyc").write_bytes(b"")
+    (tmp_path / "pkg" / "stray.pyc").write_bytes(b"")
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    (tmp_path / "milkcrate.egg-info").mkdir()
+    (tmp_path / ".pytest_cache").mkdir()
+    (tmp_path / ".coverage.host.1").write_text("")
+    # Exact cache names only count at the project root
+    (tmp_path / "pkg" / "build").mkdir()
+
+    python_cache, build_cache = _find_cache_entries(tmp_path)
+    clean_python_cache(tmp_path, python_cache)
+    clean_build_cache(tmp_path, build_cache)
+
+    remaining = sorted(
+        str(p.relative_to(tmp_path)).replace("\\", "/") for p in tmp_path.rglob("*")
+    )
+    assert remaining == ["pkg", "pkg/build", "pkg/mod.py"]
+
+
+def test_clean_directory_keeps_gitkeep(tmp_path):
+    uploads = tmp_path / "uploads"
+    (uploads / "app_1" / "nested").mkdir(parents=True)
+    (uploads / "app_1" / "nested" / "file.txt").write_text("x")
+    (uploads / "app.zip").write_bytes(b"PK")
+    (uploads / ".gitkeep").write_text("")
+
+    clean_directory(uploads, "uploads")
+
+    assert [p.name for p in uploads.iterdir()] == [".gitkeep"]
+
+
+def test_package_files_prune_excluded_directories(tmp_path):
+    for rel in (
+        "app.py",
+        "Dockerfile",
+        "src/views.py",
+        "src/__pycache__/views.cpython-312.pyc",
+        ".venv/lib/site.py",
+        "node_modules/pkg/index.js",
+        "docs/build/index.html",
+        "server.log",
+        "app.zip",
+        "myvenvtools.py",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    excludes = {".venv", "node_modules", "__pycache__", "*.log", "docs/build"}
+    arcnames = sorted(
+        arcname for _, arcname in _iter_package_files(tmp_path, excludes, "app.zip")
+    )
+
+    assert arcnames == ["Dockerfile", "app.py", "myvenvtools.py", "src/views.py"]
+
+
+def test_package_stores_precompressed_files(tmp_path, monkeypatch):
+    import zipfile
+
+    from click.testing import CliRunner
+
+    from milkcrate_core.cli import cli
+
+    (tmp_path / "Dockerfile").write_text("FROM python:3.12\n" * 50)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" + bytes(2048))
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(cli, ["package", "--output", "out.zip"])
+
+    assert result.exit_code == 0, result.output
+    with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+        types = {info.filename: info.compress_type for info in zf.infolist()}
+    assert types == {
+        "Dockerfile": zipfile.ZIP_DEFLATED,
+        "logo.png": zipfile.ZIP_STORED,
+    }
+
+
+def test_package_compression_stored(tmp_path, monkeypatch):
+    import zipfile
+
+    from click.testing import CliRunner
+
+    from milkcrate_core.cli import cli
+
+    (tmp_path / "Dockerfile").write_text("FROM python:3.12\n" * 50)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(
+        cli, ["package", "--output", "out.zip", "--compression", "stored"]
+    )
+
+    assert result.exit_code == 0, result.output
+    with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+        assert [i.compress_type for i in zf.infolist()] == [zipfile.ZIP_STORED]
+
+
+def test_find_project_root_cached_per_working_directory(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    from milkcrate_core.cli import find_project_root
+
+    (tmp_path / "app.py").write_text("")
+    (tmp_path / "pyproject.toml").write_text("")
+    (tmp_path / "milkcrate_core").mkdir()
+    (tmp_path / "sub").mkdir()
+
+    monkeypatch.chdir(tmp_path / "sub")
+    assert find_project_root() == tmp_path
+    with patch("milkcrate_core.cli.Path.exists") as exists:
+        assert find_project_root() == tmp_path
+    exists.assert_not_called()
+
+    monkeypatch.chdir(tmp_path)
+    assert find_project_root() == tmp_path
+
+
+def test_run_streams_dev_server_output(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    from click.testing import CliRunner
+
+    from milkcrate_core.cli import _find_project_root_from, cli
+
+    _find_project_root_from.cache_clear()
+    (tmp_path / "app.py").write_text("")
+    (tmp_path / "pyproject.toml").write_text("")
+    (tmp_path / "milkcrate_core").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    with patch("milkcrate_core.cli.subprocess.run") as run:
+        result = CliRunner().invoke(cli, ["run"])
+
+    assert result.exit_code == 0, result.output
+    run.assert_called_once_with(
+        ["uv", "run", "python3", "app.py"], cwd=tmp_path, check=True
+    )
+
+
+def test_package_files_match_glob_patterns(tmp_path):
+    for rel in (
+        "app.py",
+        "notes.tmp",
+        "src/cache.tmp",
+        "src/keep.py",
+        "static/gen/bundle.js",
+        "static/site.css",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+    excludes = {"*.tmp", "static/g?n"}
+    arcnames = sorted(
+        arcname for _, arcname in _iter_package_files(tmp_path, excludes, "app.zip")
+    )
+
+    assert arcnames == ["app.py", "src/keep.py", "static/site.css"]
+
+
+def test_check_prerequisites_reports_in_order(capsys):
+    from unittest.mock import patch
+
+    from milkcrate_core.cli import check_prerequisites
+
+    with (
+        patch("milkcrate_core.cli._check_uv", return_value=(True, "uv ok")),
+        patch("milkcrate_core.cli._check_python", return_value=(True, "py ok")),
+        patch("milkcrate_core.cli._check_docker", return_value=(False, "no docker")),
+    ):
+        assert check_prerequisites() is False
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:2] == ["uv ok", "py ok"]
+    assert lines[-1] == "no docker"
+
+
+def test_stored_entries_round_trip(tmp_path, monkeypatch):
+    import zipfile
+
+    from milkcrate_core.cli import _write_stored
+
+    monkeypatch.setattr("milkcrate_core.cli.PACKAGE_COPY_CHUNK_SIZE", 1000)
+    payload = bytes(range(256)) * 40
+    (tmp_path / "blob.bin").write_bytes(payload)
+
+    with zipfile.ZipFile(tmp_path / "out.zip", "w") as zf:
+        _write_stored(zf, str(tmp_path / "blob.bin"), "blob.bin")
+
+    with zipfile.ZipFile(tmp_path / "out.zip") as zf:
+        assert zf.testzip() is None
+        assert zf.getinfo("blob.bin").compress_type == zipfile.ZIP_STORED
+        assert zf.read("blob.bin") == payload
+
+
+def test_check_docker_pings_unix_socket(tmp_path, monkeypatch):
+    import socket
+    import threading
+
+    import pytest
+
+    from milkcrate_core.cli import _check_docker
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("unix sockets not available")
+
+    socket_path = str(tmp_path / "docker.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            conn.recv(1024)
+            conn.sendall(b"HTTP/1.0 200 OK\r\nContent-Length: 2\r\n\r\nOK")
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+    try:
+        ok, _ = _check_docker()
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+    assert ok is True
+
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{tmp_path / 'missing.sock'}")
+    assert _check_docker()[0] is False
+
+
+def test_clean_directory_lists_items_only_when_verbose(tmp_path, capsys):
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    (uploads / "a.zip").write_bytes(b"PK")
+
+    clean_directory(uploads, "uploads")
+    quiet = capsys.readouterr().out
+    assert "Removed: a.zip" not in quiet
+    assert "1 item(s) removed" in quiet
+
+    (uploads / "b.zip").write_bytes(b"PK")
+    clean_directory(uploads, "uploads", verbose=True)
+    assert "Removed: b.zip" in capsys.readouterr().out
+
+
+def test_project_root_resolved_once_per_invocation(tmp_path):
+    from unittest.mock import patch
+
+    import click
+
+    from milkcrate_core.cli import cli, get_project_root
+
+    with patch(
+        "milkcrate_core.cli.find_project_root", return_value=tmp_path
+    ) as find_root:
+        with click.Context(cli) as ctx:
+            with click.Context(cli, parent=ctx):
+                assert get_project_root() == tmp_path
+            assert get_project_root() == tmp_path
+
+    find_root.assert_called_once()
+
+
+def test_reset_database_builds_a_single_app(tmp_path, monkeypatch):
+    from unittest.mock import MagicMock, patch
+
+    from milkcrate_core.cli import reset_database
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "instance").mkdir()
+    (tmp_path / "instance" / "milkcrate.sqlite").write_bytes(b"")
+
+    with (
+        patch("milkcrate_core.create_app", return_value=MagicMock()) as create_app,
+        patch("database.init_db") as db_init,
+    ):
+        reset_database(tmp_path)
+
+    create_app.assert_called_once_with()
+    db_init.assert_called_once_with()
+    assert not (tmp_path / "instance" / "milkcrate.sqlite").exists()
+
+
+def test_probe_dev_server_reads_status_line(monkeypatch):
+    import socket
+    import threading
+
+    from milkcrate_core.cli import _probe_dev_server
+
+    server = socket.create_server(("127.0.0.1", 0))
+    monkeypatch.setattr("milkcrate_core.cli.DEV_SERVER_ADDRESS", server.getsockname())
+
+    def serve():
+        conn, _ = server.accept()
+        with conn:
+            conn.recv(1024)
+            conn.sendall(b"HTTP/1.1 302 FOUND\r\nLocation: /app\r\n\r\n")
+
+    thread = threading.Thread(target=serve)
+    thread.start()
+    try:
+        assert _probe_dev_server() == 302
+    finally:
+        thread.join(timeout=5)
+        server.close()
+
+    assert _probe_dev_server(timeout=0.5) is None
+
+
+def test_clean_skips_prompt_for_empty_directories(tmp_path):
+    from unittest.mock import patch
+
+    from click.testing import CliRunner
+
+    from milkcrate_core.cli import cli
+
+    (tmp_path / "uploads").mkdir()
+    (tmp_path / "uploads" / ".gitkeep").write_text("")
+
+    with patch("milkcrate_core.cli.get_project_root", return_value=tmp_path):
+        result = CliRunner().invoke(cli, ["clean", "--uploads", "--extracted"])
+
+    assert result.exit_code == 0, result.output
+    assert "Continue?" not in result.output
+    assert "uploads directory already clean" in result.output
+    assert "extracted_apps directory already clean" in result.output
+
+
+def test_run_command_decodes_output_as_utf8(capsys):
+    import sys
+
+    from milkcrate_core.cli import run_command
+
+    result = run_command(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.buffer.write(b'caf\\xc3\\xa9 \\xff\\n')",
+        ]
+    )
+
+    assert isinstance(result.stdout, bytes)
+    assert capsys.readouterr().out == "café �\n"
@@ -126,6 +126,23 @@ def test_get_main_service_with_label():
     assert service_config["build"] == "./api"
 
 
+def test_get_main_service_with_list_labels():
+    """List-format labels mark the main service too."""
+    compose_data = {
+        "services": {
+            "db": {"image": "postgres:13", "labels": ["tier=data"]},
+            "web": {
+                "build": ".",
+                "labels": ["tier=front", "milkcrate.main_service=true"],
+            },
+        }
+    }
+
+    service_name, _ = get_main_service(compose_data)
+
+    assert service_name == "web"
+
+
 def test_extract_service_port_from_ports():
     """Test extracting port from ports mapping."""
     service_config = {"ports": ["8000:8000"]}
@@ -206,3 +223,67 @@ def test_get_compose_services_info():
     assert info["total_services"] == 2
     assert "app" in info["service_names"]
     assert "db" in info["service_names"]
+
+
+def test_write_docker_compose_round_trip(tmp_path):
+    """Compose data written back out parses to the same structure."""
+    from services.compose_parser import write_docker_compose
+
+    data = {
+        "services": {
+            "web": {"build": ".", "ports": ["8000:8000"], "labels": {"a": "é"}}
+        },
+        "networks": {"milkcrate": {"external": True}},
+    }
+    path = tmp_path / "docker-compose-modified.yml"
+
+    write_docker_compose(data, str(path))
+    is_valid, error, parsed = parse_docker_compose(str(path))
+
+    assert is_valid, error
+    assert parsed == data
+
+
+def test_compose_parser_prefers_libyaml():
+    """The C safe loader is used whenever PyYAML was built with libyaml."""
+    import yaml
+
+    from services import compose_parser
+
+    expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+    assert compose_parser._YAML_LOADER is expected
+
+
+def test_parse_docker_compose_cached_until_file_changes(tmp_path):
+    """Unchanged files are parsed once; edits and caller mutations are isolated."""
+    from unittest.mock import patch
+
+    import yaml
+
+    path = tmp_path / "docker-compose.yml"
+    path.write_text("services:\n  web:\n    build: .\n")
+
+    with patch("services.compose_parser.yaml.load", wraps=yaml.load) as load:
+        _, _, first = parse_docker_compose(str(path))
+        first["services"]["web"]["build"] = "mutated"
+        _, _, second = parse_docker_compose(str(path))
+        assert load.call_count == 1
+        assert second["services"]["web"]["build"] == "."
+
+        path.write_text("services:\n  api:\n    image: nginx\n")
+        os.utime(path, ns=(0, 10**18))
+        _, _, third = parse_docker_compose(str(path))
+        assert load.call_count == 2
+        assert list(third["services"]) == ["api"]
+
+
+def test_parse_docker_compose_invalid_encoding(tmp_path):
+    """Test that a compose file that is not UTF-8 is reported, not raised."""
+    compose_path = tmp_path / "docker-compose.yml"
+    compose_path.write_bytes(b"services:\n  app:\n    image: caf\xe9\n")
+
+    is_valid, error, data = parse_docker_compose(str(compose_path))
+
+    assert not is_valid
+    assert "Error reading docker-compose.yml" in error
+    assert data is None
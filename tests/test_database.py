@@ -37,3 +37,329 @@ def test_crud_flow(flask_app):
 
         delete_app(app_id)
         assert get_app_by_id(app_id) is None
+
+
+def test_all_volumes_cached_until_volume_write(flask_app):
+    from database import (
+        get_all_volumes,
+        get_db,
+        insert_volume,
+        update_volume_stats,
+    )
+
+    with flask_app.app_context():
+        volume_id = insert_volume("data", "milkcrate-vol-data")
+        assert [v["volume_name"] for v in get_all_volumes()] == ["data"]
+
+        # Writes that bypass the helpers are not seen until the TTL expires
+        get_db().execute("UPDATE volumes SET description = 'changed'")
+        assert get_all_volumes()[0]["description"] is None
+
+        update_volume_stats(volume_id, 3, 30)
+        refreshed = get_all_volumes()[0]
+        assert refreshed["description"] == "changed"
+        assert refreshed["file_count"] == 3
+
+
+def test_volume_lookup_memoized_until_volume_write(flask_app):
+    from unittest.mock import patch
+
+    from database import get_db, get_volume_by_id, insert_volume, update_volume_stats
+
+    with flask_app.app_context():
+        volume_id = insert_volume("data", "milkcrate-vol-data")
+        first = get_volume_by_id(volume_id)
+
+        with patch("database.get_db", wraps=get_db) as mock_get_db:
+            assert get_volume_by_id(volume_id) is first
+        mock_get_db.assert_not_called()
+
+        update_volume_stats(volume_id, 2, 20)
+        assert get_volume_by_id(volume_id)["file_count"] == 2
+
+
+def test_connection_uses_wal_and_enforces_foreign_keys(flask_app):
+    from database import (
+        delete_volume,
+        get_db,
+        get_volume_files,
+        insert_volume,
+        insert_volume_file,
+    )
+
+    with flask_app.app_context():
+        db = get_db()
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+        volume_id = insert_volume("data", "milkcrate-vol-data")
+        insert_volume_file(volume_id, "a.txt", "/a.txt", 3)
+        delete_volume(volume_id)
+        assert get_volume_files(volume_id) == []
+
+
+def test_old_schema_migrated_once_per_process(flask_app, tmp_path):
+    import sqlite3
+    from unittest.mock import patch
+
+    from database import get_db
+
+    legacy = tmp_path / "legacy.sqlite"
+    conn = sqlite3.connect(legacy)
+    conn.execute(
+        "CREATE TABLE deployed_apps (app_id INTEGER PRIMARY KEY, app_name TEXT,"
+        " container_id TEXT, image_tag TEXT, public_route TEXT,"
+        " internal_port INTEGER, status TEXT, deployment_date TEXT)"
+    )
+    conn.commit()
+    conn.close()
+    flask_app.config["DATABASE"] = str(legacy)
+
+    with flask_app.app_context():
+        db = get_db()
+        columns = {row[1] for row in db.execute("PRAGMA table_info(deployed_apps)")}
+        assert {"is_public", "deployment_type", "extract_path"} <= columns
+        tables = {
+            row[0]
+            for row in db.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        assert {"settings", "volumes", "volume_files"} <= tables
+
+    with (
+        patch("database._apply_incremental_migrations") as migrate,
+        flask_app.app_context(),
+    ):
+        get_db()
+    migrate.assert_not_called()
+
+
+def test_bulk_volume_file_insert(flask_app):
+    from database import get_volume_files, insert_volume, insert_volume_files_bulk
+
+    files = [
+        {"name": f"f{i}.txt", "path": f"/dir/f{i}.txt", "size": i} for i in range(500)
+    ]
+    with flask_app.app_context():
+        volume_id = insert_volume("data", "milkcrate-vol-data")
+        insert_volume_files_bulk(volume_id, files)
+
+        rows = get_volume_files(volume_id)
+        assert len(rows) == 500
+        assert sum(row["file_size_bytes"] for row in rows) == sum(range(500))
+
+
+def test_record_volume_uploads_replaces_overwritten_files(flask_app):
+    from database import (
+        get_volume_by_id,
+        get_volume_files,
+        insert_volume,
+        record_volume_uploads,
+    )
+
+    with flask_app.app_context():
+        volume_id = insert_volume("data", "milkcrate-vol-data")
+        record_volume_uploads(
+            volume_id,
+            [
+                {"name": "a.txt", "path": "/a.txt", "size": 10},
+                {"name": "b.txt", "path": "/b.txt", "size": 5},
+            ],
+        )
+        record_volume_uploads(
+            volume_id,
+            [
+                {"name": "a.txt", "path": "/a.txt", "size": 3},
+                {"name": "c.txt", "path": "/c.txt", "size": 1},
+            ],
+        )
+
+        volume = get_volume_by_id(volume_id)
+        assert (volume["file_count"], volume["total_size_bytes"]) == (3, 9)
+        sizes = {
+            row["file_path"]: row["file_size_bytes"]
+            for row in get_volume_files(volume_id)
+        }
+        assert sizes == {"/a.txt": 3, "/b.txt": 5, "/c.txt": 1}
+
+
+def test_app_statuses_probed_concurrently(flask_app):
+    import threading
+    from unittest.mock import MagicMock, patch
+
+    from database import get_all_apps_with_real_status
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def probe(**kwargs):
+        # Only completes if all three probes are in flight at once
+        barrier.wait()
+        return {
+            "status": "ready",
+            "display_status": "Ready",
+            "badge_color": "success",
+            "last_checked": "now",
+        }
+
+    manager = MagicMock()
+    manager.get_container_statuses.return_value = {}
+    manager.get_comprehensive_status.side_effect = probe
+
+    with flask_app.app_context():
+        for i in range(3):
+            insert_app(f"app{i}", f"cid{i}", "image:tag", f"/app{i}", 8000)
+
+        with patch("services.status_manager.get_status_manager", return_value=manager):
+            apps = get_all_apps_with_real_status()
+
+    assert [app["real_status"] for app in apps] == ["ready"] * 3
+
+
+def test_settings_cached_until_updated(flask_app):
+    from unittest.mock import patch
+
+    from database import (
+        get_db,
+        get_setting,
+        set_admin_password,
+        update_setting,
+        verify_admin_password,
+    )
+
+    with flask_app.app_context():
+        update_setting("theme", "dark")
+        assert get_setting("theme") == "dark"
+
+        with patch("database.get_db", wraps=get_db) as mock_get_db:
+            assert get_setting("theme") == "dark"
+        mock_get_db.assert_not_called()
+
+        update_setting("theme", "light")
+        assert get_setting("theme") == "light"
+
+        assert verify_admin_password("admin")
+        set_admin_password("N3w-Passw0rd!")
+        assert verify_admin_password("N3w-Passw0rd!")
+
+
+def test_route_exists(flask_app):
+    from database import route_exists
+
+    with flask_app.app_context():
+        assert not route_exists("/demo")
+        insert_app("demo", "cid123", "image:tag", "/demo", 8000)
+        assert route_exists("/demo")
+        assert not route_exists("/dem")
+
+
+def test_app_listings_use_date_indexes(flask_app):
+    from database import get_db
+
+    with flask_app.app_context():
+        db = get_db()
+        plan = " ".join(
+            row[3]
+            for row in db.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM deployed_apps"
+                " WHERE is_public = 1 ORDER BY deployment_date DESC"
+            )
+        )
+        assert "idx_public_only" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_close_db_runs_optimize(flask_app):
+    import sqlite3
+    from unittest.mock import MagicMock
+
+    from flask import g
+
+    from database import close_db
+
+    with flask_app.app_context():
+        g.db = MagicMock()
+        db = g.db
+        db.execute.side_effect = sqlite3.OperationalError("database is locked")
+        close_db()
+
+    db.execute.assert_called_once_with("PRAGMA optimize")
+    db.close.assert_called_once()
+
+
+def test_connections_reused_across_requests(flask_app):
+    from database import get_db
+
+    with flask_app.app_context():
+        first = get_db()
+        first.execute("INSERT INTO settings (setting_key) VALUES ('uncommitted')")
+
+    with flask_app.app_context():
+        second = get_db()
+        assert second is first
+        # Work left uncommitted by the previous request was rolled back
+        assert not second.in_transaction
+        row = second.execute(
+            "SELECT 1 FROM settings WHERE setting_key = 'uncommitted'"
+        ).fetchone()
+        assert row is None
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(flask_app):
+    import pytest
+
+    from database import (
+        get_volume_by_id,
+        get_volume_files,
+        insert_volume,
+        insert_volume_file,
+        transaction,
+        update_volume_stats_delta,
+    )
+
+    with flask_app.app_context():
+        volume_id = insert_volume("data", "milkcrate-vol-data")
+
+        def failing_upload():
+            with transaction():
+                insert_volume_file(volume_id, "a.txt", "/a.txt", 3)
+                update_volume_stats_delta(volume_id, 1, 3)
+                raise RuntimeError("upload bookkeeping failed")
+
+        with pytest.raises(RuntimeError):
+            failing_upload()
+
+        assert get_volume_files(volume_id) == []
+        assert get_volume_by_id(volume_id)["file_count"] == 0
+
+        with transaction() as db:
+            insert_volume_file(volume_id, "a.txt", "/a.txt", 3)
+            # Nothing is committed until the block exits
+            assert db.in_transaction
+        assert not db.in_transaction
+        assert len(get_volume_files(volume_id)) == 1
+
+
+def test_real_status_listing_keeps_columns_the_dashboard_reads(flask_app):
+    from unittest.mock import patch
+
+    from database import get_all_apps_with_real_status
+
+    with flask_app.app_context():
+        insert_app("demo", "cid123", "image:tag", "/demo", 8000)
+        with patch(
+            "services.status_manager.get_status_manager",
+            side_effect=RuntimeError("docker unavailable"),
+        ):
+            (app,) = get_all_apps_with_real_status()
+
+    for column in (
+        "app_id",
+        "app_name",
+        "container_id",
+        "image_tag",
+        "public_route",
+        "internal_port",
+        "deployment_date",
+        "status",
+    ):
+        assert column in app
+    assert app["last_status_check"] == "Status checking unavailable"
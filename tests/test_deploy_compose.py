@@ -1,11 +1,18 @@
 """Tests for docker-compose deployment functionality."""
 
+import io
 import os
 import tempfile
 import zipfile
 from unittest.mock import MagicMock, patch
 
-from services.deploy import detect_deployment_type, extract_zip_safely
+from werkzeug.utils import secure_filename
+
+from services.deploy import (
+    detect_deployment_type,
+    extract_zip_safely,
+    upload_filename,
+)
 
 
 def test_detect_deployment_type_dockerfile():
@@ -108,6 +115,22 @@ def test_extract_zip_safely_with_both():
         assert os.path.exists(os.path.join(extract_path, "app.py"))
 
 
+def test_extract_zip_safely_from_stream():
+    """Test extracting a ZIP from an in-memory stream, as uploads do."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("Dockerfile", "FROM python:3.12-slim\n")
+        buffer.seek(0)
+
+        extract_path = os.path.join(temp_dir, "extracted")
+        result = extract_zip_safely(buffer, extract_path)
+
+        assert result is True
+        assert os.path.exists(os.path.join(extract_path, "Dockerfile"))
+        assert not buffer.closed
+
+
 def test_extract_zip_safely_neither():
     """Test extracting ZIP with neither Dockerfile nor docker-compose.yml."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -152,6 +175,20 @@ def test_extract_zip_safely_path_traversal():
         assert result is False
 
 
+def test_upload_filename_matches_secure_filename():
+    """Test that the fast path agrees with secure_filename."""
+    names = [
+        "my-app_1.0.zip",
+        "APP.zip",
+        "..app.zip",
+        "my app.zip",
+        "../../etc/passwd.zip",
+        "caf\u00e9.zip",
+    ]
+    for name in names:
+        assert upload_filename(name) == secure_filename(name)
+
+
 @patch("services.deploy.deploy_docker_compose")
 def test_deploy_application_detects_compose(mock_deploy_compose):
     """Test that deploy_application detects and calls docker-compose deployment."""
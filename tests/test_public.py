@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from database import insert_app
 
 
@@ -21,3 +23,35 @@ def test_index_respects_default_home_route(flask_app, client):
     res = client.get("/", follow_redirects=False)
     assert res.status_code in (302, 303)
     assert res.headers["Location"].endswith("/my-app")
+
+
+def test_index_redirect_skips_app_listing(flask_app, client):
+    flask_app.config.update({"DEFAULT_HOME_ROUTE": "/my-app"})
+    with patch("blueprints.public.get_app_listing") as mock_get_app_listing:
+        res = client.get("/", follow_redirects=False)
+    assert res.status_code in (302, 303)
+    mock_get_app_listing.assert_not_called()
+
+
+def test_index_follows_updated_default_home_route(flask_app, client):
+    from database import get_default_home_route, set_default_home_route
+
+    with flask_app.app_context():
+        assert get_default_home_route() == ""
+        set_default_home_route("/new-home")
+
+    res = client.get("/", follow_redirects=False)
+    assert res.status_code in (302, 303)
+    assert res.headers["Location"].endswith("/new-home")
+
+
+def test_index_lists_installed_apps(flask_app, client):
+    from database import insert_app
+
+    with flask_app.app_context():
+        insert_app("demo", "cid123", "image:tag", "/demo", 8000)
+
+    res = client.get("/")
+    assert res.status_code == 200
+    assert b"demo" in res.data
+    assert b'href="/demo"' in res.data
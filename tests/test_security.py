@@ -1,10 +1,20 @@
 """Tests for security features including validation, audit logging, and password hashing."""
 
+import logging
 import os
+import queue
+import threading
 from unittest.mock import patch
 
 from database import set_admin_password, verify_admin_password
-from services.audit import log_admin_action
+from services.audit import (
+    AuditQueueHandler,
+    _dumps,
+    _json_dumps,
+    audit_logger,
+    get_audit_logs,
+    log_admin_action,
+)
 from services.security import SecurityHeaders
 from services.validation import (
     validate_and_sanitize_app_input,
@@ -31,11 +41,27 @@ class TestPasswordHashing:
             assert not verify_admin_password("WrongPassword")
             assert not verify_admin_password("")
 
+    def test_password_hash_method_is_configurable(self, flask_app):
+        """Test that the configured hash method is used for new passwords."""
+        from database import get_setting
+
+        with flask_app.app_context():
+            with patch("database.PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000"):
+                set_admin_password("TestPassword123!")
+
+            assert get_setting("admin_password").startswith("pbkdf2:sha256:1000$")
+            assert verify_admin_password("TestPassword123!")
+
     def test_environment_override_password(self, flask_app):
         """Test environment variable override for admin password."""
         with flask_app.app_context():
             # Set environment variable
-            with patch.dict(os.environ, {"MILKCRATE_ADMIN_PASSWORD": "EnvPassword123"}):
+            # The variable is read at import, so patch the snapshot
+            with patch.multiple(
+                "database",
+                _ENV_ADMIN_PASSWORD="EnvPassword123",
+                ENV_ADMIN_PASSWORD_OVERRIDE=True,
+            ):
                 # Environment password should work
                 assert verify_admin_password("EnvPassword123")
 
@@ -44,6 +70,36 @@ class TestPasswordHashing:
                 assert verify_admin_password("EnvPassword123")
                 assert not verify_admin_password("DatabasePassword456!")
 
+    def test_repeated_failed_password_skips_hash_check(self, flask_app):
+        """Test that a recently rejected guess is not hashed again."""
+        with flask_app.app_context():
+            set_admin_password("TestPassword123!")
+
+            with patch(
+                "database.check_password_hash", return_value=False
+            ) as mock_check:
+                assert not verify_admin_password("RepeatedGuess")
+                assert not verify_admin_password("RepeatedGuess")
+            assert mock_check.call_count == 1
+
+            # A new password invalidates earlier failures for the same guess
+            set_admin_password("RepeatedGuess")
+            assert verify_admin_password("RepeatedGuess")
+
+    def test_repeated_correct_password_skips_hash_check(self, flask_app):
+        """Test that a recently verified password is not hashed again."""
+        with flask_app.app_context():
+            set_admin_password("TestPassword123!")
+            assert verify_admin_password("TestPassword123!")
+
+            with patch("database.check_password_hash") as mock_check:
+                assert verify_admin_password("TestPassword123!")
+            mock_check.assert_not_called()
+
+            # Changing the password drops the remembered success
+            set_admin_password("OtherPassword456!")
+            assert not verify_admin_password("TestPassword123!")
+
 
 class TestInputValidation:
     """Test input validation and sanitization."""
@@ -235,6 +291,197 @@ class TestAuditLogging:
                     f"Log should contain error message, got: {log_content}"
                 )
 
+    def test_queued_actions_visible_in_audit_logs(self, flask_app):
+        """Queued audit records are flushed before logs are read back."""
+        with flask_app.test_request_context("/admin"):
+            log_admin_action(
+                action="queued_action",
+                resource_type="application",
+                resource_id="queued-app",
+            )
+
+            logs = get_audit_logs(limit=5)
+
+        assert logs
+        assert logs[0]["action"] == "queued_action"
+        assert logs[0]["resource_id"] == "queued-app"
+
+    def test_log_admin_action_does_not_write_on_request_thread(self, flask_app):
+        """Audit records are written by the listener thread, not the caller."""
+        audit_log_path = os.path.join(flask_app.instance_path, "audit.log")
+        audit_logger.flush()
+        size_before = os.path.getsize(audit_log_path)
+
+        audit_logger.listener.stop()
+        try:
+            with flask_app.test_request_context("/admin"):
+                log_admin_action(
+                    action="deferred_action",
+                    resource_type="volume",
+                    resource_id="deferred-volume",
+                )
+            assert os.path.getsize(audit_log_path) == size_before
+        finally:
+            audit_logger.listener.start()
+
+        audit_logger.flush()
+        with open(audit_log_path) as f:
+            assert "deferred-volume" in f.read()
+
+    def test_concurrent_flushes_keep_listener_running(self, flask_app):
+        """Concurrent flushes neither lose records nor stop the listener."""
+        audit_log_path = os.path.join(flask_app.instance_path, "audit.log")
+        errors = []
+
+        def log_and_flush(worker):
+            try:
+                for i in range(20):
+                    with flask_app.test_request_context("/admin"):
+                        log_admin_action(
+                            action="flush_probe",
+                            resource_type="volume",
+                            resource_id=f"flush-{worker}-{i}",
+                        )
+                    audit_logger.flush()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=log_and_flush, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert audit_logger.listener.queue.empty()
+        with open(audit_log_path) as f:
+            content = f.read()
+        assert all(f"flush-{n}-{i}" in content for n in range(8) for i in range(20))
+
+        # The listener is still draining the queue after the stress run
+        with flask_app.test_request_context("/admin"):
+            log_admin_action(
+                action="flush_probe", resource_type="volume", resource_id="after"
+            )
+        audit_logger.flush()
+        with open(audit_log_path) as f:
+            assert '"resource_id":"after"' in f.read()
+
+    def test_queue_handler_blocks_by_default(self, flask_app):
+        """The app's audit queue handler waits for room unless configured not to."""
+        handler = flask_app.audit_logger.handlers[0]
+        assert isinstance(handler, AuditQueueHandler)
+        assert handler.block is True
+
+    def test_full_queue_drops_with_single_warning(self, caplog, capsys):
+        """Dropped records are counted and warned about once, not per record."""
+        handler = AuditQueueHandler(queue.Queue(maxsize=1), block=False)
+        with caplog.at_level(logging.WARNING, logger="services.audit"):
+            for i in range(4):
+                handler.handle(
+                    logging.LogRecord(
+                        "milkcrate.audit",
+                        logging.INFO,
+                        __file__,
+                        0,
+                        f"entry-{i}",
+                        None,
+                        None,
+                    )
+                )
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 3
+        assert [r.getMessage() for r in caplog.records] == [
+            "Audit log queue is full (10000 records); dropping audit records"
+        ]
+        assert capsys.readouterr().err == ""
+
+    def test_batching_handler_writes_on_flush(self, tmp_path):
+        """Formatted records are buffered and written together on flush."""
+        from services.audit import BatchingFileHandler
+
+        log_path = tmp_path / "audit.log"
+        handler = BatchingFileHandler(str(log_path))
+        try:
+            for i in range(3):
+                handler.handle(
+                    logging.LogRecord(
+                        "milkcrate.audit",
+                        logging.INFO,
+                        __file__,
+                        0,
+                        f"entry-{i}",
+                        None,
+                        None,
+                    )
+                )
+            assert log_path.read_text() == ""
+
+            handler.flush()
+            assert log_path.read_text().splitlines() == [
+                "entry-0",
+                "entry-1",
+                "entry-2",
+            ]
+        finally:
+            handler.close()
+
+    def test_tail_lines_reads_only_the_end(self, tmp_path, monkeypatch):
+        """The tail reader returns the last lines across chunk boundaries."""
+        from services.audit import _tail_lines
+
+        monkeypatch.setattr("services.audit.AUDIT_TAIL_CHUNK_SIZE", 7)
+        log_path = tmp_path / "audit.log"
+        log_path.write_text("".join(f"line-{i}\n" for i in range(50)))
+
+        assert _tail_lines(str(log_path), 3) == ["line-47", "line-48", "line-49"]
+        assert _tail_lines(str(log_path), 100)[0] == "line-0"
+        assert _tail_lines(str(log_path), 0) == []
+
+    def test_request_client_read_once_per_request(self, flask_app):
+        """Client address and user agent are memoized for the request."""
+        from services.audit import _request_client
+
+        with flask_app.test_request_context(
+            "/admin",
+            headers={"User-Agent": "probe/1.0"},
+            environ_base={"REMOTE_ADDR": "127.0.0.1"},
+        ):
+            assert _request_client() == ("127.0.0.1", "probe/1.0")
+            with patch("services.audit.request") as request:
+                assert _request_client() == ("127.0.0.1", "probe/1.0")
+            request.headers.get.assert_not_called()
+
+        with flask_app.app_context():
+            assert _request_client() == ("unknown", "unknown")
+
+    def test_non_ascii_entries_round_trip(self, flask_app):
+        """Entries are encoded compactly as UTF-8 and read back intact."""
+        assert _dumps({"a": 1, "b": "é"}) == '{"a":1,"b":"é"}'
+
+        with flask_app.test_request_context("/admin"):
+            log_admin_action(
+                action="rename", resource_type="volume", resource_id="données"
+            )
+            logs = get_audit_logs(limit=1)
+
+        assert logs[0]["resource_id"] == "données"
+
+    def test_orjson_encoder_matches_json_fallback(self):
+        """Both encoders produce identical output for the same entry."""
+        entry = {
+            "action": "upload",
+            "resource_id": "données",
+            "success": True,
+            "error_message": None,
+            "details": {1: "non-str key", "size": 2**70, "files": ["a", "b"]},
+        }
+
+        assert _dumps(entry) == _json_dumps(entry)
+        del entry["details"]["size"]
+        assert _dumps(entry) == _json_dumps(entry)
+
 
 class TestSecurityHeaders:
     """Test security headers middleware."""
@@ -0,0 +1,67 @@
+"""Tests for the Docker status manager."""
+
+from unittest.mock import MagicMock
+
+from services.status_manager import ContainerStatus, StatusManager
+
+
+def _summary(container_id: str, name: str, state: str, status: str) -> MagicMock:
+    container = MagicMock()
+    container.id = container_id
+    container.attrs = {
+        "Id": container_id,
+        "Names": [f"/{name}"],
+        "State": state,
+        "Status": status,
+    }
+    return container
+
+
+def _manager_with(containers: list) -> StatusManager:
+    manager = StatusManager.__new__(StatusManager)
+    manager.docker_client = MagicMock()
+    manager.docker_client.containers.list.return_value = containers
+    return manager
+
+
+def test_get_container_statuses_uses_single_list_call():
+    manager = _manager_with(
+        [
+            _summary("aaa", "app-one", "running", "Up 2 hours"),
+            _summary("bbb", "app-two", "exited", "Exited (0) 3 minutes ago"),
+            _summary("ccc", "app-three", "running", "Up 5 minutes (unhealthy)"),
+            _summary("ddd", "app-four", "running", "Up 4 seconds"),
+        ]
+    )
+
+    statuses = manager.get_container_statuses()
+
+    manager.docker_client.containers.list.assert_called_once_with(all=True, sparse=True)
+    manager.docker_client.containers.get.assert_not_called()
+    assert statuses is not None
+    assert statuses["aaa"][0] == ContainerStatus.RUNNING
+    assert statuses["app-one"][0] == ContainerStatus.RUNNING
+    assert statuses["bbb"][0] == ContainerStatus.EXITED
+    assert statuses["ccc"][0] == ContainerStatus.UNHEALTHY
+    assert statuses["ddd"][0] == ContainerStatus.STARTING
+
+
+def test_comprehensive_status_reads_from_batched_statuses():
+    manager = _manager_with([_summary("bbb", "app-two", "exited", "Exited (1)")])
+    statuses = manager.get_container_statuses()
+
+    result = manager.get_comprehensive_status(
+        "bbb", app_name="two", public_route="/two", container_statuses=statuses
+    )
+    missing = manager.get_comprehensive_status("zzz", container_statuses=statuses)
+
+    assert result["status"] == ContainerStatus.EXITED
+    assert missing["status"] == ContainerStatus.EXITED
+    assert missing["docker_details"] == {"error": "Container not found"}
+    manager.docker_client.containers.get.assert_not_called()
+
+
+def test_get_container_statuses_without_client():
+    manager = StatusManager.__new__(StatusManager)
+    manager.docker_client = None
+    assert manager.get_container_statuses() is None
@@ -95,3 +95,27 @@ def test_upload_rejects_duplicate_routes(logged_in_client, flask_app):
     )
     assert res.status_code == 200
     assert b"already in use" in res.data.lower()
+
+
+def test_upload_over_size_limit_is_rejected_before_saving(flask_app, logged_in_client):
+    flask_app.config["MAX_CONTENT_LENGTH"] = 1024 * 1024
+    data = {
+        "app_name": "demo",
+        "public_route": "/demo",
+        "file": (io.BytesIO(b"0" * (2 * 1024 * 1024)), "demo.zip"),
+    }
+
+    with patch("blueprints.upload.extract_zip_safely") as mock_extract:
+        res = logged_in_client.post(
+            "/upload",
+            data=data,
+            content_type="multipart/form-data",
+            headers={"Referer": "http://localhost/upload"},
+        )
+
+    assert res.status_code in (302, 303)
+    assert res.headers["Location"].endswith("/upload")
+    mock_extract.assert_not_called()
+
+    page = logged_in_client.get("/upload")
+    assert b"Upload too large" in page.data
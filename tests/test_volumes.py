@@ -0,0 +1,397 @@
+import io
+import os
+import tarfile
+import tempfile
+import zipfile
+from unittest.mock import MagicMock, patch
+
+from flask import request
+
+from database import (
+    get_volume_by_id,
+    get_volume_by_name,
+    get_volume_files,
+    insert_volume,
+    update_volume_stats,
+)
+from services.volume_manager import (
+    DOCKER_MAX_POOL_SIZE,
+    VolumeManager,
+    _parse_file_listing,
+    get_volume_manager,
+)
+
+
+def _create_volume(flask_app) -> int:
+    with flask_app.app_context():
+        insert_volume("data", "milkcrate-vol-data", "test volume")
+        return get_volume_by_name("data")["volume_id"]
+
+
+def test_upload_file_streams_to_volume_manager(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    manager = MagicMock()
+    manager.upload_file_to_volume.return_value = (True, "File notes.txt uploaded")
+
+    with patch("blueprints.volumes.get_volume_manager", return_value=manager):
+        res = logged_in_client.post(
+            f"/admin/volumes/{volume_id}/upload",
+            data={"file": (io.BytesIO(b"hello"), "notes.txt")},
+            content_type="multipart/form-data",
+        )
+
+    assert res.status_code in (302, 303)
+    args, kwargs = manager.upload_file_to_volume.call_args
+    assert args[0] == "milkcrate-vol-data"
+    assert not isinstance(args[1], str)
+    assert kwargs["file_name"] == "notes.txt"
+    assert os.listdir(flask_app.config["UPLOAD_FOLDER"]) == []
+
+    manager.list_volume_files.assert_not_called()
+    with flask_app.app_context():
+        volume = get_volume_by_id(volume_id)
+        assert volume["file_count"] == 1
+        assert volume["total_size_bytes"] == 5
+
+
+def test_tar_archive_from_stream():
+    manager = VolumeManager.__new__(VolumeManager)
+    tar_path = manager._create_tar_archive_from_stream(io.BytesIO(b"hello"), "a.txt")
+    try:
+        with tarfile.open(tar_path) as tar:
+            member = tar.getmember("a.txt")
+            assert member.size == 5
+            assert tar.extractfile(member).read() == b"hello"
+    finally:
+        os.remove(tar_path)
+
+
+def test_upload_file_rejected_when_all_slots_busy(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    manager = MagicMock()
+    busy = MagicMock()
+    busy.acquire.return_value = False
+
+    with (
+        patch("blueprints.volumes.get_volume_manager", return_value=manager),
+        patch("blueprints.volumes._upload_slots", busy),
+    ):
+        res = logged_in_client.post(
+            f"/admin/volumes/{volume_id}/upload",
+            data={"file": (io.BytesIO(b"hello"), "notes.txt")},
+            content_type="multipart/form-data",
+            follow_redirects=True,
+        )
+
+    assert b"Too many uploads in progress" in res.data
+    manager.upload_file_to_volume.assert_not_called()
+    busy.release.assert_not_called()
+
+
+def test_upload_raw_file_spools_body_before_taking_slot(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    manager = MagicMock()
+    unread_at_acquire = []
+
+    def acquire(timeout):
+        unread_at_acquire.append(request.stream.read())
+        return False
+
+    busy = MagicMock()
+    busy.acquire.side_effect = acquire
+
+    with (
+        patch("blueprints.volumes.get_volume_manager", return_value=manager),
+        patch("blueprints.volumes._upload_slots", busy),
+    ):
+        res = logged_in_client.put(
+            f"/admin/volumes/{volume_id}/raw?filename=data.bin",
+            data=b"x" * 2048,
+        )
+
+    assert res.status_code == 503
+    assert unread_at_acquire == [b""]
+    manager.upload_file_to_volume.assert_not_called()
+    busy.release.assert_not_called()
+
+
+def test_upload_raw_file_over_size_limit_returns_json(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    flask_app.config["MAX_CONTENT_LENGTH"] = 1024
+    manager = MagicMock()
+
+    with patch("blueprints.volumes.get_volume_manager", return_value=manager):
+        res = logged_in_client.put(
+            f"/admin/volumes/{volume_id}/raw?filename=data.bin",
+            data=b"x" * 2048,
+            headers={"Accept": "*/*"},
+        )
+
+    assert res.status_code == 413
+    assert "Upload too large" in res.get_json()["error"]
+    manager.upload_file_to_volume.assert_not_called()
+
+
+def test_upload_zip_repacks_members_into_one_tar():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("docs/", "")
+        zf.writestr("docs/readme.txt", "read me")
+        zf.writestr("data.csv", "a,b\n")
+    buffer.seek(0)
+
+    manager = VolumeManager.__new__(VolumeManager)
+    manager.client = MagicMock()
+    container = manager.client.containers.create.return_value
+    archived = {}
+
+    def _capture(path, data):
+        with tarfile.open(fileobj=io.BytesIO(data.read())) as tar:
+            archived.update(
+                {m.name: m.isdir() or tar.extractfile(m).read() for m in tar}
+            )
+
+    container.put_archive.side_effect = _capture
+
+    success, _, files = manager.upload_zip_to_volume("vol", buffer)
+
+    assert success is True
+    assert files == [
+        {"path": "/docs/readme.txt", "name": "readme.txt", "size": 7},
+        {"path": "/data.csv", "name": "data.csv", "size": 4},
+    ]
+    assert archived == {
+        "docs": True,
+        "docs/readme.txt": b"read me",
+        "data.csv": b"a,b\n",
+    }
+    container.remove.assert_called_once_with(force=True)
+
+
+def test_create_volume_rejects_invalid_names(logged_in_client):
+    for name in ["bad name", "café", "x" * 256]:
+        res = logged_in_client.post(
+            "/admin/volumes/create",
+            data={"volume_name": name},
+            follow_redirects=True,
+        )
+        assert b"Volume name can only contain" in res.data
+
+
+def test_api_list_volumes(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+
+    res = logged_in_client.get("/admin/volumes/api/list")
+
+    assert res.status_code == 200
+    (volume,) = res.get_json()["volumes"]
+    assert volume["volume_id"] == volume_id
+    assert volume["docker_volume_name"] == "milkcrate-vol-data"
+    assert set(volume) == {
+        "volume_id",
+        "volume_name",
+        "docker_volume_name",
+        "description",
+        "file_count",
+        "total_size_bytes",
+        "created_date",
+    }
+
+
+def test_parse_file_listing_handles_pipes_and_noise():
+    logs = "/volume/a.txt|5\n/volume/dir/b|c.txt|12\n\nnot a listing line\n"
+
+    assert list(_parse_file_listing(logs)) == [
+        {"path": "/a.txt", "name": "a.txt", "size": 5},
+        {"path": "/dir/b|c.txt", "name": "b|c.txt", "size": 12},
+    ]
+
+
+def test_view_volume_only_writes_changed_stats(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    manager = MagicMock()
+    manager.list_volume_files.return_value = (
+        True,
+        "Found 1 files",
+        [{"path": "/a.txt", "name": "a.txt", "size": 5}],
+    )
+
+    with (
+        patch("blueprints.volumes.get_volume_manager", return_value=manager),
+        patch(
+            "blueprints.volumes.update_volume_stats",
+            wraps=update_volume_stats,
+        ) as mock_update,
+    ):
+        first = logged_in_client.get(f"/admin/volumes/{volume_id}")
+        second = logged_in_client.get(f"/admin/volumes/{volume_id}")
+
+    mock_update.assert_called_once_with(volume_id, 1, 5)
+    for res in (first, second):
+        assert res.status_code == 200
+        assert b"milkcrate-vol-data" in res.data
+        assert b"1 files" in res.data
+
+
+def test_view_volume_keeps_stats_when_listing_fails(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    with flask_app.app_context():
+        update_volume_stats(volume_id, 3, 30)
+    manager = MagicMock()
+    manager.list_volume_files.return_value = (False, "Docker unavailable", [])
+
+    with patch("blueprints.volumes.get_volume_manager", return_value=manager):
+        res = logged_in_client.get(f"/admin/volumes/{volume_id}")
+
+    assert b"Could not list files" in res.data
+    with flask_app.app_context():
+        assert get_volume_by_id(volume_id)["file_count"] == 3
+
+
+def test_upload_zip_records_files_without_relisting(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    manager = MagicMock()
+    manager.upload_zip_to_volume.return_value = (
+        True,
+        "ZIP extracted successfully (2 files)",
+        [
+            {"path": "/a.txt", "name": "a.txt", "size": 3},
+            {"path": "/dir/b.txt", "name": "b.txt", "size": 4},
+        ],
+    )
+
+    with patch("blueprints.volumes.get_volume_manager", return_value=manager):
+        logged_in_client.post(
+            f"/admin/volumes/{volume_id}/upload",
+            data={"file": (io.BytesIO(b"PK"), "bundle.zip")},
+            content_type="multipart/form-data",
+        )
+
+    manager.list_volume_files.assert_not_called()
+    with flask_app.app_context():
+        volume = get_volume_by_id(volume_id)
+        assert (volume["file_count"], volume["total_size_bytes"]) == (2, 7)
+        paths = [row["file_path"] for row in get_volume_files(volume_id)]
+        assert sorted(paths) == ["/a.txt", "/dir/b.txt"]
+
+
+def _manager_with_local_mountpoint(mountpoint) -> VolumeManager:
+    manager = VolumeManager.__new__(VolumeManager)
+    manager.client = MagicMock()
+    manager.client.volumes.get.return_value.attrs = {"Mountpoint": str(mountpoint)}
+    return manager
+
+
+def test_upload_file_copies_into_local_mountpoint(tmp_path):
+    manager = _manager_with_local_mountpoint(tmp_path)
+
+    with tempfile.TemporaryFile() as spooled:
+        spooled.write(b"on disk")
+        success, _ = manager.upload_file_to_volume("vol", spooled, file_name="disk.txt")
+    assert success is True
+    success, _ = manager.upload_file_to_volume(
+        "vol", io.BytesIO(b"in memory"), file_name="memory.txt"
+    )
+    assert success is True
+
+    assert (tmp_path / "disk.txt").read_bytes() == b"on disk"
+    assert (tmp_path / "memory.txt").read_bytes() == b"in memory"
+    manager.client.containers.create.assert_not_called()
+
+
+def test_upload_file_falls_back_without_local_mountpoint(tmp_path):
+    manager = _manager_with_local_mountpoint(tmp_path / "missing")
+
+    success, _ = manager.upload_file_to_volume(
+        "vol", io.BytesIO(b"hello"), file_name="a.txt"
+    )
+
+    assert success is True
+    manager.client.containers.create.return_value.put_archive.assert_called_once()
+
+
+def test_upload_file_does_not_follow_planted_symlink(tmp_path):
+    volume_dir = tmp_path / "volume"
+    volume_dir.mkdir()
+    outside = tmp_path / "outside.txt"
+    outside.write_bytes(b"host file")
+    (volume_dir / "a.txt").symlink_to(outside)
+    manager = _manager_with_local_mountpoint(volume_dir)
+
+    success, _ = manager.upload_file_to_volume(
+        "vol", io.BytesIO(b"payload"), file_name="a.txt"
+    )
+
+    assert success is True
+    assert outside.read_bytes() == b"host file"
+    manager.client.containers.create.return_value.put_archive.assert_called_once()
+
+
+def test_upload_raw_file_streams_request_body(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+    manager = MagicMock()
+    manager.upload_file_to_volume.return_value = (True, "File data.bin uploaded")
+
+    with patch("blueprints.volumes.get_volume_manager", return_value=manager):
+        res = logged_in_client.put(
+            f"/admin/volumes/{volume_id}/raw?filename=../data.bin",
+            data=b"x" * 2048,
+        )
+
+    assert res.status_code == 201
+    assert res.get_json()["size"] == 2048
+    args, kwargs = manager.upload_file_to_volume.call_args
+    assert args[0] == "milkcrate-vol-data"
+    assert kwargs["file_name"] == "data.bin"
+
+    with flask_app.app_context():
+        volume = get_volume_by_id(volume_id)
+        assert (volume["file_count"], volume["total_size_bytes"]) == (1, 2048)
+        assert [f["file_name"] for f in get_volume_files(volume_id)] == ["data.bin"]
+
+
+def test_upload_raw_file_requires_filename(flask_app, logged_in_client):
+    volume_id = _create_volume(flask_app)
+
+    res = logged_in_client.put(f"/admin/volumes/{volume_id}/raw", data=b"x")
+
+    assert res.status_code == 400
+
+
+def test_upload_zip_adds_extracted_bytes_to_existing_totals(
+    flask_app, logged_in_client
+):
+    volume_id = _create_volume(flask_app)
+    with flask_app.app_context():
+        update_volume_stats(volume_id, 5, 1000)
+    manager = MagicMock()
+    manager.upload_zip_to_volume.return_value = (
+        True,
+        "ZIP extracted successfully (1 files)",
+        [{"path": "/c.txt", "name": "c.txt", "size": 24}],
+    )
+
+    with patch("blueprints.volumes.get_volume_manager", return_value=manager):
+        logged_in_client.post(
+            f"/admin/volumes/{volume_id}/upload",
+            data={"file": (io.BytesIO(b"PK"), "more.zip")},
+            content_type="multipart/form-data",
+        )
+
+    manager.list_volume_files.assert_not_called()
+    with flask_app.app_context():
+        volume = get_volume_by_id(volume_id)
+        assert (volume["file_count"], volume["total_size_bytes"]) == (6, 1024)
+
+
+def test_volume_manager_shares_one_pooled_client():
+    get_volume_manager.cache_clear()
+    try:
+        with patch("services.volume_manager.docker.from_env") as from_env:
+            first = get_volume_manager()
+            second = get_volume_manager()
+
+        assert first is second
+        from_env.assert_called_once_with(max_pool_size=DOCKER_MAX_POOL_SIZE)
+    finally:
+        get_volume_manager.cache_clear()